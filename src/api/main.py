@@ -1,8 +1,33 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.status import status
 
 app = FastAPI(title=settings.app_name)
 
 @app.get("/health")
 def health_check():
     return {"status": "ok", "env": settings.app_env}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    """Métricas del proceso en formato de texto de Prometheus."""
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+@app.get("/live")
+def live():
+    """Liveness: 503 si el pipeline está colgado (sin frames, workers bloqueados o threads muertos)."""
+    ok, failures = status.liveness()
+    return JSONResponse({"status": "ok" if ok else "fail", "failures": failures}, status_code=200 if ok else 503)
+
+@app.get("/ready")
+def ready():
+    """Readiness: 503 hasta que los modelos estén cargados y mientras falle algún check."""
+    ok, failures = status.readiness()
+    return JSONResponse({"status": "ok" if ok else "fail", "failures": failures}, status_code=200 if ok else 503)
+
+@app.get("/status")
+def pipeline_status():
+    """Estado del pipeline: frames por cámara, colas, threads, modelos y lag de Kafka."""
+    return status.snapshot()
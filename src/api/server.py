@@ -0,0 +1,31 @@
+# src/api/server.py
+import logging
+import threading
+from typing import Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+def start_api_server(port: Optional[int] = None, host: str = "0.0.0.0") -> Optional[threading.Thread]:
+    """
+    Sirve la app FastAPI (health, /metrics, /live, /ready, /status) dentro del proceso actual en un
+    thread daemon. El worker lo usa para exponer sus propias métricas: el
+    registro es por proceso, así que /metrics debe servirse desde el worker.
+    """
+    try:
+        import uvicorn
+        from src.api.main import app
+    except Exception:
+        logger.exception("No se pudo iniciar la API embebida (uvicorn no disponible)")
+        return None
+
+    config = uvicorn.Config(app, host=host, port=port or settings.worker_api_port, log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    # las señales las gestiona el hilo principal del worker
+    server.install_signal_handlers = lambda: None
+
+    thread = threading.Thread(target=server.run, name="api-server", daemon=True)
+    thread.start()
+    logger.info("API embebida escuchando en %s:%d (/health, /metrics, /live, /ready, /status)", host, config.port)
+    return thread
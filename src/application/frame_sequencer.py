@@ -0,0 +1,81 @@
+# src/application/frame_sequencer.py
+import time
+import heapq
+import logging
+import threading
+from typing import List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class FrameSequencer:
+    """
+    Buffer de reordenamiento por cámara para la parte con estado del pipeline.
+
+    Varios workers procesan frames de la misma cámara en paralelo (detección,
+    OCR), pero el tracker debe verlos en orden de captura. Cada frame se
+    registra con su Frame.sequence al encolarse; antes de tocar el tracker el
+    worker espera su turno (wait_turn) hasta que todos los frames anteriores
+    pendientes se hayan completado, y al terminar libera el turno (complete).
+
+    - frames descartados (last-wins, error del detector) se completan sin turno
+    - complete() es idempotente (y no-op para secuencias no registradas)
+    - si un turno no llega en `timeout` segundos se salta el frame que lo
+      bloquea (se registra un warning) para no detener la cámara
+    """
+
+    def __init__(self, timeout: float = 2.0):
+        self.timeout = timeout
+        self._cond = threading.Condition(threading.Lock())
+        self._pending: List[int] = []   # heap de secuencias registradas sin completar
+        self._done: Set[int] = set()    # completadas fuera de orden (aún no en la cabeza)
+        self._closed = False
+
+    def register(self, sequence: int) -> None:
+        with self._cond:
+            heapq.heappush(self._pending, sequence)
+
+    def wait_turn(self, sequence: int, timeout: Optional[float] = None) -> bool:
+        """Bloquea hasta que `sequence` sea la más antigua pendiente. False si se cerró o no estaba registrada."""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while not self._closed and self._pending and self._pending[0] != sequence:
+                if sequence < self._pending[0] or sequence in self._done:
+                    return False
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    skipped = self._pending[0]
+                    logger.warning("Reorder: frame %s no se completó en %.1fs; se salta para procesar %s", skipped, timeout, sequence)
+                    self._done.add(skipped)
+                    self._advance()
+                    deadline = time.monotonic() + timeout
+                    continue
+                self._cond.wait(remaining)
+            return not self._closed and bool(self._pending) and self._pending[0] == sequence
+
+    def complete(self, sequence: int) -> None:
+        with self._cond:
+            if sequence in self._done or sequence not in self._pending:
+                return
+            self._done.add(sequence)
+            if self._advance():
+                self._cond.notify_all()
+
+    def _advance(self) -> bool:
+        moved = False
+        while self._pending and self._pending[0] in self._done:
+            self._done.discard(heapq.heappop(self._pending))
+            moved = True
+        return moved
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def close(self) -> None:
+        """Despierta a los workers que esperan turno (stop del servicio)."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
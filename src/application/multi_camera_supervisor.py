@@ -0,0 +1,177 @@
+# src/application/multi_camera_supervisor.py
+import os
+import time
+import queue
+import logging
+import threading
+from typing import Any, List, Optional, Tuple
+
+from src.domain.Interfaces.plate_detector import IPlateDetector
+from src.application.plate_recognition_service import PlateRecognitionService
+from src.core.config import settings
+from src.core.status import status
+
+logger = logging.getLogger(__name__)
+
+
+class MultiCameraSupervisor:
+    """
+    Ejecuta N cámaras en un solo proceso con un pool de inferencia compartido.
+
+    - cada cámara es un PlateRecognitionService con su propio stream,
+      tracker, planificador OCR y deduplicador (estado aislado por cámara)
+    - todos comparten el mismo detector y lector OCR (un solo modelo en RAM)
+    - los workers del pool toman frames de las capture_queue en round-robin
+      (un frame por cámara por vuelta) hasta completar el batch del detector,
+      así ninguna cámara con mucho tráfico acapara la inferencia
+    """
+
+    def __init__(
+        self,
+        services: List[PlateRecognitionService],
+        detector: IPlateDetector,
+        workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ):
+        if not services:
+            raise ValueError("MultiCameraSupervisor requiere al menos un servicio de cámara")
+        self.services = services
+        self.detector = detector
+        self.workers = max(1, workers if workers is not None else getattr(settings, "processing_workers", max(1, (os.cpu_count() or 2) - 1)))
+        # por defecto un frame por cámara en cada forward pass
+        self.batch_size = max(1, batch_size if batch_size is not None else max(getattr(settings, "detector_batch_size", 1), len(services)))
+
+        self.running = False
+        self._threads: List[threading.Thread] = []
+        self._cursor = 0
+        self._rr_lock = threading.Lock()
+        self._frames_ready = threading.Condition()
+
+    # ----- START / STOP -----
+    def start(self) -> None:
+        """Arranca todas las cámaras y el pool compartido; bloquea hasta stop()/Ctrl+C."""
+        self.running = True
+        for service in self.services:
+            service.on_frame = self._notify_frame
+            try:
+                service.start_background(spawn_workers=False)
+            except Exception:
+                logger.exception("No se pudo iniciar la cámara camera_id=%s", service.camera_id)
+
+        for i in range(self.workers):
+            t = threading.Thread(target=self._worker_loop, name=f"shared-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+        status.register("supervisor", self.status, live=self.live_check)
+        logger.info("Supervisor multi-cámara iniciado: cameras=%s workers=%d batch=%d",
+                    [s.camera_id for s in self.services], self.workers, self.batch_size)
+
+        try:
+            while self.running:
+                time.sleep(0.5)
+        except KeyboardInterrupt:
+            logger.info("Interrupción recibida - deteniendo supervisor")
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        if not self.running and not self._threads:
+            return
+        logger.info("Parando supervisor multi-cámara...")
+        self.running = False
+        status.unregister("supervisor")
+        with self._frames_ready:
+            self._frames_ready.notify_all()
+        for t in self._threads:
+            t.join(timeout=1.0)
+        self._threads = []
+        for service in self.services:
+            try:
+                service.stop()
+            except Exception:
+                logger.exception("Error al detener camera_id=%s", service.camera_id)
+        logger.info("Supervisor multi-cámara detenido")
+
+    # ----- Estado (/status, /live) -----
+    def status(self) -> dict:
+        return {
+            "running": self.running,
+            "cameras": [s.camera_id for s in self.services],
+            "batch_size": self.batch_size,
+            "workers": {t.name: t.is_alive() for t in self._threads},
+        }
+
+    def live_check(self) -> Optional[str]:
+        dead = [t.name for t in self._threads if not t.is_alive()]
+        if self.running and dead:
+            return f"workers compartidos detenidos: {', '.join(dead)}"
+        return None
+
+    # ----- Pool compartido -----
+    def _notify_frame(self) -> None:
+        with self._frames_ready:
+            self._frames_ready.notify()
+
+    def _has_frames(self) -> bool:
+        return any(not s.capture_queue.empty() for s in self.services)
+
+    def _worker_loop(self) -> None:
+        while self.running:
+            with self._frames_ready:
+                if not self._has_frames():
+                    self._frames_ready.wait(timeout=1.0)
+            items = self._next_batch()
+            if not items:
+                continue
+            try:
+                self._process_items(items)
+            finally:
+                for service, frame in items:
+                    service.finish_frame(frame)
+                    service.capture_queue.task_done()
+
+    def _next_batch(self) -> List[Tuple[PlateRecognitionService, Any]]:
+        """
+        Round-robin justo: recorre las cámaras desde el cursor tomando un frame
+        de cada una por vuelta hasta llenar el batch o quedarse sin frames.
+        """
+        items: List[Tuple[PlateRecognitionService, Any]] = []
+        n = len(self.services)
+        with self._rr_lock:
+            while len(items) < self.batch_size:
+                got_any = False
+                for _ in range(n):
+                    service = self.services[self._cursor]
+                    self._cursor = (self._cursor + 1) % n
+                    try:
+                        frame = service.capture_queue.get_nowait()
+                    except queue.Empty:
+                        continue
+                    if frame is None:
+                        service.capture_queue.task_done()
+                        continue
+                    items.append((service, frame))
+                    got_any = True
+                    if len(items) >= self.batch_size:
+                        break
+                if not got_any:
+                    break
+        return items
+
+    def _process_items(self, items: List[Tuple[PlateRecognitionService, Any]]) -> None:
+        """Un forward pass del detector para frames de varias cámaras; el resto del pipeline por cámara."""
+        frames = [frame for _, frame in items]
+        try:
+            t1 = time.perf_counter()
+            batch_bboxes = self.detector.detect_batch(frames)
+            t_detect = (time.perf_counter() - t1) / len(frames)
+        except Exception:
+            logger.exception("Detector falló al procesar batch multi-cámara de %d frames; saltando", len(frames))
+            return
+
+        for (service, frame), plates_bboxes in zip(items, batch_bboxes):
+            try:
+                service.process_frame(frame, plates_bboxes or [], t_detect)
+            except Exception:
+                logger.exception("Error procesando frame de camera_id=%s; saltando frame", service.camera_id)
@@ -9,8 +9,7 @@ import logging
 import threading
 import queue
 import os
-from types import SimpleNamespace
-from typing import Any, Iterable
+from typing import Any, Callable, Iterable, List, Optional
 
 from src.domain.Models.detection_result import DetectionResult
 from src.domain.Interfaces.camera_stream import ICameraStream
@@ -20,10 +19,27 @@ from src.domain.Interfaces.event_publisher import IEventPublisher
 from src.domain.Interfaces.tracker import ITracker
 from src.domain.Interfaces.deduplicator import IDeduplicator
 from src.domain.Interfaces.text_normalizer import ITextNormalizer
+from src.domain.Interfaces.ocr_scheduler import IOCRScheduler
+from src.domain.Interfaces.event_spool import IEventSpool
+from src.domain.Interfaces.sampling_controller import ISamplingController
+from src.domain.Services.ocr_scheduler_service import OCRSchedulerService
+from src.domain.Services.adaptive_sampling_service import AdaptiveSamplingService
+from src.application.frame_sequencer import FrameSequencer
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.status import status
 
 logger = logging.getLogger(__name__)
 
+STAGE_LATENCY = registry.histogram("anpr_stage_latency_seconds", "Latencia por etapa del pipeline (detect, track, ocr, norm, dedup, total)", ("camera", "stage"))
+CAPTURE_TO_PUBLISH = registry.histogram("anpr_capture_to_publish_seconds", "Edad del evento desde la captura del frame hasta la confirmación de publicación", ("camera",))
+FRAMES_PROCESSED = registry.counter("anpr_frames_processed_total", "Frames que completaron el pipeline", ("camera",))
+FRAMES_DROPPED = registry.counter("anpr_frames_dropped_total", "Frames descartados (last-wins de capture_queue o sin turno de tracking)", ("camera",))
+OCR_READS = registry.counter("anpr_ocr_reads_total", "Placas enviadas al OCR", ("camera",))
+EVENTS = registry.counter("anpr_events_total", "Eventos por resultado (published, failed, spooled, dropped)", ("camera", "result"))
+QUEUE_DEPTH = registry.gauge("anpr_queue_depth", "Elementos en las colas internas del servicio", ("camera", "queue"))
+SAMPLING_FPS = registry.gauge("anpr_sampling_fps", "Frames/seg de captura elegidos por el muestreo adaptativo", ("camera",))
+
 
 class PlateRecognitionService:
     def __init__(
@@ -37,6 +53,9 @@ class PlateRecognitionService:
         normalizer: ITextNormalizer,
         debug_show: bool = True,
         loop_delay: float = 0.0,
+        ocr_scheduler: Optional[IOCRScheduler] = None,
+        spool: Optional[IEventSpool] = None,
+        sampler: Optional[ISamplingController] = None,
     ):
         self.camera_stream = camera_stream
         self.detector = detector
@@ -45,12 +64,20 @@ class PlateRecognitionService:
         self.tracker = tracker
         self.deduplicator = deduplicator
         self.normalizer = normalizer
+        # OCR por track: por defecto el planificador de dominio configurado desde settings
+        self.ocr_scheduler = ocr_scheduler or OCRSchedulerService()
+        # spool durable: recibe los eventos cuando la publicación está saturada o fallando
+        self.spool = spool
 
         self.debug_show = debug_show
         self.loop_delay = loop_delay
 
         self.running = False
         self.frame_idx = 0
+        self._frame_idx_lock = threading.Lock()
+        # orden de captura para el tracker: los workers esperan turno por Frame.sequence
+        self.sequencer = FrameSequencer(timeout=getattr(settings, "tracking_reorder_timeout", 2.0))
+        self._last_sequence = 0
         self.camera_id = getattr(self.camera_stream, "camera_id", None) or "default"
         self.target_dt = getattr(settings, "target_frame_seconds", 0.0)
 
@@ -59,46 +86,103 @@ class PlateRecognitionService:
         self.processing_workers = max(1, getattr(settings, "processing_workers", max(1, (os.cpu_count() or 2) - 1)))
         self.publish_queue_size = getattr(settings, "publish_queue_size", 50)
         self.capture_queue: "queue.Queue" = queue.Queue(maxsize=self.capture_queue_size)
+        # True = "last-wins" (cámaras en vivo); False = bloquear la captura hasta que haya hueco (benchmarks/archivos)
+        self.drop_frames = getattr(settings, "capture_drop_frames", True)
         self.publish_queue: "queue.Queue" = queue.Queue(maxsize=self.publish_queue_size)
 
+        # Micro-batching del detector: hasta N frames o T ms por forward pass
+        self.batch_size = max(1, getattr(settings, "detector_batch_size", 1))
+        self.batch_timeout = max(0.0, getattr(settings, "detector_batch_timeout_ms", 0.0)) / 1000.0
+
+        # muestreo adaptativo: si está activo, decide el intervalo de captura en lugar de target_dt/loop_delay
+        if sampler is None and getattr(settings, "adaptive_sampling_enabled", False):
+            sampler = AdaptiveSamplingService(workers=self.processing_workers)
+        self.sampler = sampler
+
         self.workers = []
         self.publisher_thread = None
         self.capture_thread = None
+        # estado para /live, /ready y /status (escrituras simples en el camino caliente)
+        self.stall_seconds = getattr(settings, "status_stall_seconds", 15.0)
+        self._started_at = 0.0
+        self._last_frame_at = 0.0
+        self._last_processed_at = 0.0
+        # hook opcional: se invoca tras encolar un frame (p.ej. para despertar un pool compartido)
+        self.on_frame: Optional[Callable[[], None]] = None
+
+        # métricas con labels resueltos una sola vez (camino caliente sin dicts)
+        cam = self.camera_id
+        self._m_stage = {stage: STAGE_LATENCY.labels(camera=cam, stage=stage)
+                         for stage in ("detect", "track", "ocr", "norm", "dedup", "total")}
+        self._m_age = CAPTURE_TO_PUBLISH.labels(camera=cam)
+        self._m_frames = FRAMES_PROCESSED.labels(camera=cam)
+        self._m_dropped = FRAMES_DROPPED.labels(camera=cam)
+        self._m_ocr_reads = OCR_READS.labels(camera=cam)
+        self._m_events = {result: EVENTS.labels(camera=cam, result=result)
+                          for result in ("published", "failed", "spooled", "dropped")}
+        QUEUE_DEPTH.labels(camera=cam, queue="capture").set_function(self.capture_queue.qsize)
+        QUEUE_DEPTH.labels(camera=cam, queue="publish").set_function(self.publish_queue.qsize)
+        if self.sampler is not None:
+            SAMPLING_FPS.labels(camera=cam).set_function(lambda: self.sampler.fps if self.sampler is not None else 0.0)
 
     # ----- START / STOP: spawn threads -----
     def start(self):
+        self._start_threads(spawn_workers=True)
+
+        # capture loop runs in main thread (or spawn thread if you prefer)
+        try:
+            self._capture_loop()
+        except KeyboardInterrupt:
+            logger.info("Interrupción recibida - deteniendo")
+            self.stop()
+        except Exception:
+            logger.exception("Error en capture loop")
+            self.stop()
+
+    def start_background(self, spawn_workers: bool = True) -> None:
+        """
+        Arranca captura y publicación en threads propios sin bloquear.
+        Con spawn_workers=False los frames quedan en capture_queue para que
+        un pool externo (p.ej. MultiCameraSupervisor) los procese.
+        """
+        self._start_threads(spawn_workers=spawn_workers)
+        self.capture_thread = threading.Thread(target=self._capture_thread_main, name=f"capture-{self.camera_id}", daemon=True)
+        self.capture_thread.start()
+
+    def _start_threads(self, spawn_workers: bool) -> None:
         self.camera_stream.connect()
         self.running = True
-        logger.info("Servicio de reconocimiento iniciado (camera_id=%s) workers=%d queue=%d", self.camera_id, self.processing_workers, self.capture_queue_size)
+        self._started_at = time.time()
+        status.register(f"camera:{self.camera_id}", self.status, live=self.live_check)
+        logger.info("Servicio de reconocimiento iniciado (camera_id=%s) workers=%d queue=%d batch=%d", self.camera_id, self.processing_workers if spawn_workers else 0, self.capture_queue_size, self.batch_size)
 
         # start publisher thread
-        self.publisher_thread = threading.Thread(target=self._publisher_loop, name="publisher-thread", daemon=True)
+        self.publisher_thread = threading.Thread(target=self._publisher_loop, name=f"publisher-{self.camera_id}", daemon=True)
         self.publisher_thread.start()
 
         # start processing workers
-        for i in range(self.processing_workers):
-            t = threading.Thread(target=self._processing_worker, name=f"proc-worker-{i}", daemon=True)
-            t.start()
-            self.workers.append(t)
+        if spawn_workers:
+            for i in range(self.processing_workers):
+                t = threading.Thread(target=self._processing_worker, name=f"proc-worker-{i}", daemon=True)
+                t.start()
+                self.workers.append(t)
 
-        # capture loop runs in main thread (or spawn thread if you prefer)
+    def _capture_thread_main(self) -> None:
         try:
             self._capture_loop()
-        except KeyboardInterrupt:
-            logger.info("Interrupción recibida - deteniendo")
-            self.stop()
         except Exception:
-            logger.exception("Error en capture loop")
-            self.stop()
+            logger.exception("Error en capture loop (camera_id=%s)", self.camera_id)
 
     def stop(self):
         logger.info("Parando servicio, esperando threads...")
         self.running = False
+        status.unregister(f"camera:{self.camera_id}")
+        self.sequencer.close()
 
         # unblock queues
         try:
             while not self.capture_queue.empty():
-                self.capture_queue.get_nowait()
+                self.release_frame(self.capture_queue.get_nowait())
         except Exception:
             pass
 
@@ -113,6 +197,8 @@ class PlateRecognitionService:
             t.join(timeout=1.0)
         if self.publisher_thread:
             self.publisher_thread.join(timeout=1.0)
+        if self.capture_thread and self.capture_thread is not threading.current_thread():
+            self.capture_thread.join(timeout=1.0)
 
         try:
             self.camera_stream.disconnect()
@@ -129,10 +215,18 @@ class PlateRecognitionService:
     def _capture_loop(self):
         while self.running:
             loop_start = time.perf_counter()
-            frame = self.camera_stream.read_frame()
+            # bloquea hasta el siguiente frame decodificado (sin polling ni frames repetidos)
+            frame = self.camera_stream.wait_next_frame(timeout=1.0)
             if frame is None:
-                logger.debug("No se pudo leer frame, reintentando...")
-                time.sleep(0.2)
+                logger.debug("Sin frame nuevo en 1s, esperando...")
+                continue
+            self._last_frame_at = time.time()
+            self._register_sequence(frame)
+
+            if not self.drop_frames:
+                self._put_blocking(frame)
+                if self.on_frame is not None:
+                    self.on_frame()
                 self._pace(loop_start)
                 continue
 
@@ -142,130 +236,238 @@ class PlateRecognitionService:
             except queue.Full:
                 # si la cola está llena, descarta el frame más antiguo y mete este (modo "last-wins")
                 try:
-                    _ = self.capture_queue.get_nowait()
+                    dropped = self.capture_queue.get_nowait()
+                    self.capture_queue.task_done()
+                    self.finish_frame(dropped)
+                    self._m_dropped.inc()
                     self.capture_queue.put_nowait(frame)
                     logger.debug("Capture queue llena: descartado frame viejo, encolado nuevo")
                 except Exception:
+                    self.finish_frame(frame)
+                    self._m_dropped.inc()
                     logger.debug("No se pudo encolar frame (queue full)")
+            if self.on_frame is not None:
+                self.on_frame()
             self._pace(loop_start)
 
+    def _put_blocking(self, frame: Any) -> None:
+        """Encola sin descartar: espera hueco en capture_queue mientras el servicio siga activo."""
+        while self.running:
+            try:
+                self.capture_queue.put(frame, block=True, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+        self.finish_frame(frame)
+
+    def _register_sequence(self, frame: Any) -> None:
+        """Registra el frame en el buffer de reordenamiento (numera si el stream no lo hizo)."""
+        seq = getattr(frame, "sequence", 0) or 0
+        if seq <= self._last_sequence:
+            # stream sin numeración o reiniciado (reconexión de un archivo)
+            seq = self._last_sequence + 1
+            try:
+                frame.sequence = seq
+            except AttributeError:
+                return
+        self._last_sequence = seq
+        self.sequencer.register(seq)
+
     # ----- Processing worker: hace todo el pipeline por frame -----
     def _processing_worker(self):
         while self.running:
+            frames = self._collect_batch()
+            if not frames:
+                continue
+            try:
+                self._process_batch(frames)
+            finally:
+                for frame in frames:
+                    self.finish_frame(frame)
+                    self.capture_queue.task_done()
+
+    @staticmethod
+    def release_frame(frame: Any) -> None:
+        """Devuelve al ring el slot del frame (si lo tiene) una vez procesado o descartado."""
+        release = getattr(frame, "release", None)
+        if callable(release):
+            release()
+
+    def finish_frame(self, frame: Any) -> None:
+        """Frame procesado o descartado: libera su turno en el reorder buffer y su slot del ring."""
+        seq = getattr(frame, "sequence", 0)
+        if seq:
+            self.sequencer.complete(seq)
+        self.release_frame(frame)
+
+    def _collect_batch(self) -> List[Any]:
+        """
+        Micro-batching: espera el primer frame y luego junta hasta
+        `detector_batch_size` frames o hasta que venza `detector_batch_timeout_ms`.
+        Cada frame devuelto debe marcarse con task_done().
+        """
+        try:
+            first = self.capture_queue.get(timeout=1.0)
+        except queue.Empty:
+            return []
+        frames = [first]
+
+        deadline = time.perf_counter() + self.batch_timeout
+        while len(frames) < self.batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
             try:
-                frame = self.capture_queue.get(timeout=1.0)
+                frames.append(self.capture_queue.get(timeout=remaining))
             except queue.Empty:
-                continue
-            if frame is None:
-                continue
+                break
+
+        valid = [f for f in frames if f is not None]
+        # los None no se procesan, pero sí cuentan para task_done
+        for _ in range(len(frames) - len(valid)):
+            self.capture_queue.task_done()
+        return valid
+
+    def _process_batch(self, frames: List[Any]) -> None:
+        """Ejecuta un único forward pass del detector para todo el batch."""
+        # 1) Detectar bboxes
+        try:
+            t1 = time.perf_counter()
+            batch_bboxes = self.detector.detect_batch(frames)
+            t_detect = (time.perf_counter() - t1) / len(frames)
+        except Exception:
+            logger.exception("Detector falló al procesar batch de %d frames; saltando", len(frames))
+            return
 
-            t0 = time.perf_counter()
-            # 1) Detectar bboxes
+        for frame, plates_bboxes in zip(frames, batch_bboxes):
             try:
-                t1 = time.perf_counter()
-                plates_bboxes = self.detector.detect(frame) or []
-                t_detect = time.perf_counter() - t1
+                self.process_frame(frame, plates_bboxes or [], t_detect)
             except Exception:
-                logger.exception("Detector falló al procesar frame; saltando frame")
-                self.capture_queue.task_done()
-                continue
-
-            # 2) OCR (según intervalo)
-            raw_ocr_results = []
-            run_ocr = (self.frame_idx % max(1, getattr(settings, "ocr_interval", 1))) == 0
-            if run_ocr and plates_bboxes:
-                t2 = time.perf_counter()
-                for bbox in plates_bboxes:
-                    try:
-                        raw = self.ocr_reader.read_text(frame, bbox)
-                        raw_ocr_results.append(raw)
-                    except Exception:
-                        logger.exception("OCR falló para bbox=%s", getattr(bbox, "bounding_box", getattr(bbox, "bbox", bbox)))
-                t_ocr = time.perf_counter() - t2
-            else:
-                t_ocr = 0.0
-
-            # 3) Normalización y filtrado (igual que antes)
-            t3 = time.perf_counter()
-            normalized_results = []
-            for r in raw_ocr_results:
-                raw_text = getattr(r, "text", None)
-                if not raw_text:
-                    continue
-                norm = self.normalizer.normalize(raw_text)
-                if not norm:
-                    continue
-                conf = getattr(r, "confidence", 1.0)
-                if conf < getattr(settings, "ocr_min_confidence", 0.0):
-                    continue
-                bb = getattr(r, "bounding_box", None) or getattr(r, "bbox", None) or None
-                plate_obj = SimpleNamespace()
-                plate_obj.text = norm
-                plate_obj.confidence = conf
-                plate_obj.bounding_box = bb
-                normalized_results.append(plate_obj)
-            t_norm = time.perf_counter() - t3
-
-            # 4) Tracking
-            t4 = time.perf_counter()
+                logger.exception("Error procesando frame; saltando frame")
+
+    def process_frame(self, frame: Any, plates_bboxes: List[Any], t_detect: float) -> None:
+        """Pipeline post-detección para un frame: tracking, OCR por track, normalización, dedup y encolado."""
+        t0 = time.perf_counter() - t_detect
+
+        # 2) Tracking sobre las detecciones crudas (asigna track_id antes del OCR)
+        #    en orden de captura: se espera a que los frames anteriores de la cámara pasen por aquí
+        seq = getattr(frame, "sequence", 0)
+        t4 = time.perf_counter()
+        if seq and not self.sequencer.wait_turn(seq):
+            # turno perdido (saltado por timeout de reorden o servicio detenido): trackear este frame
+            # ahora lo haría fuera de orden y en paralelo con el que tiene el turno
+            self.sequencer.complete(seq)
+            self._m_dropped.inc()
+            logger.debug("Frame %s sin turno de tracking; descartado", seq)
+            return
+        try:
             try:
                 h, w = getattr(frame, "data", None).shape[:2] if getattr(frame, "data", None) is not None else getattr(frame, "image").shape[:2]
-                tracked_results = self.tracker.update(normalized_results, image_size=(h, w)) if normalized_results else []
+                tracked_plates = self.tracker.update(plates_bboxes, image_size=(h, w)) if plates_bboxes else []
             except TypeError:
-                tracked_results = self.tracker.update(normalized_results) if normalized_results else []
+                tracked_plates = self.tracker.update(plates_bboxes) if plates_bboxes else []
             except Exception:
                 logger.exception("Tracker.update falló")
-                tracked_results = []
-            t_track = time.perf_counter() - t4
-
-            # 5) Dedup + filter + queue to publisher
-            t5 = time.perf_counter()
-            unique_results = []
-            for plate in tracked_results:
-                text = getattr(plate, "text", None)
-                track_id = getattr(plate, "track_id", None)
-                if not text:
-                    continue
-                if len(text) > getattr(settings, "plate_max_length", 6):
-                    continue
-                try:
-                    is_dup = self.deduplicator.is_duplicate(track_id=track_id, plate_text=text, camera_id=self.camera_id)
-                except TypeError:
-                    is_dup = self.deduplicator.is_duplicate(track_id=track_id, plate_text=text)
-                except Exception:
-                    logger.exception("Deduplicator error para track=%s text=%s", track_id, text)
-                    is_dup = True
-                if not is_dup:
-                    unique_results.append(plate)
-            t_dedup = time.perf_counter() - t5
-
-            if unique_results:
-                captured_at = getattr(frame, "timestamp", None) or time.time()
-                source = getattr(frame, "source", None) or getattr(self.camera_stream, "url", None) or getattr(settings, "camera_url", None)
-                event_id = self._build_event_id(self.camera_id, unique_results, captured_at)
-                result = DetectionResult(
-                    event_id=event_id,
-                    frame_id=str(uuid.uuid4()),
-                    plates=unique_results,
-                    processed_at=time.time(),
-                    source=source,
-                    captured_at=captured_at,
-                    camera_id=self.camera_id
-                )
-                # enqueue for publishing (no bloqueante largo)
-                try:
-                    self.publish_queue.put(result, block=False)
-                except queue.Full:
-                    logger.warning("Publish queue llena, descartando evento")
-
-            total = time.perf_counter() - t0
-            logger.debug(
-                "Processed frame: detect=%.3fs ocr=%.3fs norm=%.3fs track=%.3fs dedup=%.3fs total=%.3fs",
-                t_detect, t_ocr, t_norm, t_track, t_dedup, total,
+                tracked_plates = plates_bboxes
+            # el planificador OCR también lleva estado por track: mismo turno
+            to_read = self.ocr_scheduler.select(
+                tracked_plates, camera_id=self.camera_id,
+                crop_quality=lambda plate: self.ocr_reader.crop_quality(frame, plate),
+            ) if tracked_plates else []
+        finally:
+            if seq:
+                self.sequencer.complete(seq)
+        t_track = time.perf_counter() - t4
+
+        # 3) OCR por track: solo tracks nuevos o sin consenso todavía (fuera del turno, en paralelo)
+        raw_ocr_results = []
+        if to_read:
+            t2 = time.perf_counter()
+            # todas las placas del frame van al reconocedor en un solo batch
+            try:
+                raw_ocr_results = list(self.ocr_reader.read_batch(frame, to_read))
+            except Exception:
+                logger.exception("OCR falló para %d bboxes=%s", len(to_read),
+                                 [getattr(b, "bounding_box", getattr(b, "bbox", b)) for b in to_read])
+            t_ocr = time.perf_counter() - t2
+        else:
+            t_ocr = 0.0
+
+        # 4) Normalización, filtrado y consenso por track
+        t3 = time.perf_counter()
+        tracked_results = []
+        for r in raw_ocr_results:
+            raw_text = getattr(r, "text", None)
+            norm = self.normalizer.normalize(raw_text) if raw_text else ""
+            conf = getattr(r, "confidence", 1.0)
+            if norm and conf < getattr(settings, "ocr_min_confidence", 0.0):
+                norm = ""
+            # registrar también lecturas fallidas (cuentan como intento del track);
+            # solo se publica la placa de consenso, una vez por track
+            consensus = self.ocr_scheduler.record(r, norm, conf, camera_id=self.camera_id)
+            if consensus is not None:
+                tracked_results.append(consensus)
+        # tracks que dejaron de verse sin llegar al consenso: se publica lo votado
+        tracked_results.extend(self.ocr_scheduler.finished(camera_id=self.camera_id))
+        t_norm = time.perf_counter() - t3
+
+        # 5) Dedup + filter + queue to publisher
+        t5 = time.perf_counter()
+        unique_results = []
+        for plate in tracked_results:
+            text = getattr(plate, "text", None)
+            track_id = getattr(plate, "track_id", None)
+            if not text:
+                continue
+            if len(text) > getattr(settings, "plate_max_length", 6):
+                continue
+            try:
+                is_dup = self.deduplicator.is_duplicate(track_id=track_id, plate_text=text, camera_id=self.camera_id)
+            except TypeError:
+                is_dup = self.deduplicator.is_duplicate(track_id=track_id, plate_text=text)
+            except Exception:
+                logger.exception("Deduplicator error para track=%s text=%s", track_id, text)
+                is_dup = True
+            if not is_dup:
+                unique_results.append(plate)
+        t_dedup = time.perf_counter() - t5
+
+        if unique_results:
+            captured_at = getattr(frame, "timestamp", None) or time.time()
+            source = getattr(frame, "source", None) or getattr(self.camera_stream, "url", None) or getattr(settings, "camera_url", None)
+            event_id = self._build_event_id(self.camera_id, unique_results, captured_at)
+            result = DetectionResult(
+                event_id=event_id,
+                frame_id=str(uuid.uuid4()),
+                plates=unique_results,
+                processed_at=time.time(),
+                source=source,
+                captured_at=captured_at,
+                camera_id=self.camera_id
             )
-
+            self._enqueue_result(result)
+
+        total = time.perf_counter() - t0
+        m = self._m_stage
+        m["detect"].observe(t_detect)
+        m["track"].observe(t_track)
+        if to_read:
+            m["ocr"].observe(t_ocr)
+            self._m_ocr_reads.inc(len(to_read))
+        m["norm"].observe(t_norm)
+        m["dedup"].observe(t_dedup)
+        m["total"].observe(total)
+        self._m_frames.inc()
+        if self.sampler is not None:
+            self.sampler.observe(total, len(tracked_plates))
+        logger.debug(
+            "Processed frame: detect=%.3fs track=%.3fs ocr=%.3fs (%d/%d) norm=%.3fs dedup=%.3fs total=%.3fs",
+            t_detect, t_track, t_ocr, len(to_read), len(tracked_plates), t_norm, t_dedup, total,
+        )
+
+        with self._frame_idx_lock:
             self.frame_idx += 1
-            self.capture_queue.task_done()
+        self._last_processed_at = time.time()
 
     # ----- Publisher thread -----
     def _publisher_loop(self):
@@ -276,12 +478,103 @@ class PlateRecognitionService:
                 continue
             if item is None:
                 break
+            # envío pipelined: no se espera la confirmación de Kafka para tomar el siguiente evento
+            # (publish_async solo bloquea si el publisher alcanzó su límite de mensajes en vuelo)
             try:
-                self.publisher.publish(item)
+                fut = self.publisher.publish_async(item)
+                fut.add_done_callback(lambda f, result=item: self._on_published(f, result))
             except Exception:
-                logger.exception("Error al publicar evento")
+                if self.spool is not None:
+                    logger.warning("Error al publicar evento event_id=%s; evento al spool", item.event_id, exc_info=True)
+                    self._spool_result(item)
+                else:
+                    logger.exception("Error al publicar evento")
+                self._m_events["failed"].inc()
             self.publish_queue.task_done()
 
+    def _on_published(self, fut: Any, result: DetectionResult) -> None:
+        exc = fut.exception()
+        if exc is None:
+            self._m_events["published"].inc()
+            self._m_age.observe(max(0.0, time.time() - result.captured_at))
+            return
+        self._m_events["failed"].inc()
+        if self.spool is not None:
+            logger.warning("Publicación fallida event_id=%s (%s); evento al spool", result.event_id, exc)
+            self._spool_result(result)
+        else:
+            logger.error("Error al publicar evento event_id=%s: %s", result.event_id, exc)
+
+    def _enqueue_result(self, result: DetectionResult) -> None:
+        """
+        Encola el evento para publicar. Con spool configurado, si hay backlog en
+        disco el evento va detrás (orden), y si la cola está llena va al spool
+        en lugar de descartarse.
+        """
+        if self.spool is not None and self.spool.has_backlog():
+            self._spool_result(result)
+            return
+        # enqueue for publishing (no bloqueante largo)
+        try:
+            self.publish_queue.put(result, block=False)
+        except queue.Full:
+            if self.spool is not None:
+                logger.debug("Publish queue llena, evento al spool")
+                self._spool_result(result)
+            else:
+                logger.warning("Publish queue llena, descartando evento")
+                self._m_events["dropped"].inc()
+
+    def _spool_result(self, result: DetectionResult) -> None:
+        try:
+            self.spool.append(result)
+            self._m_events["spooled"].inc()
+        except Exception:
+            logger.exception("No se pudo escribir en el spool; evento perdido event_id=%s", result.event_id)
+            self._m_events["dropped"].inc()
+
+    # ----- Estado (/status, /live) -----
+    def _threads(self) -> List[threading.Thread]:
+        threads = [t for t in (self.capture_thread, self.publisher_thread) if t is not None]
+        return threads + list(self.workers)
+
+    def status(self) -> dict:
+        now = time.time()
+        return {
+            "running": self.running,
+            "last_frame_at": self._last_frame_at or None,
+            "frame_age_seconds": round(now - self._last_frame_at, 3) if self._last_frame_at else None,
+            "last_processed_at": self._last_processed_at or None,
+            "frames_processed": self.frame_idx,
+            "queues": {
+                "capture": self.capture_queue.qsize(),
+                "publish": self.publish_queue.qsize(),
+                "spool": getattr(self.spool, "pending", lambda: None)() if self.spool is not None else None,
+            },
+            "threads": {t.name: t.is_alive() for t in self._threads()},
+            "sampling_fps": round(self.sampler.fps, 2) if self.sampler is not None else None,
+        }
+
+    def live_check(self) -> Optional[str]:
+        """
+        Motivo de fallo de liveness o None: sin frames de la cámara, frames sin
+        procesar (workers bloqueados) o threads del servicio muertos, durante
+        más de `stall_seconds`.
+        """
+        if not self.running:
+            return None
+        now = time.time()
+        captured = max(self._last_frame_at, self._started_at)
+        if now - captured > self.stall_seconds:
+            return f"sin frames de la cámara hace {now - captured:.1f}s"
+        processed = max(self._last_processed_at, self._started_at)
+        if now - processed > self.stall_seconds:
+            return f"frames sin procesar hace {now - processed:.1f}s (capture_queue={self.capture_queue.qsize()})"
+        dead = [t.name for t in self._threads() if not t.is_alive()]
+        if dead:
+            return f"threads detenidos: {', '.join(dead)}"
+        return None
+
     # helpers
     def _build_event_id(self, camera_id: str, plates: Iterable[Any], captured_at: float) -> str:
         first = next(iter(plates))
@@ -290,7 +583,12 @@ class PlateRecognitionService:
         return f"{camera_id}:{track_id}:{text}:{int(captured_at)}"
 
     def _pace(self, loop_start: float) -> None:
-        if getattr(self, "target_dt", 0.0):
+        if self.sampler is not None:
+            interval = self.sampler.interval(self.capture_queue.qsize(), self.capture_queue.maxsize)
+            sleep = interval - (time.perf_counter() - loop_start)
+            if sleep > 0:
+                time.sleep(sleep)
+        elif getattr(self, "target_dt", 0.0):
             elapsed = time.perf_counter() - loop_start
             sleep = max(0.0, self.target_dt - elapsed)
             if sleep > 0:
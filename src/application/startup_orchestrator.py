@@ -0,0 +1,204 @@
+# src/application/startup_orchestrator.py
+import time
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from src.core.config import settings
+from src.core.metrics import registry
+from src.core.status import status
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_READY = registry.gauge("anpr_component_ready", "1 si el componente terminó de cargar (y calentar)", ("component",))
+COMPONENT_STARTUP = registry.gauge("anpr_component_startup_seconds", "Segundos de carga + warm-up del componente", ("component",))
+
+
+class ComponentState(str, Enum):
+    PENDING = "pending"
+    LOADING = "loading"
+    WARMING = "warming"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass
+class _Component:
+    name: str
+    factory: Callable[[], Any]
+    warmup: Optional[Callable[[Any], None]]
+    required: bool
+    state: ComponentState = ComponentState.PENDING
+    error: Optional[str] = None
+    seconds: float = 0.0
+    future: Future = field(default_factory=Future)
+
+
+class StartupOrchestrator:
+    """
+    Arranque concurrente de los componentes pesados del worker.
+
+    Cada componente (detector, OCR, Kafka, ...) se construye en su propio
+    hilo y, si tiene warm-up, se calienta antes de marcarse listo:
+        pending -> loading -> warming -> ready | failed
+
+    - wait(*nombres) bloquea solo por los componentes que el llamador necesita
+      (la captura arranca con detector + OCR aunque Kafka siga conectando)
+    - future(nombre) / when_ready() permiten diferir el uso (DeferredPublisher)
+    - states() / ready exponen el estado para logs, métricas y health checks
+    - un warm-up que falla no tumba el componente (se registra y queda listo)
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self._components: Dict[str, _Component] = {}
+        self._lock = threading.Lock()
+        self._max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.started_at: Optional[float] = None
+
+    def add(self, name: str, factory: Callable[[], Any], warmup: Optional[Callable[[Any], None]] = None, required: bool = True) -> Future:
+        with self._lock:
+            if name in self._components:
+                raise ValueError(f"Componente duplicado: {name}")
+            comp = self._components[name] = _Component(name=name, factory=factory, warmup=warmup, required=required)
+        COMPONENT_READY.labels(component=name).set(0)
+        return comp.future
+
+    def start(self) -> "StartupOrchestrator":
+        self.started_at = time.monotonic()
+        comps = list(self._components.values())
+        status.register("startup", self.states, live=self._live_check, ready=self._ready_check)
+        self._executor = ThreadPoolExecutor(max_workers=self._max_workers or max(1, len(comps)), thread_name_prefix="startup")
+        for comp in comps:
+            self._executor.submit(self._load, comp)
+        logger.info("Arranque concurrente de %d componentes: %s", len(comps), ", ".join(c.name for c in comps))
+        return self
+
+    # ----- consulta -----
+    def future(self, name: str) -> Future:
+        return self._components[name].future
+
+    def get(self, name: str, timeout: Optional[float] = None) -> Any:
+        """Valor del componente cuando esté listo; RuntimeError si falló o venció el timeout."""
+        try:
+            return self._components[name].future.result(timeout=timeout)
+        except FutureTimeout:
+            raise RuntimeError(f"Componente '{name}' no estuvo listo en {timeout}s") from None
+        except Exception as e:
+            raise RuntimeError(f"Componente '{name}' falló al cargar: {e}") from e
+
+    def wait(self, *names: str, timeout: Optional[float] = None) -> List[Any]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        values = []
+        for name in names:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            values.append(self.get(name, timeout=remaining))
+        return values
+
+    def when_ready(self, name: str, callback: Callable[[Any], None]) -> None:
+        """Ejecuta callback(valor) cuando el componente esté listo (no se llama si falla)."""
+        def _done(fut: Future) -> None:
+            if fut.exception() is not None:
+                return
+            try:
+                callback(fut.result())
+            except Exception:
+                logger.exception("Callback de arranque de '%s' falló", name)
+        self._components[name].future.add_done_callback(_done)
+
+    def states(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                c.name: {"state": c.state.value, "required": c.required, "seconds": round(c.seconds, 3), "error": c.error}
+                for c in self._components.values()
+            }
+
+    @property
+    def ready(self) -> bool:
+        return all(c.state == ComponentState.READY for c in self._components.values() if c.required)
+
+    def _ready_check(self) -> Optional[str]:
+        pending = [f"{c.name}={c.state.value}" for c in self._components.values() if c.required and c.state != ComponentState.READY]
+        return f"componentes sin cargar: {', '.join(pending)}" if pending else None
+
+    def _live_check(self) -> Optional[str]:
+        failed = [c.name for c in self._components.values() if c.required and c.state == ComponentState.FAILED]
+        return f"componentes fallidos: {', '.join(failed)}" if failed else None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ----- carga -----
+    def _set(self, comp: _Component, state: ComponentState) -> None:
+        with self._lock:
+            comp.state = state
+
+    def _load(self, comp: _Component) -> None:
+        t0 = time.monotonic()
+        self._set(comp, ComponentState.LOADING)
+        try:
+            value = comp.factory()
+        except Exception as e:
+            comp.error = f"{type(e).__name__}: {e}"
+            comp.seconds = time.monotonic() - t0
+            self._set(comp, ComponentState.FAILED)
+            logger.exception("Componente '%s' falló al cargar (%.2fs)", comp.name, comp.seconds)
+            comp.future.set_exception(e)
+            return
+        t_load = time.monotonic() - t0
+
+        if comp.warmup is not None:
+            self._set(comp, ComponentState.WARMING)
+            try:
+                comp.warmup(value)
+            except Exception:
+                logger.exception("Warm-up de '%s' falló; se continúa sin calentar", comp.name)
+
+        comp.seconds = time.monotonic() - t0
+        self._set(comp, ComponentState.READY)
+        COMPONENT_READY.labels(component=comp.name).set(1)
+        COMPONENT_STARTUP.labels(component=comp.name).set(comp.seconds)
+        logger.info("Componente '%s' listo: carga=%.2fs warm-up=%.2fs", comp.name, t_load, comp.seconds - t_load)
+        comp.future.set_result(value)
+
+
+# ============================================================
+#  WARM-UP (tensores de la forma de producción)
+# ============================================================
+def _warmup_frame(variant: int = 0) -> Frame:
+    h = int(getattr(settings, "startup_warmup_height", 720))
+    w = int(getattr(settings, "startup_warmup_width", 1280))
+    data = np.full((h, w, 3), 114, dtype=np.uint8)
+    # placa sintética para que el OCR recorra el camino completo (recorte, reconocedor, decodificación)
+    ph, pw = max(16, h // 20), max(64, w // 10)
+    y, x = (h - ph) // 2, (w - pw) // 2
+    data[y:y + ph, x:x + pw] = 230
+    # trazos distintos por iteración: la caché de OCR no debe responder en lugar del reconocedor
+    data[y + ph // 4:y + 3 * ph // 4, x + pw // 8 + variant % 5:x + 7 * pw // 8:6] = 20
+    return Frame(data=data, timestamp=time.time(), source="warmup")
+
+
+def warm_up_detector(detector, iterations: Optional[int] = None) -> None:
+    """Inferencias de calentamiento con el batch de producción (DETECTOR_BATCH_SIZE)."""
+    iterations = iterations if iterations is not None else getattr(settings, "startup_warmup_iterations", 2)
+    batch = max(1, int(getattr(settings, "detector_batch_size", 1)))
+    for i in range(max(0, iterations)):
+        detector.detect_batch([_warmup_frame(i) for _ in range(batch)])
+
+
+def warm_up_ocr(ocr, iterations: Optional[int] = None) -> None:
+    iterations = iterations if iterations is not None else getattr(settings, "startup_warmup_iterations", 2)
+    for i in range(max(0, iterations)):
+        frame = _warmup_frame(i)
+        h, w = frame.data.shape[:2]
+        ph, pw = max(16, h // 20), max(64, w // 10)
+        box = ((w - pw) // 2, (h - ph) // 2, pw, ph)
+        ocr.read_batch(frame, [Plate(text="", confidence=0.0, bounding_box=box)])
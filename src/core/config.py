@@ -1,4 +1,5 @@
 # src/core/config.py
+from typing import List
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -7,10 +8,25 @@ class Settings(BaseSettings):
     app_name: str = Field("anpr-microservice", env="APP_NAME")
     app_env: str = Field("development", env="APP_ENV")
     app_port: int = Field(8000, env="APP_PORT")
+    # API embebida en el worker (/health, /metrics del proceso que procesa las cámaras)
+    worker_api_enabled: bool = Field(True, env="WORKER_API_ENABLED")
+    worker_api_port: int = Field(8001, env="WORKER_API_PORT")
+    status_stall_seconds: float = Field(15.0, env="STATUS_STALL_SECONDS")   # /live y /ready fallan si una cámara no captura/procesa frames en este tiempo
 
     # Kafka (defaults pensados para correr en docker-compose)
     kafka_broker: str = Field("kafka:9092", env="KAFKA_BROKER")
     kafka_topic: str = Field("anpr-detections", env="KAFKA_TOPIC")
+    # Máx. mensajes producidos sin confirmación de entrega (backpressure del envío pipelined)
+    kafka_max_in_flight: int = Field(1000, env="KAFKA_MAX_IN_FLIGHT")
+
+    # Spool durable en disco (eventos que no se pudieron publicar; se re-publican en orden)
+    spool_enabled: bool = Field(True, env="SPOOL_ENABLED")
+    spool_dir: str = Field("./data/spool", env="SPOOL_DIR")
+    spool_segment_max_mb: float = Field(16.0, env="SPOOL_SEGMENT_MAX_MB")
+    spool_fsync_batch: int = Field(32, env="SPOOL_FSYNC_BATCH")
+    spool_fsync_interval_ms: float = Field(200.0, env="SPOOL_FSYNC_INTERVAL_MS")
+    spool_retry_interval: float = Field(5.0, env="SPOOL_RETRY_INTERVAL")
+    spool_drain_batch: int = Field(500, env="SPOOL_DRAIN_BATCH")
 
     # Database & cache
     db_url: str = Field(..., env="DB_URL")
@@ -27,22 +43,117 @@ class Settings(BaseSettings):
 
     # Dedup / plate rules
     dedup_ttl: float = Field(9.0, env="DEDUP_TTL")           # segundos, default 9.0
+    dedup_backend: str = Field("memory", env="DEDUP_BACKEND")   # memory | redis (compartido entre nodos)
+    dedup_fuzzy: bool = Field(False, env="DEDUP_FUZZY")       # dedup aproximado por texto (ignora track_id)
+    dedup_fuzzy_max_distance: int = Field(1, env="DEDUP_FUZZY_MAX_DISTANCE")
+    dedup_redis_prefix: str = Field("anpr:dedup", env="DEDUP_REDIS_PREFIX")
+    dedup_redis_timeout: float = Field(0.2, env="DEDUP_REDIS_TIMEOUT")
+    dedup_redis_retry_interval: float = Field(5.0, env="DEDUP_REDIS_RETRY_INTERVAL")
+    dedup_near_cache_size: int = Field(4096, env="DEDUP_NEAR_CACHE_SIZE")
+    dedup_near_cache_ttl: float = Field(1.0, env="DEDUP_NEAR_CACHE_TTL")
     similarity_threshold: float = Field(0.9, env="SIMILARITY_THRESHOLD")
     plate_min_length: int = Field(5, env="PLATE_MIN_LENGTH")
 
     # OCR
+    ocr_backend: str = Field("easyocr", env="OCR_BACKEND")   # easyocr | onnx (CRNN compacto, CTC)
     ocr_lang: str = Field("en", env="OCR_LANG")
     ocr_interval: int = Field(5, env="OCR_INTERVAL")
     ocr_min_length: int = Field(4, env="OCR_MIN_LENGTH")
     ocr_min_confidence: float = Field(0.8, env="OCR_MIN_CONFIDENCE")
 
+    # Preparación del recorte antes del OCR (padding, alto fijo, CLAHE, deskew) y calidad mínima
+    ocr_preprocess: bool = Field(True, env="OCR_PREPROCESS")
+    ocr_crop_height: int = Field(64, env="OCR_CROP_HEIGHT")
+    ocr_crop_max_width: int = Field(384, env="OCR_CROP_MAX_WIDTH")
+    ocr_crop_padding: float = Field(0.08, env="OCR_CROP_PADDING")
+    ocr_clahe_clip: float = Field(2.0, env="OCR_CLAHE_CLIP")
+    ocr_crop_gamma: float = Field(1.0, env="OCR_CROP_GAMMA")
+    ocr_deskew: bool = Field(True, env="OCR_DESKEW")
+    ocr_min_crop_height: int = Field(12, env="OCR_MIN_CROP_HEIGHT")
+    ocr_min_crop_quality: float = Field(0.2, env="OCR_MIN_CROP_QUALITY")
+    ocr_cache_size: int = Field(1024, env="OCR_CACHE_SIZE")   # resultados OCR por posición y apariencia del recorte (0 = sin caché)
+    ocr_cache_ttl: float = Field(2.0, env="OCR_CACHE_TTL")
+    ocr_cache_max_diff: float = Field(0.08, env="OCR_CACHE_MAX_DIFF")   # diferencia máx. (peor franja, niveles estandarizados) para reutilizar
+
+    # OCR por track (planificador): re-lee cada OCR_INTERVAL frames del track hasta el consenso
+    ocr_track_settle_confidence: float = Field(0.9, env="OCR_TRACK_SETTLE_CONFIDENCE")
+    ocr_track_max_reads: int = Field(15, env="OCR_TRACK_MAX_READS")
+    ocr_track_ttl: float = Field(5.0, env="OCR_TRACK_TTL")
+    ocr_consensus_min_votes: int = Field(3, env="OCR_CONSENSUS_MIN_VOTES")
+    ocr_consensus_flush_after: float = Field(1.0, env="OCR_CONSENSUS_FLUSH_AFTER")
+
     # Camera
     camera_url: str = Field(..., env="CAMERA_URL")
     camera_native: bool = Field(False, env="CAMERA_NATIVE")
+    # Multi-cámara: lista JSON [{"camera_id": "1", "url": "rtsp://...", "name": "ENTRADA"}, ...]
+    # Si está vacía se usa una sola cámara con CAMERA_URL
+    cameras: List[dict] = Field(default_factory=list, env="CAMERAS")
+    # Ring de frames en memoria compartida: la captura decodifica en slots preasignados (0 = deshabilitado)
+    frame_ring_slots: int = Field(16, env="FRAME_RING_SLOTS")
+    # true = descarta el frame más viejo si capture_queue está llena (vivo); false = la captura espera
+    capture_drop_frames: bool = Field(True, env="CAPTURE_DROP_FRAMES")
+    # Ingesta: "read" (cap.read de todo) | "grab" (retrieve solo de los frames muestreados) | "ffmpeg" (subproceso)
+    camera_ingest: str = Field("read", env="CAMERA_INGEST")
+    camera_ingest_fps: float = Field(0.0, env="CAMERA_INGEST_FPS")          # grab/ffmpeg: frames/seg a entregar (0 = grab bajo demanda / ffmpeg todos)
+    camera_ingest_width: int = Field(0, env="CAMERA_INGEST_WIDTH")          # ffmpeg: escala de salida (0 = original)
+    camera_ingest_height: int = Field(0, env="CAMERA_INGEST_HEIGHT")
+    camera_ffmpeg_keyframes_only: bool = Field(False, env="CAMERA_FFMPEG_KEYFRAMES_ONLY")
+    camera_ffmpeg_hwaccel: str = Field("", env="CAMERA_FFMPEG_HWACCEL")     # "" | auto | cuda | vaapi | qsv
+    ffmpeg_bin: str = Field("ffmpeg", env="FFMPEG_BIN")
+    # ROI de la cámara única (CAMERA_URL): lista JSON de polígonos [[[x, y], ...], ...]; en CAMERAS va como "roi"
+    camera_roi: List[List[List[int]]] = Field(default_factory=list, env="CAMERA_ROI")
 
     # Switch de detector
     yolo_version: str = Field("v8", env="YOLO_VERSION")
 
+    # Backend de inferencia: "thread" (modelos en el proceso) | "process" (réplicas en procesos, sin GIL)
+    inference_backend: str = Field("thread", env="INFERENCE_BACKEND")
+    inference_processes: int = Field(2, env="INFERENCE_PROCESSES")
+    inference_torch_threads: int = Field(1, env="INFERENCE_TORCH_THREADS")
+    inference_timeout: float = Field(30.0, env="INFERENCE_TIMEOUT")
+    inference_max_restarts: int = Field(5, env="INFERENCE_MAX_RESTARTS")        # relanzamientos seguidos por réplica antes de darla por perdida
+    inference_restart_backoff: float = Field(1.0, env="INFERENCE_RESTART_BACKOFF")  # espera (s) del 1er relanzamiento; se duplica en cada fallo
+
+    # Micro-batching del detector (throughput vs latencia)
+    # batch_size=1 desactiva el batching; timeout = espera máx. para completar el batch
+    detector_batch_size: int = Field(1, env="DETECTOR_BATCH_SIZE")
+    detector_batch_timeout_ms: float = Field(20.0, env="DETECTOR_BATCH_TIMEOUT_MS")
+
+    # Muestreo adaptativo: fps de captura por cámara según contrapresión y tracks activos
+    # (reemplaza el pacing fijo target_frame_seconds/LOOP_DELAY de la captura)
+    adaptive_sampling_enabled: bool = Field(False, env="ADAPTIVE_SAMPLING_ENABLED")
+    sampling_min_fps: float = Field(2.0, env="SAMPLING_MIN_FPS")        # escena vacía o pipeline saturado
+    sampling_base_fps: float = Field(8.0, env="SAMPLING_BASE_FPS")      # sin tracks recientes
+    sampling_max_fps: float = Field(15.0, env="SAMPLING_MAX_FPS")       # con tracks activos
+    sampling_idle_seconds: float = Field(3.0, env="SAMPLING_IDLE_SECONDS")  # sin tracks -> min_fps
+    sampling_boost_hold: float = Field(1.0, env="SAMPLING_BOOST_HOLD")  # se mantiene max_fps tras el último track
+    sampling_queue_high: float = Field(0.5, env="SAMPLING_QUEUE_HIGH")  # ocupación de capture_queue que frena la captura
+
+    # Gate de movimiento + ROI: sin movimiento en la ROI no se llama al detector
+    motion_gate_enabled: bool = Field(False, env="MOTION_GATE_ENABLED")
+    motion_downscale_width: int = Field(160, env="MOTION_DOWNSCALE_WIDTH")    # ancho (px) de la ROI reducida para el diff
+    motion_pixel_threshold: int = Field(25, env="MOTION_PIXEL_THRESHOLD")     # diferencia de gris (0-255) que cuenta como cambio
+    motion_min_area: float = Field(0.002, env="MOTION_MIN_AREA")              # fracción de la ROI que debe cambiar
+    motion_bg_alpha: float = Field(0.05, env="MOTION_BG_ALPHA")               # tasa de aprendizaje del fondo
+    motion_hold_seconds: float = Field(1.5, env="MOTION_HOLD_SECONDS")        # se sigue detectando tras el último movimiento
+    motion_keepalive_seconds: float = Field(5.0, env="MOTION_KEEPALIVE_SECONDS")  # detección forzada aunque la escena esté quieta
+
+    # ONNX Runtime (YOLO_VERSION=onnx): grafo exportado de v5/v8, sin torch
+    onnx_model_path: str = Field("./models/best.onnx", env="ONNX_MODEL_PATH")
+    onnx_img_size: int = Field(640, env="ONNX_IMG_SIZE")            # solo si el grafo tiene H/W dinámicos
+    onnx_intra_op_threads: int = Field(0, env="ONNX_INTRA_OP_THREADS")  # 0 = default de ORT (núcleos físicos)
+    onnx_inter_op_threads: int = Field(1, env="ONNX_INTER_OP_THREADS")
+    onnx_providers: str = Field("CPUExecutionProvider", env="ONNX_PROVIDERS")  # en orden de preferencia, separados por coma
+    onnx_output_format: str = Field("auto", env="ONNX_OUTPUT_FORMAT")  # auto | v8 | v5
+    onnx_max_det: int = Field(100, env="ONNX_MAX_DET")
+
+    # OCR ONNX (OCR_BACKEND=onnx): reconocedor CRNN/PaddleOCR-rec de una línea con CTC
+    ocr_onnx_model_path: str = Field("./models/plate_crnn.onnx", env="OCR_ONNX_MODEL_PATH")
+    ocr_onnx_charset: str = Field("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ", env="OCR_ONNX_CHARSET")   # clases del modelo sin el blank, en orden
+    ocr_onnx_blank_index: int = Field(0, env="OCR_ONNX_BLANK_INDEX")   # 0 = primera clase, -1 = última
+    ocr_onnx_input_height: int = Field(32, env="OCR_ONNX_INPUT_HEIGHT")  # solo si el grafo tiene H dinámico
+    ocr_onnx_input_width: int = Field(128, env="OCR_ONNX_INPUT_WIDTH")   # ancho máximo si W es dinámico
+
     # YOLOv5 specifics
     yolov5_model_path: str = Field("./models/yolov5n-license-plate.pt", env="YOLOV5_MODEL_PATH")
     yolov5_conf: float = Field(0.25, env="YOLOV5_CONF")
@@ -62,6 +173,15 @@ class Settings(BaseSettings):
     bytetrack_match_thresh: float = Field(0.8, env="BYTETRACK_MATCH_THRESH")
     bytetrack_buffer_size: int = Field(30, env="BYTETRACK_BUFFER_SIZE")
     bytetrack_fps: int = Field(30, env="BYTETRACK_FPS")
+    bytetrack_impl: str = Field("vectorized", env="BYTETRACK_IMPL")   # vectorized (struct-of-arrays) | legacy (STrack)
+    # espera máx. (s) de un worker por los frames anteriores de su cámara antes de saltarlos
+    tracking_reorder_timeout: float = Field(2.0, env="TRACKING_REORDER_TIMEOUT")
+
+    # Arranque: carga concurrente + warm-up con la forma de producción
+    startup_warmup_iterations: int = Field(2, env="STARTUP_WARMUP_ITERATIONS")   # 0 = sin warm-up
+    startup_warmup_width: int = Field(1280, env="STARTUP_WARMUP_WIDTH")
+    startup_warmup_height: int = Field(720, env="STARTUP_WARMUP_HEIGHT")
+    startup_publisher_wait: float = Field(30.0, env="STARTUP_PUBLISHER_WAIT")     # espera máx. (s) por Kafka al publicar durante el arranque
 
     class Config:
         env_file = ".env"
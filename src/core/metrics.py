@@ -0,0 +1,313 @@
+# src/core/metrics.py
+"""
+Métricas del proceso (contadores, gauges e histogramas de latencia) con
+exportación en formato de texto de Prometheus.
+
+- Los contadores e histogramas escriben en celdas por thread: cada thread
+  solo modifica la suya, así el camino caliente no toma locks ni pierde
+  incrementos; la lectura (render / quantile) suma todas las celdas.
+- Los histogramas son log-lineales estilo HDR: resolución de 1 µs, 2^SUB_BITS
+  sub-buckets por potencia de 2 (~3% de error relativo) y memoria acotada.
+  Se exportan como `summary` (cuantiles + _sum + _count).
+- Los gauges pueden tener un valor fijo o una función que se evalúa al exportar
+  (p.ej. tamaño de una cola).
+
+Uso:
+    FRAMES = registry.counter("anpr_frames_total", "Frames procesados", ("camera",))
+    FRAMES.labels(camera="1").inc()
+"""
+import math
+import weakref
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# ============================================================
+#  Celdas por thread
+# ============================================================
+class _Shards:
+    """
+    Conjunto de celdas (listas de tamaño fijo), una por thread escritor.
+
+    La celda de un thread que terminó (p.ej. un threading.Timer de reintento)
+    se suma a un acumulador retirado y se descarta: el número de celdas queda
+    acotado por los threads vivos, no por los creados desde el arranque.
+    """
+
+    __slots__ = ("_size", "_local", "_cells", "_retired", "_lock")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[Tuple[Callable[[], Optional[threading.Thread]], list]] = []
+        self._retired = [0] * size
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = [0] * self._size
+            owner = weakref.ref(threading.current_thread())
+            with self._lock:
+                self._retire_dead()
+                self._cells.append((owner, cell))
+            self._local.cell = cell
+        return cell
+
+    def merged(self) -> list:
+        with self._lock:
+            self._retire_dead()
+            out = list(self._retired)
+            cells = [cell for _, cell in self._cells]
+        for cell in cells:
+            for i, v in enumerate(cell):
+                if v:
+                    out[i] += v
+        return out
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def _retire_dead(self) -> None:
+        """Pliega en `_retired` las celdas de threads terminados (ya nadie las escribe). Con el lock tomado."""
+        alive = []
+        for owner, cell in self._cells:
+            thread = owner()
+            if thread is not None and thread.is_alive():
+                alive.append((owner, cell))
+                continue
+            retired = self._retired
+            for i, v in enumerate(cell):
+                if v:
+                    retired[i] += v
+        if len(alive) != len(self._cells):
+            self._cells = alive
+
+
+# ============================================================
+#  Métricas (hijos con labels ya resueltos)
+# ============================================================
+class Counter:
+    def __init__(self):
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        self._shards.cell()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._shards.merged()[0]
+
+
+class Gauge:
+    def __init__(self):
+        self._value = 0.0
+        self._fn: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self._value -= amount
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        """El valor se calcula al exportar (p.ej. queue.qsize)."""
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+        if self._fn is not None:
+            try:
+                return float(self._fn())
+            except Exception:
+                return math.nan
+        return self._value
+
+
+class Histogram:
+    """
+    Histograma log-lineal (HDR) de valores en segundos, resolución 1 µs.
+    Celda por thread: [count, sum, bucket_0, ..., bucket_n].
+    """
+
+    SUB_BITS = 5
+    MAX_SHIFT = 32                     # hasta ~2^37 µs (~38 h)
+    _SUB = 1 << SUB_BITS
+    _HALF = _SUB >> 1
+    BUCKETS = _SUB + MAX_SHIFT * _HALF
+
+    def __init__(self):
+        self._shards = _Shards(2 + self.BUCKETS)
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        if micros < cls._SUB:
+            return max(0, micros)
+        shift = micros.bit_length() - cls.SUB_BITS
+        if shift > cls.MAX_SHIFT:
+            return cls.BUCKETS - 1
+        return cls._SUB + (shift - 1) * cls._HALF + ((micros >> shift) - cls._HALF)
+
+    @classmethod
+    def _bounds(cls, idx: int) -> Tuple[int, int]:
+        """Rango [low, high) en µs del bucket idx."""
+        if idx < cls._SUB:
+            return idx, idx + 1
+        shift = (idx - cls._SUB) // cls._HALF + 1
+        sub = (idx - cls._SUB) % cls._HALF + cls._HALF
+        return sub << shift, (sub + 1) << shift
+
+    def observe(self, seconds: float) -> None:
+        cell = self._shards.cell()
+        cell[0] += 1
+        cell[1] += seconds
+        cell[2 + self._index(int(seconds * 1_000_000))] += 1
+
+    def snapshot(self) -> Tuple[int, float, List[int]]:
+        merged = self._shards.merged()
+        return merged[0], merged[1], merged[2:]
+
+    @property
+    def count(self) -> int:
+        return self.snapshot()[0]
+
+    def quantile(self, q: float) -> float:
+        return self.quantiles((q,))[0]
+
+    def quantiles(self, qs: Iterable[float]) -> List[float]:
+        """Cuantiles (segundos) estimados con el punto medio del bucket; nan si no hay datos."""
+        count, _, buckets = self.snapshot()
+        return self._quantiles_from(count, buckets, list(qs))
+
+    @classmethod
+    def _quantiles_from(cls, count: int, buckets: List[int], qs: List[float]) -> List[float]:
+        if count <= 0:
+            return [math.nan for _ in qs]
+        out = []
+        for q in qs:
+            rank = max(1, math.ceil(min(1.0, max(0.0, q)) * count))
+            cum = 0
+            value = math.nan
+            for idx, n in enumerate(buckets):
+                if not n:
+                    continue
+                cum += n
+                if cum >= rank:
+                    low, high = cls._bounds(idx)
+                    value = (low + high - 1) / 2.0 / 1_000_000
+                    break
+            out.append(value)
+        return out
+
+
+# ============================================================
+#  Familias (métrica + labels) y registro
+# ============================================================
+class MetricFamily:
+    def __init__(self, name: str, help_text: str, kind: str, factory: Callable[[], object], labelnames: Tuple[str, ...]):
+        self.name = name
+        self.help = help_text
+        self.kind = kind
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels):
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._factory()
+        return child
+
+    # atajos para familias sin labels
+    def inc(self, amount: float = 1) -> None:
+        self.labels().inc(amount)
+
+    def observe(self, seconds: float) -> None:
+        self.labels().observe(seconds)
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def children(self) -> List[Tuple[Tuple[str, ...], object]]:
+        with self._lock:
+            return list(self._children.items())
+
+
+class MetricsRegistry:
+    """Registro de familias de métricas; declarar dos veces el mismo nombre devuelve la misma familia."""
+
+    QUANTILES = (0.5, 0.9, 0.95, 0.99)
+
+    def __init__(self):
+        self._families: Dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "counter", Counter, labelnames)
+
+    def gauge(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "gauge", Gauge, labelnames)
+
+    def histogram(self, name: str, help_text: str, labelnames: Tuple[str, ...] = ()) -> MetricFamily:
+        return self._family(name, help_text, "summary", Histogram, labelnames)
+
+    def _family(self, name, help_text, kind, factory, labelnames) -> MetricFamily:
+        with self._lock:
+            fam = self._families.get(name)
+            if fam is None:
+                fam = self._families[name] = MetricFamily(name, help_text, kind, factory, labelnames)
+            elif fam.kind != kind:
+                raise ValueError(f"Métrica {name} ya registrada como {fam.kind}")
+            return fam
+
+    def render(self) -> str:
+        """Exporta todas las métricas en formato de texto de Prometheus (0.0.4)."""
+        with self._lock:
+            families = list(self._families.values())
+        lines: List[str] = []
+        for fam in families:
+            lines.append(f"# HELP {fam.name} {fam.help}")
+            lines.append(f"# TYPE {fam.name} {fam.kind}")
+            for key, child in fam.children():
+                labels = list(zip(fam.labelnames, key))
+                if fam.kind == "summary":
+                    count, total, buckets = child.snapshot()
+                    for q, v in zip(self.QUANTILES, Histogram._quantiles_from(count, buckets, list(self.QUANTILES))):
+                        lines.append(f"{fam.name}{_labels(labels + [('quantile', str(q))])} {_num(v)}")
+                    lines.append(f"{fam.name}_sum{_labels(labels)} {_num(total)}")
+                    lines.append(f"{fam.name}_count{_labels(labels)} {_num(count)}")
+                else:
+                    lines.append(f"{fam.name}{_labels(labels)} {_num(child.value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(pairs: List[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ""
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _num(value: float) -> str:
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        return repr(value)
+    return str(value)
+
+
+# registro global del proceso
+registry = MetricsRegistry()
@@ -0,0 +1,111 @@
+# src/core/status.py
+"""
+Estado vivo del proceso para /live, /ready y /status.
+
+Cada componente (servicio de cámara, supervisor, publisher Kafka, spool,
+orquestador de arranque) se registra con:
+- un proveedor: función sin argumentos que devuelve un dict con su estado;
+  se evalúa solo al consultar /status (el camino caliente no paga nada)
+- checks opcionales de liveness y readiness: funciones que devuelven None si
+  todo va bien o el motivo del fallo
+
+/live falla si algún check de liveness falla (proceso colgado: reiniciar).
+/ready falla si falla cualquier check o si no hay componentes registrados
+(el proceso no está corriendo un pipeline).
+
+Uso:
+    status.register("camera:1", service.status, live=service.live_check)
+"""
+import time
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Check = Callable[[], Optional[str]]
+
+
+class StatusRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._providers: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self._live: Dict[str, Check] = {}
+        self._ready: Dict[str, Check] = {}
+        self.started_at = time.time()
+
+    def register(
+        self,
+        name: str,
+        provider: Optional[Callable[[], Dict[str, Any]]] = None,
+        live: Optional[Check] = None,
+        ready: Optional[Check] = None,
+    ) -> None:
+        """Registra (o reemplaza) un componente."""
+        with self._lock:
+            for table, fn in ((self._providers, provider), (self._live, live), (self._ready, ready)):
+                if fn is not None:
+                    table[name] = fn
+                else:
+                    table.pop(name, None)
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            for table in (self._providers, self._live, self._ready):
+                table.pop(name, None)
+
+    # ----- consultas -----
+    def liveness(self) -> Tuple[bool, Dict[str, str]]:
+        with self._lock:
+            live = dict(self._live)
+        failures = self._run(live)
+        return not failures, failures
+
+    def readiness(self) -> Tuple[bool, Dict[str, str]]:
+        with self._lock:
+            live, ready = dict(self._live), dict(self._ready)
+            empty = not (self._providers or live or ready)
+        failures = self._run(live)
+        failures.update(self._run(ready))
+        if empty:
+            failures["registry"] = "sin componentes registrados"
+        return not failures, failures
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Estado completo: resultado de los checks y dict de cada componente."""
+        with self._lock:
+            providers = dict(self._providers)
+        components: Dict[str, Any] = {}
+        for name, provider in sorted(providers.items()):
+            try:
+                components[name] = provider()
+            except Exception as e:
+                components[name] = {"error": f"{type(e).__name__}: {e}"}
+        live, live_failures = self.liveness()
+        ready, ready_failures = self.readiness()
+        return {
+            "live": live,
+            "ready": ready,
+            "failures": {**ready_failures, **live_failures},
+            "uptime_seconds": round(time.time() - self.started_at, 3),
+            "components": components,
+        }
+
+    @staticmethod
+    def _run(checks: Dict[str, Check]) -> Dict[str, str]:
+        failures: Dict[str, str] = {}
+        for name, check in checks.items():
+            try:
+                reason = check()
+            except Exception as e:
+                reason = f"check falló: {type(e).__name__}: {e}"
+            if reason:
+                failures[name] = reason
+        return failures
+
+    def clear(self) -> None:
+        with self._lock:
+            self._providers.clear()
+            self._live.clear()
+            self._ready.clear()
+
+
+# registro global del proceso
+status = StatusRegistry()
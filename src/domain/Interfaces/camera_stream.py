@@ -1,4 +1,7 @@
+import time
+import asyncio
 from abc import ABC, abstractmethod
+from typing import AsyncIterator, Optional
 from src.domain.Models.frame import Frame
 
 class ICameraStream(ABC):
@@ -19,3 +22,38 @@ class ICameraStream(ABC):
     def disconnect(self) -> None:
         """Cierra la conexión al stream."""
         pass
+
+    def wait_next_frame(self, timeout: Optional[float] = None) -> Frame | None:
+        """
+        Bloquea hasta que haya un frame nuevo (Frame.sequence creciente) y lo
+        devuelve; None si vence el timeout o el stream se cerró. Nunca entrega
+        dos veces el mismo frame.
+
+        Implementación por defecto para streams sin hilo lector: sondea
+        read_frame() (cada lectura ya es un frame nuevo).
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            frame = self.read_frame()
+            if frame is not None:
+                return frame
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(0.01)
+
+    async def frames(self, timeout: float = 1.0) -> AsyncIterator[Frame]:
+        """Iterador asíncrono de frames nuevos (wait_next_frame en un thread del executor)."""
+        while True:
+            frame = await asyncio.to_thread(self.wait_next_frame, timeout)
+            if frame is None:
+                if not self.is_open():
+                    return
+                continue
+            yield frame
+
+    def __aiter__(self) -> AsyncIterator[Frame]:
+        return self.frames()
+
+    def is_open(self) -> bool:
+        """True mientras el stream pueda entregar más frames."""
+        return True
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from src.domain.Models.detection_result import DetectionResult
 
 class IEventPublisher(ABC):
@@ -9,3 +10,17 @@ class IEventPublisher(ABC):
     def publish(self, result: DetectionResult) -> None:
         """Publica un DetectionResult en un broker de mensajes."""
         pass
+
+    def publish_async(self, result: DetectionResult) -> "Future[None]":
+        """
+        Publica sin esperar la confirmación; el Future se resuelve con la entrega
+        (o con la excepción del fallo). Por defecto publica en línea y devuelve
+        un Future ya resuelto; los publishers con envío pipelined lo sobreescriben.
+        """
+        fut: "Future[None]" = Future()
+        try:
+            self.publish(result)
+            fut.set_result(None)
+        except Exception as ex:
+            fut.set_exception(ex)
+        return fut
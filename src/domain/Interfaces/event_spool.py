@@ -0,0 +1,16 @@
+# src/domain/Interfaces/event_spool.py
+from typing import Protocol
+from src.domain.Models.detection_result import DetectionResult
+
+class IEventSpool(Protocol):
+    """
+    Contrato para el almacenamiento durable de eventos pendientes de publicar.
+
+    append persiste el evento (FIFO); has_backlog indica si quedan eventos sin
+    entregar, en cuyo caso los nuevos deben ir detrás para conservar el orden.
+    """
+    def append(self, result: DetectionResult) -> None:
+        ...
+
+    def has_backlog(self) -> bool:
+        ...
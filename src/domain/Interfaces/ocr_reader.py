@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 from src.domain.Models.frame import Frame
 from src.domain.Models.plate import Plate
 
@@ -13,3 +14,19 @@ class IOCRReader(ABC):
         Devuelve un Plate con el campo 'text' actualizado.
         """
         pass
+
+    def read_batch(self, frame: Frame, plates: List[Plate]) -> List[Plate]:
+        """
+        Extrae texto de varias placas del mismo frame en una sola pasada
+        (si el backend lo soporta). Devuelve la lista alineada con `plates`.
+        Implementación por defecto: llama a read_text() placa a placa.
+        """
+        return [self.read_text(frame, plate) for plate in plates]
+
+    def crop_quality(self, frame: Frame, plate: Plate) -> float:
+        """
+        Puntaje 0-1 de qué tan legible es el recorte de la placa (tamaño,
+        nitidez, contraste). El planificador no gasta OCR en recortes por
+        debajo de OCR_MIN_CROP_QUALITY. Por defecto: 1.0 (sin evaluación).
+        """
+        return 1.0
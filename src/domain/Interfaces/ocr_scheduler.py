@@ -0,0 +1,21 @@
+# src/domain/Interfaces/ocr_scheduler.py
+from typing import Callable, Protocol, Optional, List
+from src.domain.Models.plate import Plate
+
+class IOCRScheduler(Protocol):
+    """
+    Contrato para decidir qué placas (ya trackeadas) necesitan OCR en este frame.
+
+    select devuelve el subconjunto de placas a leer; record registra el
+    resultado normalizado de cada lectura para construir el consenso del track
+    y devuelve la placa a publicar cuando el track se resuelve (una vez);
+    finished devuelve las de tracks que terminaron sin resolverse.
+    """
+    def select(self, plates: List[Plate], camera_id: Optional[str] = None, crop_quality: Optional[Callable[[Plate], float]] = None) -> List[Plate]:
+        ...
+
+    def record(self, plate: Plate, text_norm: str, confidence: float, camera_id: Optional[str] = None) -> Optional[Plate]:
+        ...
+
+    def finished(self, camera_id: Optional[str] = None) -> List[Plate]:
+        ...
@@ -11,3 +11,11 @@ class IPlateDetector(ABC):
     def detect(self, frame: Frame) -> List[Plate]:
         """Detecta placas en el frame y devuelve lista de Plate."""
         pass
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        """
+        Detecta placas en varios frames con una sola pasada (si el backend lo soporta).
+        Devuelve una lista de resultados alineada con `frames`.
+        Implementación por defecto: llama a detect() frame a frame.
+        """
+        return [self.detect(frame) for frame in frames]
@@ -0,0 +1,20 @@
+# src/domain/Interfaces/sampling_controller.py
+from typing import Protocol
+
+class ISamplingController(Protocol):
+    """
+    Contrato para decidir cada cuánto se toma un frame de la cámara.
+
+    observe recibe la retroalimentación del pipeline por frame procesado;
+    interval devuelve los segundos entre capturas según la presión actual
+    de capture_queue.
+    """
+    def observe(self, latency: float, active_tracks: int) -> None:
+        ...
+
+    def interval(self, queue_depth: int, queue_capacity: int) -> float:
+        ...
+
+    @property
+    def fps(self) -> float:
+        ...
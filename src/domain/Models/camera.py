@@ -1,6 +1,6 @@
 # src/domain/Models/camera.py
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 @dataclass
 class Camera:
@@ -12,3 +12,4 @@ class Camera:
     url: str                 # RTSP/HTTP URL
     name: Optional[str] = None
     location: Optional[str] = None
+    roi: Optional[List[List[List[int]]]] = None   # polígonos [[x, y], ...] del carril; None = frame completo
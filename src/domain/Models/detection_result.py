@@ -27,3 +27,29 @@ class DetectionResult:
             "captured_at": self.captured_at,
             "camera_id": self.camera_id
         }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DetectionResult":
+        """Reconstruye el resultado desde to_dict() (p.ej. al releer el spool en disco)."""
+        plates = []
+        for p in data.get("plates") or []:
+            if isinstance(p, dict):
+                bbox = p.get("bounding_box")
+                plates.append(Plate(
+                    text=p.get("text", ""),
+                    confidence=float(p.get("confidence") or 0.0),
+                    bounding_box=tuple(bbox) if bbox is not None else None,
+                    track_id=p.get("track_id"),
+                    votes=int(p.get("votes") or 0),
+                ))
+            else:
+                plates.append(p)
+        return cls(
+            event_id=data.get("event_id"),
+            frame_id=data.get("frame_id", ""),
+            plates=plates,
+            processed_at=float(data.get("processed_at") or 0.0),
+            source=data.get("source", ""),
+            captured_at=float(data.get("captured_at") or 0.0),
+            camera_id=data.get("camera_id"),
+        )
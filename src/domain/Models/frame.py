@@ -1,4 +1,5 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
+from typing import Any, Optional
 import numpy as np
 
 @dataclass
@@ -9,12 +10,27 @@ class Frame:
     data: np.ndarray   # imagen en formato numpy array
     timestamp: float   # momento en que se capturó
     source: str        # identificador de la cámara o URL
+    # slot del ring de memoria compartida que respalda `data` (None = array propio)
+    handle: Optional[Any] = field(default=None, repr=False, compare=False)
+    # número de secuencia por stream (monótono desde 1; 0 = sin numerar)
+    sequence: int = 0
 
     @property
     def image(self) -> np.ndarray:
         """Alias para compatibilidad con librerías que esperan 'image'."""
         return self.data
 
+    def retain(self) -> "Frame":
+        """Suma una referencia al slot que respalda el frame (no-op sin ring)."""
+        if self.handle is not None:
+            self.handle.retain()
+        return self
+
+    def release(self) -> None:
+        """Libera una referencia; el slot se reutiliza cuando nadie lo retiene."""
+        if self.handle is not None:
+            self.handle.release()
+
     def to_dict(self) -> dict:
         """
         Convierte el frame a un dict serializable (sin incluir la imagen).
@@ -23,5 +39,6 @@ class Frame:
         return {
             "timestamp": self.timestamp,
             "source": self.source,
+            "sequence": self.sequence,
             "shape": self.data.shape if isinstance(self.data, np.ndarray) else None
         }
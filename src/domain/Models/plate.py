@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict
 from typing import Optional
 
 @dataclass
@@ -11,3 +11,10 @@ class Plate:
     bounding_box: tuple[int]   # (x1, y1, x2, y2) en coordenadas de la imagen
     
     track_id: Optional[int] = None  # ID asignado por el tracker (persistente entre frames)
+    votes: int = 0                  # Lecturas OCR del track que respaldan el texto (consenso)
+    cached: bool = False            # Texto tomado de la caché de OCR (no es una lectura nueva; no se serializa)
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data.pop("cached", None)
+        return data
@@ -0,0 +1,91 @@
+# src/domain/Services/adaptive_sampling_service.py
+from __future__ import annotations
+import time
+import threading
+from typing import Optional
+
+from src.domain.Interfaces.sampling_controller import ISamplingController
+from src.core.config import settings
+
+class AdaptiveSamplingService(ISamplingController):
+    """
+    Controlador de muestreo por cámara guiado por la contrapresión del pipeline.
+
+    - objetivo según la escena: `max_fps` mientras haya tracks activos (y
+      `boost_hold` segundos después), `base_fps` por defecto y `min_fps` si la
+      escena lleva `idle_seconds` vacía
+    - techo por capacidad: workers / latencia EWMA por frame
+    - AIMD sobre el techo: si capture_queue supera `queue_high` de su capacidad
+      se reduce multiplicativamente; con la cola casi vacía sube de a `step_fps`
+    - el fps elegido siempre queda en [min_fps, max_fps]
+    """
+
+    def __init__(
+        self,
+        min_fps: Optional[float] = None,
+        base_fps: Optional[float] = None,
+        max_fps: Optional[float] = None,
+        idle_seconds: Optional[float] = None,
+        boost_hold: Optional[float] = None,
+        queue_high: Optional[float] = None,
+        workers: int = 1,
+        ewma_alpha: float = 0.2,
+        step_fps: float = 0.5,
+        backoff: float = 0.8,
+    ):
+        self.min_fps = max(0.1, min_fps if min_fps is not None else getattr(settings, "sampling_min_fps", 2.0))
+        self.max_fps = max(self.min_fps, max_fps if max_fps is not None else getattr(settings, "sampling_max_fps", 15.0))
+        base = base_fps if base_fps is not None else getattr(settings, "sampling_base_fps", 8.0)
+        self.base_fps = min(self.max_fps, max(self.min_fps, base))
+        self.idle_seconds = idle_seconds if idle_seconds is not None else getattr(settings, "sampling_idle_seconds", 3.0)
+        self.boost_hold = boost_hold if boost_hold is not None else getattr(settings, "sampling_boost_hold", 1.0)
+        self.queue_high = queue_high if queue_high is not None else getattr(settings, "sampling_queue_high", 0.5)
+        self.workers = max(1, workers)
+        self.ewma_alpha = ewma_alpha
+        self.step_fps = step_fps
+        self.backoff = backoff
+
+        now = time.monotonic()
+        self._latency: Optional[float] = None     # EWMA de la latencia por frame (s)
+        self._last_active = now - self.boost_hold  # arranque = escena desconocida -> base_fps
+        self._ceiling = self.max_fps              # techo AIMD por contrapresión
+        self._fps = self.base_fps
+        self._lock = threading.Lock()
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    def observe(self, latency: float, active_tracks: int) -> None:
+        """Retroalimentación de un frame procesado: latencia total y tracks presentes."""
+        now = time.monotonic()
+        with self._lock:
+            if latency > 0:
+                self._latency = latency if self._latency is None else \
+                    self._latency + self.ewma_alpha * (latency - self._latency)
+            if active_tracks > 0:
+                self._last_active = now
+
+    def interval(self, queue_depth: int, queue_capacity: int) -> float:
+        """Segundos hasta la próxima captura; actualiza el fps elegido."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_active < self.boost_hold:
+                target = self.max_fps
+            elif now - self._last_active >= self.idle_seconds:
+                target = self.min_fps
+            else:
+                target = self.base_fps
+
+            fill = queue_depth / queue_capacity if queue_capacity > 0 else 0.0
+            if fill >= self.queue_high:
+                self._ceiling = max(self.min_fps, self._ceiling * self.backoff)
+            elif queue_depth <= 1:
+                self._ceiling = min(self.max_fps, self._ceiling + self.step_fps)
+
+            ceiling = self._ceiling
+            if self._latency:
+                ceiling = min(ceiling, self.workers / self._latency)
+
+            self._fps = min(self.max_fps, max(self.min_fps, min(target, ceiling)))
+            return 1.0 / self._fps
@@ -1,11 +1,13 @@
 # src/domain/Services/deduplicator_service.py
 from __future__ import annotations
 import time
+import threading
 from typing import Optional, Dict, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.domain.Interfaces.deduplicator import IDeduplicator
 from src.domain.Interfaces.text_normalizer import ITextNormalizer
+from src.domain.Services.fuzzy_plate_index import FuzzyPlateIndex
 from src.core.config import settings
 
 # internal entry
@@ -15,6 +17,13 @@ class _SeenEntry:
     # opcionales para futuro: confidence, bbox, track_id, etc.
     # aquí solo almacenamos timestamp porque la llave contiene track+text
 
+# shard por cámara: su propio lock, así las cámaras/workers no se serializan entre sí
+@dataclass
+class _CameraShard:
+    entries: Dict[Tuple[Optional[int], str], _SeenEntry] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    index: Optional[FuzzyPlateIndex] = None   # solo en modo fuzzy
+
 class DeduplicatorService(IDeduplicator):
     """
     Servicio de deduplicación de dominio.
@@ -23,13 +32,22 @@ class DeduplicatorService(IDeduplicator):
     - llave por (track_id_or_none, normalized_text)
     - TTL configurable (lee settings.dedup_ttl si no se pasa)
     - normalizer inyectado (ITextNormalizer) para normalizar/rechazar texto
+    - thread-safe: estado particionado por camera_id, un lock por cámara
+      (check-and-set atómico por shard; el lock global solo crea shards)
+    - modo fuzzy (DEDUP_FUZZY): ignora el track_id y considera duplicada una
+      lectura a distancia <= DEDUP_FUZZY_MAX_DISTANCE de una placa reciente de
+      la cámara tras canonizar confusiones del OCR (ver FuzzyPlateIndex);
+      cubre el jitter del OCR cuando el tracker re-asigna el id
     """
 
-    def __init__(self, normalizer: ITextNormalizer, ttl: Optional[float] = None):
+    def __init__(self, normalizer: ITextNormalizer, ttl: Optional[float] = None, fuzzy: Optional[bool] = None, max_distance: Optional[int] = None):
         self.normalizer = normalizer
         self.ttl = ttl if ttl is not None else getattr(settings, "dedup_ttl", 3.0)
-        # estructura: { camera_id: { (track_key, text_norm): _SeenEntry } }
-        self._store: Dict[str, Dict[Tuple[Optional[int], str], _SeenEntry]] = {}
+        self.fuzzy = fuzzy if fuzzy is not None else getattr(settings, "dedup_fuzzy", False)
+        self.max_distance = max_distance if max_distance is not None else getattr(settings, "dedup_fuzzy_max_distance", 1)
+        # estructura: { camera_id: _CameraShard({ (track_key, text_norm): _SeenEntry }) }
+        self._store: Dict[str, _CameraShard] = {}
+        self._shards_lock = threading.Lock()
 
     def is_duplicate(self, track_id: Optional[int], plate_text: str, camera_id: Optional[str] = None) -> bool:
         """
@@ -49,23 +67,44 @@ class DeduplicatorService(IDeduplicator):
             # texto inválido según la política de normalización -> no publicar
             return True
 
-        now = time.time()
-        cam_map = self._store.setdefault(cam, {})
-
-        # purgar expirados (ligero, solo por este cam)
-        self._purge_cam(cam_map, now)
+        shard = self._shard(cam)
+        if self.fuzzy:
+            with shard.lock:
+                now = time.time()
+                if shard.index.match(text_norm, now) is not None:
+                    return True
+                shard.index.add(text_norm, now)
+                return False
 
         key = (track_id, text_norm)
-        entry = cam_map.get(key)
-        if entry is not None:
-            if (now - entry.when) < self.ttl:
-                # actualizar TTL tipo sliding
-                entry.when = now
-                return True
+        with shard.lock:
+            now = time.time()
+            cam_map = shard.entries
+
+            # purgar expirados (ligero, solo por este cam)
+            self._purge_cam(cam_map, now)
+
+            entry = cam_map.get(key)
+            if entry is not None:
+                if (now - entry.when) < self.ttl:
+                    # actualizar TTL tipo sliding
+                    entry.when = now
+                    return True
+
+            # no fue visto recientemente -> registrar y permitir publicación
+            cam_map[key] = _SeenEntry(when=now)
+            return False
 
-        # no fue visto recientemente -> registrar y permitir publicación
-        cam_map[key] = _SeenEntry(when=now)
-        return False
+    def _shard(self, cam: str) -> _CameraShard:
+        shard = self._store.get(cam)
+        if shard is None:
+            with self._shards_lock:
+                shard = self._store.get(cam)
+                if shard is None:
+                    shard = self._store[cam] = _CameraShard()
+                    if self.fuzzy:
+                        shard.index = FuzzyPlateIndex(ttl=self.ttl, max_distance=self.max_distance)
+        return shard
 
     def _purge_cam(self, cam_map: Dict[Tuple[Optional[int], str], _SeenEntry], now: float) -> None:
         """Eliminar entradas expiradas de un mapa por cámara (in-place)."""
@@ -79,4 +118,5 @@ class DeduplicatorService(IDeduplicator):
 
     # utilidad para tests / operativa: limpiar todo
     def clear(self) -> None:
-        self._store.clear()
+        with self._shards_lock:
+            self._store.clear()
@@ -0,0 +1,127 @@
+# src/domain/Services/fuzzy_plate_index.py
+from __future__ import annotations
+import heapq
+from itertools import combinations
+from typing import Dict, List, Optional, Set, Tuple
+
+# Confusiones típicas del OCR en placas: cada clase colapsa a un solo símbolo
+OCR_CONFUSIONS: Dict[str, str] = {
+    "O": "0", "Q": "0", "D": "0",
+    "I": "1", "L": "1",
+    "Z": "2",
+    "S": "5",
+    "G": "6",
+    "T": "7",
+    "B": "8",
+}
+
+class FuzzyPlateIndex:
+    """
+    Índice de placas recientes con búsqueda aproximada en tiempo ~constante.
+
+    - el texto se canoniza con las confusiones del OCR (B->8, O->0, ...):
+      "ABC123" y "A8C123" quedan a distancia 0
+    - índice de vecindario por borrado (symmetric delete): cada texto se
+      indexa por todas sus variantes con hasta `max_distance` caracteres
+      borrados; dos textos a distancia de Levenshtein <= k comparten alguna
+      variante, así que una consulta solo genera sus propias variantes
+      (7 para una placa de 6 caracteres con k=1) y verifica los candidatos
+    - expiración por TTL deslizante con un heap ordenado por vencimiento
+      (borrado perezoso: las entradas del heap ya renovadas se ignoran)
+
+    No es thread-safe: el llamador serializa el acceso (lock por cámara).
+    """
+
+    def __init__(self, ttl: float, max_distance: int = 1, confusions: Optional[Dict[str, str]] = None):
+        self.ttl = ttl
+        self.max_distance = max(0, int(max_distance))
+        self._table = str.maketrans(confusions if confusions is not None else OCR_CONFUSIONS)
+        self._expires: Dict[str, float] = {}           # texto canónico -> vencimiento
+        self._buckets: Dict[str, Set[str]] = {}        # variante -> textos canónicos
+        self._heap: List[Tuple[float, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+    def canonical(self, text: str) -> str:
+        return text.translate(self._table)
+
+    def match(self, text: str, now: float) -> Optional[str]:
+        """Texto canónico reciente a distancia <= max_distance de `text`, o None. Renueva su TTL."""
+        self.purge(now)
+        key = self.canonical(text)
+        if key in self._expires:
+            self._touch(key, now)
+            return key
+
+        best: Optional[str] = None
+        best_dist = self.max_distance + 1
+        for variant in self._variants(key):
+            for cand in self._buckets.get(variant, ()):
+                dist = _bounded_levenshtein(key, cand, self.max_distance)
+                if dist < best_dist:
+                    best, best_dist = cand, dist
+        if best is not None:
+            self._touch(best, now)
+        return best
+
+    def add(self, text: str, now: float) -> str:
+        key = self.canonical(text)
+        if key not in self._expires:
+            for variant in self._variants(key):
+                self._buckets.setdefault(variant, set()).add(key)
+        self._touch(key, now)
+        return key
+
+    def purge(self, now: float) -> None:
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            expires, key = heapq.heappop(heap)
+            if self._expires.get(key) == expires:
+                self._remove(key)
+
+    def clear(self) -> None:
+        self._expires.clear()
+        self._buckets.clear()
+        self._heap.clear()
+
+    # ----- internos -----
+    def _touch(self, key: str, now: float) -> None:
+        expires = now + self.ttl
+        self._expires[key] = expires
+        heapq.heappush(self._heap, (expires, key))
+        # una placa que sigue a la vista deja una entrada por renovación: compactar
+        if len(self._heap) > 4 * len(self._expires) + 64:
+            self._heap = [(e, k) for k, e in self._expires.items()]
+            heapq.heapify(self._heap)
+
+    def _remove(self, key: str) -> None:
+        del self._expires[key]
+        for variant in self._variants(key):
+            bucket = self._buckets.get(variant)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[variant]
+
+    def _variants(self, key: str) -> Set[str]:
+        out = {key}
+        n = len(key)
+        for k in range(1, min(self.max_distance, n) + 1):
+            for drop in combinations(range(n), k):
+                out.add("".join(ch for i, ch in enumerate(key) if i not in drop))
+        return out
+
+def _bounded_levenshtein(a: str, b: str, bound: int) -> int:
+    """Distancia de edición entre a y b; devuelve bound + 1 en cuanto se sabe que la supera."""
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+    prev = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        cur = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (ca != cb))
+        if min(cur) > bound:
+            return bound + 1
+        prev = cur
+    return prev[-1] if prev[-1] <= bound else bound + 1
@@ -0,0 +1,261 @@
+# src/domain/Services/ocr_scheduler_service.py
+from __future__ import annotations
+import time
+import threading
+from typing import Callable, Optional, Dict, List
+from dataclasses import dataclass, field
+
+from src.domain.Interfaces.ocr_scheduler import IOCRScheduler
+from src.domain.Models.plate import Plate
+from src.core.config import settings
+from src.core.metrics import registry
+
+OCR_SKIPPED_LOW_QUALITY = registry.counter("anpr_ocr_skipped_low_quality_total", "Lecturas OCR evitadas por recorte de baja calidad", ("camera",))
+
+# internal entry
+@dataclass
+class _TrackState:
+    last_seen: float
+    frames_since_read: int = 0
+    attempts: int = 0                 # lecturas OCR intentadas (válidas o no)
+    valid_reads: int = 0              # lecturas que pasaron normalización/confianza
+    # votos por longitud del texto normalizado: {len: [n_lecturas, suma_confianza, [{char: suma_confianza}, ...]]}
+    votes: Dict[int, list] = field(default_factory=dict)
+    bounding_box: Optional[tuple] = None
+    settled: bool = False
+    published: bool = False
+
+@dataclass
+class _Consensus:
+    text: str = ""
+    confidence: float = 0.0           # confianza media de las lecturas que coinciden, por posición
+    agreement: float = 0.0            # peso del carácter ganador / peso total en la posición más disputada
+    votes: int = 0                    # lecturas de la longitud ganadora
+
+class OCRSchedulerService(IOCRScheduler):
+    """
+    Planificador de OCR por track (en lugar de un intervalo global de frames)
+    y consenso multi-frame de sus lecturas.
+
+    - scope por camera_id (si no se provee, usa 'default')
+    - track nuevo -> OCR inmediato
+    - track sin consenso -> re-lectura cada `reread_interval` frames del track
+    - consenso por posición de carácter: entre las lecturas normalizadas de la
+      longitud con más peso, cada posición elige el carácter con mayor suma de
+      confianzas (una lectura errónea en un frame no decide la placa)
+    - el track se resuelve con `min_votes` lecturas y acuerdo >= settle_confidence
+      en todas las posiciones, o al agotar `max_reads` intentos; desde ahí no
+      se vuelve a leer
+    - cada track se publica una sola vez: al resolverse (record) o, si nunca
+      llegó al consenso, cuando deja de verse `flush_after` segundos (finished)
+    - placas sin track_id siempre se leen y se publican tal cual
+    - con `crop_quality`, los recortes por debajo de `min_crop_quality` no se
+      leen ni cuentan como intento: se reintentan en el siguiente frame
+    - las lecturas servidas por la caché de OCR (plate.cached) no son
+      evidencia nueva: no votan ni consumen intentos
+    - tracks no vistos durante `ttl` segundos se olvidan
+    """
+
+    def __init__(
+        self,
+        settle_confidence: Optional[float] = None,
+        reread_interval: Optional[int] = None,
+        max_reads: Optional[int] = None,
+        ttl: Optional[float] = None,
+        min_votes: Optional[int] = None,
+        flush_after: Optional[float] = None,
+        min_crop_quality: Optional[float] = None,
+    ):
+        self.settle_confidence = settle_confidence if settle_confidence is not None else getattr(settings, "ocr_track_settle_confidence", 0.9)
+        self.reread_interval = max(1, reread_interval if reread_interval is not None else getattr(settings, "ocr_interval", 1))
+        self.max_reads = max(1, max_reads if max_reads is not None else getattr(settings, "ocr_track_max_reads", 15))
+        self.ttl = ttl if ttl is not None else getattr(settings, "ocr_track_ttl", 5.0)
+        self.min_votes = max(1, min_votes if min_votes is not None else getattr(settings, "ocr_consensus_min_votes", 3))
+        self.flush_after = min(self.ttl, flush_after if flush_after is not None else getattr(settings, "ocr_consensus_flush_after", 1.0))
+        self.min_crop_quality = min_crop_quality if min_crop_quality is not None else getattr(settings, "ocr_min_crop_quality", 0.2)
+        # estructura: { camera_id: { track_id: _TrackState } }
+        self._tracks: Dict[str, Dict[int, _TrackState]] = {}
+        self._lock = threading.Lock()
+
+    def select(self, plates: List[Plate], camera_id: Optional[str] = None, crop_quality: Optional[Callable[[Plate], float]] = None) -> List[Plate]:
+        """
+        Devuelve las placas que deben pasar por OCR en este frame.
+        Las placas de tracks ya resueltos reciben el texto de consenso y no se leen.
+        `crop_quality(plate)` (opcional) descarta recortes que seguro fallan.
+        """
+        cam = camera_id or "default"
+        now = time.time()
+        selected: List[Plate] = []
+
+        with self._lock:
+            cam_map = self._tracks.setdefault(cam, {})
+            self._purge_cam(cam_map, now)
+
+            for plate in plates:
+                track_id = getattr(plate, "track_id", None)
+                if track_id is None:
+                    if self._legible(plate, cam, crop_quality):
+                        selected.append(plate)
+                    continue
+
+                state = cam_map.get(track_id)
+                if state is None:
+                    # track nuevo -> leer ya (o en cuanto el recorte sea legible)
+                    state = cam_map[track_id] = _TrackState(last_seen=now, bounding_box=getattr(plate, "bounding_box", None))
+                    if self._legible(plate, cam, crop_quality):
+                        selected.append(plate)
+                    else:
+                        state.frames_since_read = self.reread_interval
+                    continue
+
+                state.last_seen = now
+                state.bounding_box = getattr(plate, "bounding_box", None) or state.bounding_box
+                if state.settled:
+                    consensus = self._consensus(state)
+                    plate.text = consensus.text
+                    plate.confidence = consensus.confidence
+                    plate.votes = consensus.votes
+                    continue
+
+                state.frames_since_read += 1
+                if state.frames_since_read >= self.reread_interval and self._legible(plate, cam, crop_quality):
+                    selected.append(plate)
+
+        return selected
+
+    def _legible(self, plate: Plate, cam: str, crop_quality: Optional[Callable[[Plate], float]]) -> bool:
+        if crop_quality is None or self.min_crop_quality <= 0:
+            return True
+        try:
+            if crop_quality(plate) >= self.min_crop_quality:
+                return True
+        except Exception:
+            return True
+        OCR_SKIPPED_LOW_QUALITY.labels(camera=cam).inc()
+        return False
+
+    def record(self, plate: Plate, text_norm: str, confidence: float, camera_id: Optional[str] = None) -> Optional[Plate]:
+        """
+        Registra una lectura OCR (text_norm vacío = lectura fallida) y devuelve
+        la placa de consenso si el track acaba de resolverse (una sola vez por
+        track); None mientras siga votando. Placas sin track devuelven la
+        propia lectura si es válida.
+        """
+        track_id = getattr(plate, "track_id", None)
+        if track_id is None:
+            if not text_norm:
+                return None
+            return Plate(text=text_norm, confidence=float(confidence), bounding_box=getattr(plate, "bounding_box", None), votes=1)
+
+        cam = camera_id or "default"
+        with self._lock:
+            cam_map = self._tracks.setdefault(cam, {})
+            state = cam_map.get(track_id)
+            if state is None:
+                state = cam_map[track_id] = _TrackState(last_seen=time.time())
+            state.bounding_box = getattr(plate, "bounding_box", None) or state.bounding_box
+
+            state.frames_since_read = 0
+            if getattr(plate, "cached", False):
+                # mismo recorte que una lectura ya contada: repetirla no aporta votos
+                return None
+            state.attempts += 1
+            if text_norm:
+                state.valid_reads += 1
+                self._vote(state, text_norm, float(confidence))
+
+            consensus = self._consensus(state)
+            if (consensus.votes >= self.min_votes and consensus.agreement >= self.settle_confidence) or state.attempts >= self.max_reads:
+                state.settled = True
+            if state.settled and consensus.text and not state.published:
+                state.published = True
+                return self._to_plate(track_id, state, consensus)
+            return None
+
+    def finished(self, camera_id: Optional[str] = None) -> List[Plate]:
+        """
+        Placas de consenso de tracks que dejaron de verse (`flush_after` s) sin
+        llegar a resolverse: se publican con lo votado hasta ese momento.
+        """
+        cam = camera_id or "default"
+        now = time.time()
+        out: List[Plate] = []
+        with self._lock:
+            cam_map = self._tracks.get(cam)
+            if not cam_map:
+                return out
+            for track_id, state in cam_map.items():
+                if state.published or not state.votes or (now - state.last_seen) < self.flush_after:
+                    continue
+                consensus = self._consensus(state)
+                state.settled = state.published = True
+                if consensus.text:
+                    out.append(self._to_plate(track_id, state, consensus))
+            self._purge_cam(cam_map, now)
+        return out
+
+    def active_tracks(self, camera_id: Optional[str] = None) -> int:
+        """Número de tracks vivos para la cámara."""
+        with self._lock:
+            return len(self._tracks.get(camera_id or "default", {}))
+
+    @staticmethod
+    def _vote(state: _TrackState, text: str, confidence: float) -> None:
+        group = state.votes.get(len(text))
+        if group is None:
+            group = state.votes[len(text)] = [0, 0.0, [{} for _ in text]]
+        group[0] += 1
+        group[1] += confidence
+        for position, ch in zip(group[2], text):
+            position[ch] = position.get(ch, 0.0) + confidence
+
+    @staticmethod
+    def _consensus(state: _TrackState) -> _Consensus:
+        """
+        Texto de consenso por posición dentro de la longitud con mayor suma de
+        confianzas; acuerdo = mínimo por posición de peso ganador / peso total.
+        """
+        if not state.votes:
+            return _Consensus()
+        length = max(state.votes, key=lambda n: (state.votes[n][1], state.votes[n][0]))
+        count, weight_sum, positions = state.votes[length]
+        chars: List[str] = []
+        confidence = 0.0
+        agreement = 1.0
+        for position in positions:
+            ch, weight = max(position.items(), key=lambda kv: kv[1])
+            chars.append(ch)
+            confidence += weight / count
+            agreement = min(agreement, weight / sum(position.values()))
+        # lecturas de otras longitudes también compiten: cuentan contra el acuerdo
+        agreement *= weight_sum / sum(g[1] for g in state.votes.values())
+        return _Consensus(
+            text="".join(chars),
+            confidence=confidence / max(1, len(positions)),
+            agreement=agreement,
+            votes=count,
+        )
+
+    @staticmethod
+    def _to_plate(track_id: int, state: _TrackState, consensus: _Consensus) -> Plate:
+        return Plate(
+            text=consensus.text,
+            confidence=consensus.confidence,
+            bounding_box=state.bounding_box,
+            track_id=track_id,
+            votes=consensus.votes,
+        )
+
+    def _purge_cam(self, cam_map: Dict[int, _TrackState], now: float) -> None:
+        """Eliminar tracks expirados de un mapa por cámara (in-place); los que esperan finished() se conservan."""
+        if not cam_map:
+            return
+        ttl = self.ttl
+        for k, s in list(cam_map.items()):
+            if (now - s.last_seen) >= ttl and (s.published or not s.votes):
+                cam_map.pop(k, None)
+
+    # utilidad para tests / operativa: limpiar todo
+    def clear(self) -> None:
+        with self._lock:
+            self._tracks.clear()
@@ -1,5 +1,6 @@
 # src/infrastructure/Camera/camera_factory.py
-from typing import Optional
+from dataclasses import fields
+from typing import List, Optional
 from src.core.config import settings
 from src.domain.Interfaces.camera_stream import ICameraStream
 from src.domain.Models.camera import Camera
@@ -18,13 +19,55 @@ def create_camera_stream(camera: Optional[Camera] = None) -> ICameraStream:
             stream = Picamera2CameraStream(camera) if camera is not None else Picamera2CameraStream()
         except TypeError:
             stream = Picamera2CameraStream()
+    elif settings.camera_ingest.lower() == "ffmpeg":
+        # decodificación en subproceso ffmpeg: solo I-frames / fps y resolución reducidos
+        from src.infrastructure.Camera.ffmpeg_camera_stream import FFmpegCameraStream
+        url = camera.url if camera is not None else settings.camera_url
+        stream = FFmpegCameraStream(
+            url,
+            ring_slots=settings.frame_ring_slots,
+            fps=settings.camera_ingest_fps,
+            width=settings.camera_ingest_width,
+            height=settings.camera_ingest_height,
+            keyframes_only=settings.camera_ffmpeg_keyframes_only,
+            hwaccel=settings.camera_ffmpeg_hwaccel,
+            ffmpeg_bin=settings.ffmpeg_bin,
+        )
     else:
         from src.infrastructure.Camera.opencv_camera_stream import OpenCVCameraStream
         url = camera.url if camera is not None else settings.camera_url
-        stream = OpenCVCameraStream(url)
+        stream = OpenCVCameraStream(
+            url,
+            ring_slots=settings.frame_ring_slots,
+            ingest=settings.camera_ingest.lower(),
+            ingest_fps=settings.camera_ingest_fps,
+        )
 
     # Anexar metadata útil al stream (retrocompatible)
     stream.url = camera.url if camera is not None else getattr(stream, "url", settings.camera_url)
     stream.camera_id = camera.camera_id if camera is not None else getattr(stream, "camera_id", "default")
 
     return stream
+
+
+def load_cameras() -> List[Camera]:
+    """
+    Lista de cámaras configuradas (settings.cameras). Si no hay ninguna,
+    devuelve la cámara única por defecto construida con settings.camera_url.
+    """
+    if not settings.cameras:
+        return [Camera(camera_id="1", url=settings.camera_url, name="ENTRADA", roi=settings.camera_roi or None)]
+
+    known = {f.name for f in fields(Camera)}
+    cameras: List[Camera] = []
+    for entry in settings.cameras:
+        data = {k: v for k, v in entry.items() if k in known}
+        if "camera_id" not in data or "url" not in data:
+            raise ValueError(f"Cámara mal configurada (requiere camera_id y url): {entry}")
+        data["camera_id"] = str(data["camera_id"])
+        cameras.append(Camera(**data))
+
+    ids = [c.camera_id for c in cameras]
+    if len(ids) != len(set(ids)):
+        raise ValueError(f"camera_id duplicados en CAMERAS: {ids}")
+    return cameras
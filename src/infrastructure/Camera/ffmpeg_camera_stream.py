@@ -0,0 +1,213 @@
+# src/infrastructure/Camera/ffmpeg_camera_stream.py
+import json
+import shutil
+import subprocess
+import time
+import logging
+import threading
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.infrastructure.Camera.opencv_camera_stream import OpenCVCameraStream
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _passthrough_args(ffmpeg_bin: str) -> Tuple[str, ...]:
+    """
+    Opción para no duplicar/descartar frames en la salida: -fps_mode (ffmpeg >= 5.1);
+    -vsync (obsoleta, avisa en cada arranque) solo si el binario no conoce -fps_mode.
+    Se consulta una vez por binario.
+    """
+    try:
+        out = subprocess.run([ffmpeg_bin, "-hide_banner", "-h", "full"], capture_output=True, timeout=10, check=False)
+        if b"fps_mode" in out.stdout:
+            return ("-fps_mode", "passthrough")
+    except (OSError, subprocess.SubprocessError):
+        pass
+    return ("-vsync", "passthrough")
+
+
+class FFmpegCameraStream(OpenCVCameraStream):
+    """
+    ICameraStream que decodifica con un subproceso ffmpeg y lee frames BGR
+    crudos de su stdout (pipe), en lugar de cv2.VideoCapture.
+
+    ffmpeg reduce la carga antes de que el frame llegue a Python:
+    - `keyframes_only`: -skip_frame nokey, el decoder descarta todo salvo I-frames
+    - `fps`: filtro fps=N (frames descartados tras decodificar, sin conversión ni pipe)
+    - `width`/`height`: escala dentro de ffmpeg (menos bytes por el pipe y para YOLO)
+    - `hwaccel`: decodificación por hardware (-hwaccel cuda|vaapi|qsv|auto)
+
+    Los frames se leen directo al slot del ring (readinto) cuando está habilitado.
+    Hereda de OpenCVCameraStream el frame más reciente, el ring y read_frame().
+    """
+
+    def __init__(
+        self,
+        url: str,
+        reconnect_attempts: int = 3,
+        ring_slots: int = 0,
+        fps: float = 0.0,
+        width: int = 0,
+        height: int = 0,
+        keyframes_only: bool = False,
+        hwaccel: str = "",
+        ffmpeg_bin: str = "ffmpeg",
+    ):
+        super().__init__(url, reconnect_attempts=reconnect_attempts, ring_slots=ring_slots)
+        self.fps = fps
+        self.width = max(0, int(width))
+        self.height = max(0, int(height))
+        self.keyframes_only = keyframes_only
+        self.hwaccel = hwaccel
+        self.ffmpeg_bin = ffmpeg_bin
+        self.proc: Optional[subprocess.Popen] = None
+        self.frame_shape: Optional[Tuple[int, int, int]] = None
+
+    # ----- conexión -----
+    def connect(self) -> None:
+        if shutil.which(self.ffmpeg_bin) is None:
+            raise ConnectionError(f"No se encontró el binario de ffmpeg: {self.ffmpeg_bin}")
+        self.frame_shape = self._output_shape()
+        self._spawn()
+        if self.ring_slots > 0:
+            self._reset_ring(self.frame_shape, np.uint8)
+
+        logger.info(f"Conectado al stream (ffmpeg): {self.url} salida={self.frame_shape[1]}x{self.frame_shape[0]}")
+        self._handoff.reopen()
+        self._running = True
+        self._thread = threading.Thread(target=self._update_frames, daemon=True)
+        self._thread.start()
+
+    def _build_command(self) -> List[str]:
+        cmd = [self.ffmpeg_bin, "-hide_banner", "-loglevel", "error", "-nostdin"]
+        if isinstance(self.url, str) and self.url.startswith("rtsp://"):
+            cmd += ["-rtsp_transport", "tcp"]
+        if self.hwaccel:
+            cmd += ["-hwaccel", self.hwaccel]
+        if self.keyframes_only:
+            cmd += ["-skip_frame", "nokey"]
+        cmd += ["-i", self.url, "-an"]
+
+        filters = []
+        if self.fps > 0:
+            filters.append(f"fps={self.fps:g}")
+        h, w = self.frame_shape[:2]
+        if self.width or self.height:
+            filters.append(f"scale={w}:{h}")
+        if filters:
+            cmd += ["-vf", ",".join(filters)]
+        if self.keyframes_only:
+            # sin esto ffmpeg duplica el último I-frame para mantener el fps de salida
+            cmd += list(_passthrough_args(self.ffmpeg_bin))
+        cmd += ["-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
+        return cmd
+
+    def _spawn(self) -> None:
+        cmd = self._build_command()
+        logger.debug("ffmpeg: %s", " ".join(cmd))
+        frame_bytes = int(np.prod(self.frame_shape))
+        self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=frame_bytes)
+
+    def _output_shape(self) -> Tuple[int, int, int]:
+        """(alto, ancho, 3) de la salida; se consulta ffprobe si falta alguna dimensión."""
+        w, h = self.width, self.height
+        if not (w and h):
+            src_w, src_h = self._probe_size()
+            if w:
+                h = int(round(src_h * w / src_w / 2.0)) * 2
+            elif h:
+                w = int(round(src_w * h / src_h / 2.0)) * 2
+            else:
+                w, h = src_w, src_h
+        return h, w, 3
+
+    def _probe_size(self) -> Tuple[int, int]:
+        ffprobe = shutil.which("ffprobe")
+        if ffprobe is None:
+            raise ConnectionError("ffprobe no disponible: define CAMERA_INGEST_WIDTH y CAMERA_INGEST_HEIGHT")
+        out = subprocess.run(
+            [ffprobe, "-v", "error", "-select_streams", "v:0", "-show_entries", "stream=width,height", "-of", "json", self.url],
+            capture_output=True, timeout=15, check=False,
+        )
+        try:
+            stream = json.loads(out.stdout or b"{}")["streams"][0]
+            return int(stream["width"]), int(stream["height"])
+        except (KeyError, IndexError, ValueError):
+            raise ConnectionError(f"No se pudo obtener la resolución del stream: {self.url}")
+
+    # ----- lectura -----
+    def _update_frames(self):
+        """Hilo que lee frames completos del pipe y mantiene solo el más reciente."""
+        while self._running:
+            proc = self.proc
+            if proc is None or proc.poll() is not None:
+                if not self._try_reconnect():
+                    time.sleep(1)
+                continue
+
+            handle = self._acquire_slot()
+            frame = handle.array if handle is not None else np.empty(self.frame_shape, dtype=np.uint8)
+            if not self._read_exact(proc, frame):
+                if handle is not None:
+                    handle.release()
+                if self._running:
+                    logger.warning("ffmpeg terminó o cortó el frame, intentando reconectar...")
+                    self._stop_process()
+                continue
+            self._publish(frame, handle)
+
+    @staticmethod
+    def _read_exact(proc: subprocess.Popen, frame: np.ndarray) -> bool:
+        """Llena `frame` con exactamente un frame del pipe; False si el pipe se cerró antes."""
+        view = memoryview(frame.reshape(-1))
+        got, total = 0, len(view)
+        while got < total:
+            try:
+                n = proc.stdout.readinto(view[got:])
+            except (ValueError, OSError):   # pipe cerrado por disconnect()
+                return False
+            if not n:
+                return False
+            got += n
+        return True
+
+    def _try_reconnect(self) -> bool:
+        for attempt in range(1, self.reconnect_attempts + 1):
+            logger.info(f"Reintentando conexión ffmpeg ({attempt}/{self.reconnect_attempts})...")
+            self._stop_process()
+            try:
+                self._spawn()
+            except OSError:
+                logger.exception("No se pudo lanzar ffmpeg")
+                time.sleep(1)
+                continue
+            time.sleep(0.5)
+            if self.proc.poll() is None:
+                logger.info("Reconexión exitosa.")
+                return True
+            time.sleep(1)
+        logger.error("No se pudo reconectar al stream.")
+        return False
+
+    def _stop_process(self) -> None:
+        proc, self.proc = self.proc, None
+        if proc is None:
+            return
+        try:
+            proc.kill()
+            proc.wait(timeout=2.0)
+        except Exception:
+            pass
+        if proc.stdout is not None:
+            proc.stdout.close()
+
+    def disconnect(self) -> None:
+        self._running = False
+        # matar ffmpeg desbloquea el readinto del hilo lector
+        self._stop_process()
+        super().disconnect()
@@ -0,0 +1,108 @@
+# src/infrastructure/Camera/file_camera_stream.py
+import os
+import time
+import logging
+from typing import List, Optional
+
+import cv2
+
+from src.domain.Models.frame import Frame
+from src.domain.Interfaces.camera_stream import ICameraStream
+
+logger = logging.getLogger(__name__)
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+class FileCameraStream(ICameraStream):
+    """
+    ICameraStream que reproduce un archivo de video o un directorio de imágenes
+    (orden alfabético) sin pacing: cada read_frame() devuelve el siguiente frame
+    decodificado, sin hilo de lectura ni descarte de frames.
+
+    Pensado para benchmarks y pruebas offline reproducibles. Al agotarse la
+    fuente read_frame() devuelve None y `exhausted` pasa a True (salvo loop=True).
+    """
+
+    def __init__(self, path: str, loop: bool = False, max_frames: Optional[int] = None):
+        """
+        :param path: Archivo de video o directorio con imágenes.
+        :param loop: Volver al inicio al terminar la fuente.
+        :param max_frames: Máx. frames a entregar (None = todos).
+        """
+        self.path = path
+        self.url = path
+        self.camera_id = None  # puede ser seteado por quien lo construye
+        self.loop = loop
+        self.max_frames = max_frames
+
+        self.cap = None
+        self._images: List[str] = []
+        self._image_idx = 0
+        self.frames_read = 0
+        self.exhausted = False
+
+    def connect(self) -> None:
+        if os.path.isdir(self.path):
+            self._images = sorted(
+                os.path.join(self.path, name) for name in os.listdir(self.path)
+                if name.lower().endswith(IMAGE_EXTENSIONS)
+            )
+            if not self._images:
+                raise ConnectionError(f"No hay imágenes en el directorio: {self.path}")
+            logger.info("FileCameraStream: %d imágenes en %s", len(self._images), self.path)
+        else:
+            self.cap = cv2.VideoCapture(self.path)
+            if not self.cap or not self.cap.isOpened():
+                raise ConnectionError(f"No se pudo abrir el video: {self.path}")
+            logger.info("FileCameraStream: video %s (%d frames)", self.path, int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT)))
+        self.frames_read = 0
+        self.exhausted = False
+
+    def read_frame(self) -> Optional[Frame]:
+        if self.exhausted:
+            return None
+        if self.max_frames is not None and self.frames_read >= self.max_frames:
+            self.exhausted = True
+            return None
+
+        image = self._next_image()
+        if image is None and self.loop and self.frames_read > 0:
+            self._rewind()
+            image = self._next_image()
+        if image is None:
+            self.exhausted = True
+            logger.info("FileCameraStream agotado tras %d frames", self.frames_read)
+            return None
+
+        self.frames_read += 1
+        source = getattr(self, "camera_id", None) or self.path
+        return Frame(data=image, timestamp=time.time(), source=source, sequence=self.frames_read)
+
+    def is_open(self) -> bool:
+        return not self.exhausted
+
+    def _next_image(self):
+        if self.cap is not None:
+            ret, image = self.cap.read()
+            return image if ret else None
+        while self._image_idx < len(self._images):
+            path = self._images[self._image_idx]
+            self._image_idx += 1
+            image = cv2.imread(path)
+            if image is not None:
+                return image
+            logger.warning("No se pudo leer la imagen %s; se omite", path)
+        return None
+
+    def _rewind(self) -> None:
+        if self.cap is not None:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._image_idx = 0
+
+    def disconnect(self) -> None:
+        if self.cap is not None:
+            try:
+                self.cap.release()
+            except Exception:
+                pass
+            self.cap = None
@@ -0,0 +1,87 @@
+# src/infrastructure/Camera/frame_handoff.py
+import time
+import threading
+from typing import Optional
+
+from src.domain.Models.frame import Frame
+
+class FrameHandoff:
+    """
+    Entrega del frame más reciente entre el hilo lector de una cámara y sus
+    consumidores, con una variable de condición en lugar de polling.
+
+    - publish() numera el frame (Frame.sequence, monótono desde 1), lo deja
+      como el más reciente y despierta a quien esté esperando
+    - wait_next(after) bloquea hasta que haya un frame con sequence > after:
+      un consumidor nunca recibe dos veces el mismo frame
+    - los frames intermedios que nadie tomó se pierden (siempre gana el último)
+    - `requested` indica que un consumidor pide un frame más nuevo que el
+      publicado (bloqueado en wait_next o repitiendo en latest): la ingesta
+      bajo demanda convierte el siguiente frame solo entonces
+
+    Referencias (ring de frames): la del productor pasa al frame más reciente;
+    publish() devuelve el frame reemplazado para que el productor lo libere
+    fuera del lock, y cada frame entregado ya viene retenido para el consumidor.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._latest: Optional[Frame] = None
+        self._sequence = 0
+        self._closed = False
+        self._delivered = False   # el frame más reciente ya fue entregado a un consumidor
+        self.requested = True     # algún consumidor pide un frame posterior al publicado
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def publish(self, frame: Frame) -> Optional[Frame]:
+        with self._cond:
+            self._sequence += 1
+            frame.sequence = self._sequence
+            old, self._latest = self._latest, frame
+            self._delivered = False
+            self.requested = False
+            self._cond.notify_all()
+        return old
+
+    def latest(self) -> Optional[Frame]:
+        """Frame más reciente (retenido) sin esperar; puede repetirse entre llamadas."""
+        with self._cond:
+            if self._delivered:
+                self.requested = True   # repetición: el siguiente frame ya tiene quien lo pida
+            return self._take()
+
+    def wait_next(self, after: int, timeout: Optional[float] = None) -> Optional[Frame]:
+        """Primer frame con sequence > after (retenido), o None si vence el timeout o se cerró."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while not self._closed and self._sequence <= after:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.requested = True
+                self._cond.wait(remaining)
+            if self._closed:
+                return None
+            return self._take()
+
+    def _take(self) -> Optional[Frame]:
+        frame = self._latest
+        if frame is not None:
+            frame.retain()
+            self._delivered = True
+        return frame
+
+    def close(self) -> Optional[Frame]:
+        """Despierta a los consumidores y devuelve el último frame para liberarlo."""
+        with self._cond:
+            self._closed = True
+            latest, self._latest = self._latest, None
+            self._cond.notify_all()
+        return latest
+
+    def reopen(self) -> None:
+        with self._cond:
+            self._closed = False
@@ -5,6 +5,8 @@ import logging
 import threading
 from src.domain.Models.frame import Frame
 from src.domain.Interfaces.camera_stream import ICameraStream
+from src.infrastructure.Camera.shared_frame_ring import SharedFrameRing
+from src.infrastructure.Camera.frame_handoff import FrameHandoff
 
 logger = logging.getLogger(__name__)
 
@@ -12,13 +14,28 @@ class OpenCVCameraStream(ICameraStream):
     """
     Implementación de ICameraStream usando OpenCV con lectura en hilo separado.
     Source en Frame será camera_id si está disponible, si no la URL.
+
+    Modos de ingesta:
+    - "read": cap.read() de cada frame (decodifica y convierte a BGR todos)
+    - "grab": cap.grab() de cada frame para no atrasarse con el stream y
+      cap.retrieve() (conversión a BGR + copia) solo de los muestreados: a
+      `ingest_fps` si es > 0, o bajo demanda: el primer frame capturado
+      después de que un consumidor pida uno nuevo (el frame entregado tiene a
+      lo sumo un intervalo del stream de antigüedad; a cambio el consumidor
+      espera ese intervalo más el retrieve en cada frame)
     """
 
-    def __init__(self, url: str, reconnect_attempts: int = 3, fps_limit: float = 0.0):
+    INGEST_MODES = ("read", "grab")
+
+    def __init__(self, url: str, reconnect_attempts: int = 3, fps_limit: float = 0.0, ring_slots: int = 0,
+                 ingest: str = "read", ingest_fps: float = 0.0):
         """
         :param url: URL del stream (RTSP/HTTP/archivo).
         :param reconnect_attempts: Número de intentos de reconexión antes de fallar.
         :param fps_limit: Máx FPS (0 = ilimitado).
+        :param ring_slots: Slots del ring de memoria compartida donde se decodifica (0 = un array nuevo por frame).
+        :param ingest: "read" (todos los frames) | "grab" (retrieve solo de los muestreados).
+        :param ingest_fps: En modo "grab", frames/seg a convertir (0 = al pedirlo el consumidor).
         """
         self.url = url
         self.camera_id = None  # puede ser setiado por la factory (create_camera_stream)
@@ -27,12 +44,23 @@ class OpenCVCameraStream(ICameraStream):
         self.fps_limit = fps_limit
         self._last_frame_time = 0.0
 
-        # variables para thread
-        self._frame_lock = threading.Lock()
-        self._latest_frame = None
+        # variables para thread: el frame más reciente se entrega por variable de condición
+        self._handoff = FrameHandoff()
+        self._last_sequence = 0   # último frame entregado por wait_next_frame()
         self._running = False
         self._thread = None
 
+        # ring de frames preasignado (se crea con la forma del primer frame)
+        self.ring_slots = max(0, int(ring_slots))
+        self._ring = None
+        self._ring_full_logged = False
+
+        if ingest not in self.INGEST_MODES:
+            raise ValueError(f"Modo de ingesta no soportado: {ingest} (usa {', '.join(self.INGEST_MODES)})")
+        self.ingest = ingest
+        self.ingest_interval = 1.0 / ingest_fps if ingest_fps > 0 else 0.0
+        self._last_retrieve = 0.0
+
     def connect(self) -> None:
         self.cap = cv2.VideoCapture(self.url, cv2.CAP_FFMPEG)
 
@@ -50,6 +78,7 @@ class OpenCVCameraStream(ICameraStream):
         logger.info(f"Conectado al stream: {self.url}")
 
         # Lanzar thread de lectura
+        self._handoff.reopen()
         self._running = True
         self._thread = threading.Thread(target=self._update_frames, daemon=True)
         self._thread.start()
@@ -62,35 +91,123 @@ class OpenCVCameraStream(ICameraStream):
                     time.sleep(1)
                 continue
 
-            ret, frame = self.cap.read()
+            if self.ingest == "grab":
+                # avanzar el stream sin convertir; retrieve solo si este frame se muestrea
+                if not self.cap.grab():
+                    logger.warning("Error al leer frame, intentando reconectar...")
+                    if not self._try_reconnect():
+                        time.sleep(1)
+                    continue
+                if not self._should_retrieve():
+                    continue
+                self._last_retrieve = time.monotonic()
+
+            handle = self._acquire_slot()
+            if handle is not None:
+                # decodificar en el slot, sin asignar un array nuevo
+                ret, frame = self._decode(image=handle.array)
+            else:
+                ret, frame = self._decode()
             if not ret:
+                if handle is not None:
+                    handle.release()
                 logger.warning("Error al leer frame, intentando reconectar...")
                 if not self._try_reconnect():
                     time.sleep(1)
                 continue
 
-            # source preferencial: camera_id si existe, si no la URL
-            source = getattr(self, "camera_id", None) or self.url
-            with self._frame_lock:
-                self._latest_frame = Frame(data=frame, timestamp=time.time(), source=source)
+            if handle is not None and frame is not handle.array:
+                # OpenCV reasignó el buffer (cambió la resolución): soltar el slot y rehacer el ring
+                handle.release()
+                handle = None
+            if handle is None and self.ring_slots > 0 and (self._ring is None or not self._ring.matches(frame.shape, frame.dtype)):
+                self._reset_ring(frame.shape, frame.dtype)
+
+            self._publish(frame, handle)
+
+    def _decode(self, image=None):
+        if self.ingest == "grab":
+            return self.cap.retrieve(image=image) if image is not None else self.cap.retrieve()
+        return self.cap.read(image=image) if image is not None else self.cap.read()
+
+    def _should_retrieve(self) -> bool:
+        if self.ingest_interval > 0:
+            return time.monotonic() - self._last_retrieve >= self.ingest_interval
+        return self._handoff.requested
+
+    def _publish(self, frame, handle=None) -> None:
+        """Reemplaza el frame más reciente por `frame` (la referencia del productor pasa al nuevo)."""
+        # source preferencial: camera_id si existe, si no la URL
+        source = getattr(self, "camera_id", None) or self.url
+        old = self._handoff.publish(Frame(data=frame, timestamp=time.time(), source=source, handle=handle))
+        if old is not None:
+            old.release()
+
+    def _acquire_slot(self):
+        """Slot libre del ring o None (ring deshabilitado, aún sin crear o todos retenidos)."""
+        ring = self._ring
+        if ring is None:
+            return None
+        handle = ring.acquire()
+        if handle is None and not self._ring_full_logged:
+            # se avisa una vez por ring: suele indicar consumidores que no liberan o un ring pequeño
+            logger.warning("Ring de frames sin slots libres (%d retenidos); usando arrays propios", ring.slots)
+            self._ring_full_logged = True
+        return handle
+
+    def _reset_ring(self, shape, dtype) -> None:
+        old = self._ring
+        self._ring_full_logged = False
+        try:
+            self._ring = SharedFrameRing(self.ring_slots, shape, dtype)
+        except Exception:
+            logger.exception("No se pudo crear el ring de frames; se continúa sin ring")
+            self._ring = None
+            self.ring_slots = 0
+        if old is not None:
+            old.close()  # diferido si aún hay frames retenidos
 
     def read_frame(self):
-        """ Devuelve el último frame disponible respetando el fps_limit """
+        """
+        Devuelve el último frame disponible respetando el fps_limit.
+        Si el frame vive en el ring, el llamador recibe una referencia y debe
+        llamar a frame.release() al terminar con él.
+        """
         if self.fps_limit > 0:
             elapsed = time.time() - self._last_frame_time
             min_interval = 1.0 / self.fps_limit
             if elapsed < min_interval:
                 return None
 
-        with self._frame_lock:
-            frame = self._latest_frame
+        frame = self._handoff.latest()
+        if frame is None:
+            return None
 
+        self._last_frame_time = time.time()
+        return frame
+
+    def wait_next_frame(self, timeout=None):
+        """
+        Bloquea hasta que el hilo lector publique un frame posterior al último
+        entregado (sin polling ni duplicados). Respeta fps_limit. Mismo contrato
+        de referencias que read_frame().
+        """
+        if self.fps_limit > 0:
+            wait = self._last_frame_time + 1.0 / self.fps_limit - time.time()
+            if wait > 0:
+                time.sleep(wait)
+
+        frame = self._handoff.wait_next(self._last_sequence, timeout)
         if frame is None:
             return None
 
+        self._last_sequence = frame.sequence
         self._last_frame_time = time.time()
         return frame
 
+    def is_open(self) -> bool:
+        return self._running
+
     def _try_reconnect(self) -> bool:
         """ Intenta reconectar al stream """
         for attempt in range(1, self.reconnect_attempts + 1):
@@ -122,6 +239,12 @@ class OpenCVCameraStream(ICameraStream):
             except Exception:
                 pass
             self.cap = None
+        latest = self._handoff.close()
+        if latest is not None:
+            latest.release()
+        if self._ring is not None:
+            self._ring.close()
+            self._ring = None
         logger.info("🔌 Stream cerrado.")
 
     def __enter__(self):
@@ -5,6 +5,7 @@ import numpy as np
 
 from src.domain.Models.frame import Frame
 from src.domain.Interfaces.camera_stream import ICameraStream
+from src.infrastructure.Camera.frame_handoff import FrameHandoff
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +40,9 @@ class Picamera2CameraStream(ICameraStream):
         self.vflip = vflip
 
         self._last_frame_time = 0.0
-        self._frame_lock = threading.Lock()
-        self._latest_frame = None
+        # el frame más reciente se entrega por variable de condición (sin polling)
+        self._handoff = FrameHandoff()
+        self._last_sequence = 0
         self._running = False
         self._thread = None
 
@@ -88,6 +90,7 @@ class Picamera2CameraStream(ICameraStream):
         logger.info(f"📷 Picamera2 iniciada {self.resolution}@{self.fps}fps, denoise={self.denoise}")
 
         # Hilo lector (siempre último frame)
+        self._handoff.reopen()
         self._running = True
         self._thread = threading.Thread(target=self._update_frames, daemon=True)
         self._thread.start()
@@ -103,11 +106,11 @@ class Picamera2CameraStream(ICameraStream):
 
             now = time.time()
 
-            with self._frame_lock:
-                # Puedes aplicar post-proceso ligero aquí si lo deseas:
-                # p.ej., brillo/contraste/afilar con OpenCV
-                # (lo dejo crudo para latencia mínima)
-                self._latest_frame = Frame(data=frame, timestamp=now, source="picamera2")
+            # Puedes aplicar post-proceso ligero aquí si lo deseas:
+            # p.ej., brillo/contraste/afilar con OpenCV
+            # (lo dejo crudo para latencia mínima)
+            source = getattr(self, "camera_id", None) or "picamera2"
+            self._handoff.publish(Frame(data=frame, timestamp=now, source=source))
 
     def read_frame(self) -> Frame | None:
         if self.fps_limit > 0:
@@ -116,17 +119,34 @@ class Picamera2CameraStream(ICameraStream):
             if elapsed < min_interval:
                 return None
 
-        with self._frame_lock:
-            frame = self._latest_frame
+        frame = self._handoff.latest()
+        if frame is None:
+            return None
+
+        self._last_frame_time = time.time()
+        return frame
+
+    def wait_next_frame(self, timeout: float | None = None) -> Frame | None:
+        """Bloquea hasta el siguiente frame capturado (sin polling ni duplicados)."""
+        if self.fps_limit > 0:
+            wait = self._last_frame_time + 1.0 / self.fps_limit - time.time()
+            if wait > 0:
+                time.sleep(wait)
 
+        frame = self._handoff.wait_next(self._last_sequence, timeout)
         if frame is None:
             return None
 
+        self._last_sequence = frame.sequence
         self._last_frame_time = time.time()
         return frame
 
+    def is_open(self) -> bool:
+        return self._running
+
     def disconnect(self) -> None:
         self._running = False
+        self._handoff.close()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=2.0)
 
@@ -0,0 +1,146 @@
+# src/infrastructure/Camera/shared_frame_ring.py
+"""
+Ring buffer de frames preasignado en memoria compartida.
+
+Un único segmento (multiprocessing.shared_memory) dividido en N slots de forma
+fija; el thread de captura decodifica directamente en el slot
+(cap.read(image=slot)) y el Frame resultante solo envuelve una vista del slot,
+sin asignar ~6 MB por frame a 1080p.
+
+Cada slot lleva un contador de referencias (en el proceso dueño del ring):
+- acquire() entrega un slot libre con ref=1 (la referencia del productor)
+- cada consumidor que retiene el frame suma una referencia y la libera al terminar
+- un slot solo se reescribe cuando su contador vuelve a 0
+
+Otros procesos pueden leer el slot adjuntando el segmento por nombre
+(FrameSlotHandle.descriptor: nombre + offset); mientras la tarea está en vuelo
+el proceso dueño mantiene la referencia, así el slot no se pisa.
+"""
+import logging
+import threading
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class FrameSlotHandle:
+    """Referencia liviana a un slot del ring (índice + vista numpy)."""
+
+    __slots__ = ("ring", "index", "array")
+
+    def __init__(self, ring: "SharedFrameRing", index: int, array: np.ndarray):
+        self.ring = ring
+        self.index = index
+        self.array = array
+
+    def retain(self) -> "FrameSlotHandle":
+        self.ring._retain(self.index)
+        return self
+
+    def release(self) -> None:
+        self.ring._release(self.index)
+
+    @property
+    def descriptor(self) -> Tuple[str, int]:
+        """(nombre del segmento, offset en bytes) para adjuntar el slot desde otro proceso."""
+        return self.ring.name, self.index * self.ring.frame_bytes
+
+
+class SharedFrameRing:
+    """
+    Ring de `slots` frames de forma `shape`/`dtype` en memoria compartida.
+    """
+
+    def __init__(self, slots: int, shape: Tuple[int, ...], dtype=np.uint8):
+        if slots <= 0:
+            raise ValueError("SharedFrameRing requiere al menos un slot")
+        self.slots = slots
+        self.shape = tuple(int(s) for s in shape)
+        self.dtype = np.dtype(dtype)
+        self.frame_bytes = int(np.prod(self.shape)) * self.dtype.itemsize
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(1, slots * self.frame_bytes))
+        self.name = self._shm.name
+        self._arrays: List[np.ndarray] = [
+            np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf, offset=i * self.frame_bytes)
+            for i in range(slots)
+        ]
+        self._refs = [0] * slots
+        self._next = 0
+        self._lock = threading.Lock()
+        self._closing = False
+        self._closed = False
+        logger.info("SharedFrameRing creado: slots=%d shape=%s (%.1f MB)", slots, self.shape, slots * self.frame_bytes / 1e6)
+
+    def matches(self, shape: Tuple[int, ...], dtype) -> bool:
+        return tuple(shape) == self.shape and np.dtype(dtype) == self.dtype
+
+    def acquire(self) -> Optional[FrameSlotHandle]:
+        """
+        Reserva el siguiente slot libre (round-robin) con ref=1.
+        Devuelve None si todos los slots siguen retenidos por consumidores.
+        """
+        with self._lock:
+            if self._closing:
+                return None
+            for step in range(self.slots):
+                idx = (self._next + step) % self.slots
+                if self._refs[idx] == 0:
+                    self._refs[idx] = 1
+                    self._next = (idx + 1) % self.slots
+                    return FrameSlotHandle(self, idx, self._arrays[idx])
+        return None
+
+    def in_use(self) -> int:
+        """Slots retenidos actualmente."""
+        with self._lock:
+            return sum(1 for r in self._refs if r > 0)
+
+    def close(self) -> None:
+        """
+        Libera el segmento. Si quedan slots retenidos, el cierre se difiere
+        hasta que el último consumidor suelte su referencia.
+        """
+        with self._lock:
+            self._closing = True
+            if any(self._refs):
+                return
+        self._destroy()
+
+    # ----- internos -----
+    def _retain(self, idx: int) -> None:
+        with self._lock:
+            self._refs[idx] += 1
+
+    def _release(self, idx: int) -> None:
+        with self._lock:
+            if self._refs[idx] <= 0:
+                logger.warning("SharedFrameRing: release de slot %d sin referencias", idx)
+                return
+            self._refs[idx] -= 1
+            destroy = self._closing and not any(self._refs)
+        if destroy:
+            self._destroy()
+
+    def _destroy(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._arrays = []
+        try:
+            self._shm.close()
+        except BufferError:
+            # quedan vistas numpy vivas (Frames ya liberados); el mmap se libera con ellas
+            pass
+        except Exception:
+            logger.exception("Error cerrando SharedFrameRing %s", self.name)
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception:
+            logger.exception("Error eliminando SharedFrameRing %s", self.name)
@@ -0,0 +1,14 @@
+from src.core.config import settings
+from src.domain.Interfaces.deduplicator import IDeduplicator
+from src.domain.Interfaces.text_normalizer import ITextNormalizer
+from src.domain.Services.deduplicator_service import DeduplicatorService
+
+def create_deduplicator(normalizer: ITextNormalizer) -> IDeduplicator:
+    backend = settings.dedup_backend.lower()
+    if backend == "redis":
+        # Ventana compartida entre nodos y reinicios (llaves con TTL en REDIS_URL)
+        from src.infrastructure.Deduplication.redis_deduplicator import RedisDeduplicator
+        return RedisDeduplicator(normalizer=normalizer, ttl=settings.dedup_ttl)
+    else:
+        # En memoria del proceso (por cámara)
+        return DeduplicatorService(normalizer=normalizer, ttl=settings.dedup_ttl)
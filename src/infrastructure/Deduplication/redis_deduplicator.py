@@ -0,0 +1,143 @@
+# src/infrastructure/Deduplication/redis_deduplicator.py
+from __future__ import annotations
+import time
+import socket
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from src.domain.Interfaces.deduplicator import IDeduplicator
+from src.domain.Interfaces.text_normalizer import ITextNormalizer
+from src.domain.Services.deduplicator_service import DeduplicatorService
+from src.core.config import settings
+from src.core.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+DEDUP_LOOKUPS = registry.counter("anpr_dedup_redis_lookups_total", "Decisiones de dedup por origen (near_cache, redis, fallback)", ("source",))
+DEDUP_REDIS_LATENCY = registry.histogram("anpr_dedup_redis_seconds", "Latencia del check-and-set en Redis")
+
+# Check-and-set atómico en un solo round-trip:
+# - la llave no existe -> se crea con TTL y la lectura es nueva (0)
+# - la llave existe    -> se renueva el TTL (ventana deslizante) y es duplicada (1)
+_CHECK_AND_SET = """
+if redis.call('SET', KEYS[1], ARGV[2], 'NX', 'PX', ARGV[1]) then
+    return 0
+end
+redis.call('PEXPIRE', KEYS[1], ARGV[1])
+return 1
+"""
+
+class RedisDeduplicator(IDeduplicator):
+    """
+    IDeduplicator compartido entre nodos/reinicios: las llaves viven en Redis
+    con TTL nativo (PX) en lugar de en memoria del proceso.
+
+    - llave: {prefix}:{camera_id}:{texto normalizado}. El track_id no forma
+      parte de la llave: los ids de ByteTrack son locales al proceso (otro
+      nodo o un reinicio asignan ids distintos al mismo vehículo)
+    - una decisión = un EVALSHA del script de check-and-set (TTL deslizante,
+      misma semántica que DeduplicatorService)
+    - near-cache LRU local delante de Redis: una llave vista hace menos de
+      `near_cache_ttl` segundos se resuelve como duplicada sin red. Se acota
+      a una fracción del TTL para que Redis siga renovando la ventana mientras
+      la placa sigue a la vista
+    - si Redis falla se degrada a un DeduplicatorService en memoria y se
+      reintenta Redis cada `retry_interval` segundos
+
+    El cliente es inyectable (redis.Redis, fakeredis, ...): solo se usa
+    register_script().
+    """
+
+    def __init__(
+        self,
+        normalizer: ITextNormalizer,
+        ttl: Optional[float] = None,
+        client=None,
+        url: Optional[str] = None,
+        key_prefix: Optional[str] = None,
+        near_cache_size: Optional[int] = None,
+        near_cache_ttl: Optional[float] = None,
+        retry_interval: Optional[float] = None,
+    ):
+        self.normalizer = normalizer
+        self.ttl = ttl if ttl is not None else getattr(settings, "dedup_ttl", 3.0)
+        self.key_prefix = key_prefix if key_prefix is not None else getattr(settings, "dedup_redis_prefix", "anpr:dedup")
+        self.near_cache_size = max(0, near_cache_size if near_cache_size is not None else getattr(settings, "dedup_near_cache_size", 4096))
+        near_ttl = near_cache_ttl if near_cache_ttl is not None else getattr(settings, "dedup_near_cache_ttl", 1.0)
+        self.near_cache_ttl = max(0.0, min(near_ttl, self.ttl / 2.0))
+        self.retry_interval = retry_interval if retry_interval is not None else getattr(settings, "dedup_redis_retry_interval", 5.0)
+
+        if client is None:
+            import redis
+            timeout = getattr(settings, "dedup_redis_timeout", 0.2)
+            client = redis.Redis.from_url(url or settings.redis_url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        self.client = client
+        self._script = client.register_script(_CHECK_AND_SET)
+        self._owner = socket.gethostname()
+
+        self._near: "OrderedDict[str, float]" = OrderedDict()   # llave -> instante (monotonic) en que deja de valer
+        self._near_lock = threading.Lock()
+        self._fallback = DeduplicatorService(normalizer=normalizer, ttl=self.ttl)
+        self._redis_down_until = 0.0
+
+    def is_duplicate(self, track_id: Optional[int], plate_text: str, camera_id: Optional[str] = None) -> bool:
+        text_norm = self.normalizer.normalize(plate_text)
+        if not text_norm:
+            # texto inválido según la política de normalización -> no publicar
+            return True
+
+        key = f"{self.key_prefix}:{camera_id or 'default'}:{text_norm}"
+        now = time.monotonic()
+        if self._near_hit(key, now):
+            DEDUP_LOOKUPS.labels(source="near_cache").inc()
+            return True
+
+        if now < self._redis_down_until:
+            DEDUP_LOOKUPS.labels(source="fallback").inc()
+            return self._fallback.is_duplicate(None, text_norm, camera_id)
+
+        t0 = time.perf_counter()
+        try:
+            duplicate = bool(int(self._script(keys=[key], args=[max(1, int(self.ttl * 1000)), self._owner])))
+        except Exception:
+            logger.exception("Redis no disponible para dedup; se usa dedup local %.0fs", self.retry_interval)
+            self._redis_down_until = now + self.retry_interval
+            DEDUP_LOOKUPS.labels(source="fallback").inc()
+            return self._fallback.is_duplicate(None, text_norm, camera_id)
+        DEDUP_REDIS_LATENCY.observe(time.perf_counter() - t0)
+        DEDUP_LOOKUPS.labels(source="redis").inc()
+
+        # vista o recién registrada: en ambos casos la próxima lectura cercana es duplicada
+        self._near_put(key, now + self.near_cache_ttl)
+        return duplicate
+
+    # ----- near-cache -----
+    def _near_hit(self, key: str, now: float) -> bool:
+        if not self.near_cache_size:
+            return False
+        with self._near_lock:
+            until = self._near.get(key)
+            if until is None:
+                return False
+            if now >= until:
+                del self._near[key]
+                return False
+            self._near.move_to_end(key)
+            return True
+
+    def _near_put(self, key: str, until: float) -> None:
+        if not self.near_cache_size or self.near_cache_ttl <= 0:
+            return
+        with self._near_lock:
+            self._near[key] = until
+            self._near.move_to_end(key)
+            while len(self._near) > self.near_cache_size:
+                self._near.popitem(last=False)
+
+    # utilidad para tests / operativa: limpiar estado local (las llaves de Redis expiran solas)
+    def clear(self) -> None:
+        with self._near_lock:
+            self._near.clear()
+        self._fallback.clear()
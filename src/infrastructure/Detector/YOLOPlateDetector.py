@@ -21,16 +21,30 @@ class YOLOPlateDetector(IPlateDetector):
         """
         Detecta placas en un frame dado y devuelve una lista de Plate.
         """
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        """
+        Detecta placas en varios frames con una sola llamada a predict
+        (Ultralytics acepta una lista de imágenes como un batch).
+        """
+        if not frames:
+            return []
+
         results = self.model.predict(
-            source=frame.data,
+            source=[frame.data for frame in frames],
             conf=self.conf_threshold,
             iou=self.iou_threshold,
             verbose=False
         )
 
+        return [self._to_plates(r) for r in results]
+
+    def _to_plates(self, result) -> List[Plate]:
+        """Convierte un Results de Ultralytics en List[Plate]."""
         plates: List[Plate] = []
 
-        for r in results[0].boxes:
+        for r in result.boxes:
             conf = float(r.conf[0])
             if conf < self.conf_threshold:
                 continue  # descartar detecciones poco confiables
@@ -1,8 +1,8 @@
 import random
 from typing import List
-from domain.Models.frame import Frame
-from domain.Models.plate import Plate
-from domain.Interfaces.plate_detector import IPlateDetector
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+from src.domain.Interfaces.plate_detector import IPlateDetector
 
 class DummyPlateDetector(IPlateDetector):
     """
@@ -2,9 +2,14 @@ from src.core.config import settings
 from src.domain.Interfaces.plate_detector import IPlateDetector
 
 def create_plate_detector() -> IPlateDetector:
-    if settings.yolo_version.lower() == "v5":
+    version = settings.yolo_version.lower()
+    if version == "v5":
         from src.infrastructure.Detector.yolov5_plate_detector import YoloV5PlateDetector
         return YoloV5PlateDetector()
+    elif version == "onnx":
+        # Grafo ONNX exportado (v5 u v8) sobre ONNX Runtime, sin torch
+        from src.infrastructure.Detector.onnx_plate_detector import OnnxPlateDetector
+        return OnnxPlateDetector()
     else:
         # Implementación actual de v8
         from src.infrastructure.Detector.YOLOPlateDetector import YOLOPlateDetector
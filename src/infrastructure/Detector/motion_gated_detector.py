@@ -0,0 +1,224 @@
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import cv2
+
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+from src.domain.Interfaces.plate_detector import IPlateDetector
+from src.core.config import settings
+from src.core.metrics import registry
+
+from loguru import logger
+
+GATE_FRAMES = registry.counter("anpr_motion_gate_frames_total", "Frames evaluados por el gate de movimiento por decisión (detected, skipped)", ("camera", "decision"))
+GATE_SKIP_RATIO = registry.gauge("anpr_motion_gate_skip_ratio", "Fracción de frames sin inferencia por escena estática", ("camera",))
+
+Polygon = Sequence[Sequence[int]]
+
+
+@dataclass
+class _CameraGate:
+    polygons: List[np.ndarray] = field(default_factory=list)
+    rect: Optional[Tuple[int, int, int, int]] = None      # (x1, y1, x2, y2) de la ROI en la resolución actual
+    shape: Optional[Tuple[int, int]] = None
+    mask_small: Optional[np.ndarray] = None               # máscara de la ROI en la escala reducida
+    background: Optional[np.ndarray] = None               # fondo promedio (float32, escala reducida)
+    last_motion: float = 0.0
+    last_detect: float = 0.0
+    # última detección (confianza, bbox en coordenadas del frame): se repite en frames sin movimiento
+    last_plates: List[Tuple[float, tuple]] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+class MotionGatedDetector(IPlateDetector):
+    """
+    Wrapper de IPlateDetector que evita la inferencia en escenas estáticas.
+
+    Por cámara (frame.source):
+    - ROI opcional (uno o más polígonos): el detector solo ve el rectángulo
+      que los contiene y se descartan detecciones con centro fuera de ellos
+    - detector de movimiento barato: la ROI reducida a `downscale_width` px,
+      en gris y suavizada, se compara contra un fondo promedio
+      (accumulateWeighted); hay movimiento si cambia más de `min_area` de la ROI
+    - tras un movimiento se sigue detectando `hold_seconds` (vehículo detenido
+      en la barrera) y, aunque no haya movimiento, se fuerza una detección cada
+      `keepalive_seconds`
+    - frames sin movimiento no llaman al detector: repiten las cajas de la
+      última detección de la cámara (la escena no cambió). Así un vehículo
+      detenido conserva su track (tracker, planificador OCR y dedup no lo
+      olvidan entre keepalives) y no se vuelve a publicar como nuevo
+    """
+
+    def __init__(
+        self,
+        inner: IPlateDetector,
+        rois: Optional[Dict[str, List[Polygon]]] = None,
+        downscale_width: Optional[int] = None,
+        pixel_threshold: Optional[int] = None,
+        min_area: Optional[float] = None,
+        bg_alpha: Optional[float] = None,
+        hold_seconds: Optional[float] = None,
+        keepalive_seconds: Optional[float] = None,
+    ):
+        self.inner = inner
+        self.downscale_width = max(16, downscale_width if downscale_width is not None else getattr(settings, "motion_downscale_width", 160))
+        self.pixel_threshold = pixel_threshold if pixel_threshold is not None else getattr(settings, "motion_pixel_threshold", 25)
+        self.min_area = min_area if min_area is not None else getattr(settings, "motion_min_area", 0.002)
+        self.bg_alpha = bg_alpha if bg_alpha is not None else getattr(settings, "motion_bg_alpha", 0.05)
+        self.hold_seconds = hold_seconds if hold_seconds is not None else getattr(settings, "motion_hold_seconds", 1.5)
+        self.keepalive_seconds = keepalive_seconds if keepalive_seconds is not None else getattr(settings, "motion_keepalive_seconds", 5.0)
+
+        self._gates: Dict[str, _CameraGate] = {}
+        self._gates_lock = threading.Lock()
+        for camera_id, polygons in (rois or {}).items():
+            self.set_roi(camera_id, polygons)
+
+    # ----- configuración -----
+    def set_roi(self, camera_id: str, polygons: Optional[List[Polygon]]) -> None:
+        """ROI de la cámara: lista de polígonos [[x, y], ...] en coordenadas del frame (None/[] = frame completo)."""
+        gate = self._gate(str(camera_id))
+        with gate.lock:
+            gate.polygons = [np.asarray(p, dtype=np.int32).reshape(-1, 2) for p in (polygons or []) if len(p) >= 3]
+            gate.rect = gate.shape = gate.mask_small = gate.background = None
+            gate.last_plates = []
+        logger.info(f"[MotionGate] camera_id={camera_id} ROI con {len(gate.polygons)} polígono(s)")
+
+    # ----- IPlateDetector -----
+    def detect(self, frame: Frame) -> List[Plate]:
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        outputs: List[List[Plate]] = [[] for _ in frames]
+        crops: List[Frame] = []
+        targets: List[Tuple[int, _CameraGate]] = []
+
+        for i, frame in enumerate(frames):
+            if frame is None or frame.data is None or frame.data.size == 0:
+                continue
+            camera_id = str(getattr(frame, "source", None) or "default")
+            gate = self._gate(camera_id)
+            if not self._should_detect(gate, frame):
+                GATE_FRAMES.labels(camera=camera_id, decision="skipped").inc()
+                outputs[i] = self._replay(gate)
+                continue
+            GATE_FRAMES.labels(camera=camera_id, decision="detected").inc()
+            x1, y1, x2, y2 = gate.rect
+            crop = frame.data if (x1, y1, x2, y2) == (0, 0, frame.data.shape[1], frame.data.shape[0]) \
+                else np.ascontiguousarray(frame.data[y1:y2, x1:x2])
+            crops.append(Frame(data=crop, timestamp=frame.timestamp, source=frame.source))
+            targets.append((i, gate))
+
+        if not crops:
+            return outputs
+
+        results = self.inner.detect_batch(crops)
+        for (i, gate), plates in zip(targets, results):
+            outputs[i] = self._to_frame_coords(gate, plates or [])
+            with gate.lock:
+                gate.last_plates = [(p.confidence, tuple(p.bounding_box)) for p in outputs[i]]
+        return outputs
+
+    # ----- internos -----
+    def _gate(self, camera_id: str) -> _CameraGate:
+        gate = self._gates.get(camera_id)
+        if gate is None:
+            with self._gates_lock:
+                gate = self._gates.get(camera_id)
+                if gate is None:
+                    gate = self._gates[camera_id] = _CameraGate()
+                    GATE_SKIP_RATIO.labels(camera=camera_id).set_function(lambda cam=camera_id: self.skip_ratio(cam))
+        return gate
+
+    def skip_ratio(self, camera_id: str) -> float:
+        skipped = GATE_FRAMES.labels(camera=camera_id, decision="skipped").value
+        detected = GATE_FRAMES.labels(camera=camera_id, decision="detected").value
+        total = skipped + detected
+        return skipped / total if total else 0.0
+
+    def _prepare(self, gate: _CameraGate, shape: Tuple[int, int]) -> None:
+        """(Re)calcula rectángulo y máscara reducida de la ROI para la resolución del frame."""
+        h, w = shape
+        if gate.polygons:
+            pts = np.concatenate(gate.polygons)
+            x1, y1 = np.maximum(pts.min(axis=0), 0)
+            x2, y2 = np.minimum(pts.max(axis=0) + 1, [w, h])
+        else:
+            x1, y1, x2, y2 = 0, 0, w, h
+        if x2 <= x1 or y2 <= y1:
+            logger.warning(f"[MotionGate] ROI fuera del frame {w}x{h}; se usa el frame completo")
+            x1, y1, x2, y2 = 0, 0, w, h
+        gate.rect = (int(x1), int(y1), int(x2), int(y2))
+        gate.shape = shape
+
+        scale = min(1.0, self.downscale_width / float(x2 - x1))
+        small_w, small_h = max(1, int((x2 - x1) * scale)), max(1, int((y2 - y1) * scale))
+        mask = np.zeros((small_h, small_w), dtype=np.uint8)
+        if gate.polygons:
+            polys = [((p - [x1, y1]) * scale).astype(np.int32) for p in gate.polygons]
+            cv2.fillPoly(mask, polys, 255)
+        else:
+            mask[:] = 255
+        gate.mask_small = mask
+        gate.background = None
+        gate.last_plates = []
+
+    def _should_detect(self, gate: _CameraGate, frame: Frame) -> bool:
+        now = time.monotonic()
+        with gate.lock:
+            shape = frame.data.shape[:2]
+            if gate.shape != shape:
+                self._prepare(gate, shape)
+
+            x1, y1, x2, y2 = gate.rect
+            mask = gate.mask_small
+            small = cv2.resize(frame.data[y1:y2, x1:x2], (mask.shape[1], mask.shape[0]), interpolation=cv2.INTER_AREA)
+            if small.ndim == 3:
+                small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+            small = cv2.GaussianBlur(small, (5, 5), 0)
+
+            if gate.background is None:
+                # primer frame: inicializar fondo y detectar (estado desconocido)
+                gate.background = small.astype(np.float32)
+                moving = True
+            else:
+                diff = cv2.absdiff(small, cv2.convertScaleAbs(gate.background))
+                changed = np.count_nonzero((diff > self.pixel_threshold) & (mask > 0))
+                moving = changed >= self.min_area * max(1, np.count_nonzero(mask))
+                cv2.accumulateWeighted(small, gate.background, self.bg_alpha)
+
+            if moving:
+                gate.last_motion = now
+            detect = (
+                moving
+                or (now - gate.last_motion) < self.hold_seconds
+                or (now - gate.last_detect) >= self.keepalive_seconds
+            )
+            if detect:
+                gate.last_detect = now
+            return detect
+
+    @staticmethod
+    def _replay(gate: _CameraGate) -> List[Plate]:
+        """Copias nuevas de la última detección (el pipeline muta las Plate: track_id, texto)."""
+        with gate.lock:
+            last = list(gate.last_plates)
+        return [Plate(text="", confidence=conf, bounding_box=box) for conf, box in last]
+
+    @staticmethod
+    def _to_frame_coords(gate: _CameraGate, plates: List[Plate]) -> List[Plate]:
+        """Traslada bboxes del recorte al frame completo y descarta centros fuera de los polígonos."""
+        x1, y1, _, _ = gate.rect
+        out: List[Plate] = []
+        for plate in plates:
+            bx, by, bw, bh = plate.bounding_box
+            plate.bounding_box = (bx + x1, by + y1, bw, bh)
+            if gate.polygons:
+                center = (float(bx + x1 + bw / 2.0), float(by + y1 + bh / 2.0))
+                if not any(cv2.pointPolygonTest(p, center, False) >= 0 for p in gate.polygons):
+                    continue
+            out.append(plate)
+        return out
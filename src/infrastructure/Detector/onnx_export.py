@@ -0,0 +1,55 @@
+"""
+Exporta los pesos .pt del detector a ONNX para OnnxPlateDetector (YOLO_VERSION=onnx).
+
+- v8 (Ultralytics): YOLO(weights).export(format="onnx")
+- v5 (pip yolov5): yolov5.export.run(include=["onnx"])
+
+Se exporta con batch dinámico para aprovechar el micro-batching del servicio.
+
+Uso:
+    python -m src.infrastructure.Detector.onnx_export --weights ./models/best.pt
+    python -m src.infrastructure.Detector.onnx_export --weights ./models/yolov5n-license-plate.pt --arch v5
+"""
+import os
+import shutil
+import argparse
+from typing import Optional
+
+from src.core.config import settings
+
+
+def export_onnx(weights: str, output: Optional[str] = None, arch: str = "v8", imgsz: int = 640, opset: int = 12, dynamic: bool = True) -> str:
+    """Exporta `weights` a ONNX y devuelve la ruta del archivo generado."""
+    if not os.path.isfile(weights):
+        raise FileNotFoundError(f"No se encontraron los pesos: {weights}")
+
+    if arch == "v5":
+        from yolov5 import export as yolov5_export
+        yolov5_export.run(weights=weights, imgsz=(imgsz, imgsz), include=("onnx",), opset=opset, dynamic=dynamic, simplify=True)
+        produced = os.path.splitext(weights)[0] + ".onnx"
+    else:
+        from ultralytics import YOLO
+        produced = YOLO(weights).export(format="onnx", imgsz=imgsz, opset=opset, dynamic=dynamic, simplify=True)
+
+    if output and os.path.abspath(output) != os.path.abspath(produced):
+        shutil.move(produced, output)
+        produced = output
+    return produced
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Exporta el detector YOLO a ONNX")
+    parser.add_argument("--weights", default=settings.model_path, help="Pesos .pt de origen")
+    parser.add_argument("--output", default=settings.onnx_model_path, help="Ruta del .onnx resultante")
+    parser.add_argument("--arch", choices=("v8", "v5"), default="v8")
+    parser.add_argument("--imgsz", type=int, default=settings.onnx_img_size)
+    parser.add_argument("--opset", type=int, default=12)
+    parser.add_argument("--static", action="store_true", help="Batch fijo = 1 (sin ejes dinámicos)")
+    args = parser.parse_args()
+
+    path = export_onnx(args.weights, args.output, args.arch, args.imgsz, args.opset, dynamic=not args.static)
+    print(f"Modelo ONNX exportado en {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -87,23 +87,45 @@ class YoloV5PlateDetector(IPlateDetector):
         """
         Aplica inferencia sobre frame.data (BGR) y devuelve placas normalizadas.
         """
-        if frame is None or frame.data is None or frame.data.size == 0:
-            return []
+        return self.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        """
+        Inferencia en batch: la API de yolov5 acepta una lista de imágenes y
+        ejecuta un único forward pass. Devuelve una lista alineada con `frames`
+        (lista vacía para frames inválidos o si falla la inferencia).
+        """
+        outputs: List[List[Plate]] = [[] for _ in frames]
+        valid = [
+            i for i, frame in enumerate(frames)
+            if frame is not None and frame.data is not None and frame.data.size > 0
+        ]
+        if not valid:
+            return outputs
 
         # La API de yolov5 acepta directamente np.ndarray (BGR o RGB; internamente lo maneja)
         try:
-            results = self.model(frame.data, size=self.imgsz)
+            results = self.model([frames[i].data for i in valid], size=self.imgsz)
         except Exception as e:
             logger.error(f"[YOLOv5] Error en inferencia: {e}")
-            return []
+            return outputs
+
+        for pos, i in enumerate(valid):
+            outputs[i] = self._to_plates(results, pos)
 
+        return outputs
+
+    def _to_plates(self, results, index: int) -> List[Plate]:
+        """
+        Convierte la predicción `index` del batch en List[Plate].
+        """
         # results.pred es una lista de tensores [N,6] -> [x1,y1,x2,y2,conf,cls]
         try:
-            preds = results.pred[0].detach().cpu().numpy()
+            preds = results.pred[index].detach().cpu().numpy()
         except Exception:
-            # Fallback para implementaciones antiguas con .xyxy[0] -> DataFrame
+            # Fallback para implementaciones antiguas con .xyxy[i] -> DataFrame
             try:
-                df = results.pandas().xyxy[0]
+                df = results.pandas().xyxy[index]
                 preds = df[["xmin", "ymin", "xmax", "ymax", "confidence", "class"]].to_numpy()
             except Exception as e:
                 logger.error(f"[YOLOv5] No pude parsear las predicciones: {e}")
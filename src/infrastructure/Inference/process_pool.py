@@ -0,0 +1,536 @@
+# src/infrastructure/Inference/process_pool.py
+"""
+Backend de inferencia multi-proceso (escapa del GIL para detector y OCR).
+
+Cada proceso worker carga su propia réplica del detector y del lector OCR,
+con el número de threads de torch fijado. Los frames viajan por memoria
+compartida (multiprocessing.shared_memory): si el frame ya vive en el ring de
+captura (SharedFrameRing) se envía directamente su slot, sin copiar píxeles;
+si no, el proceso padre lo copia en un slot preasignado. Por la cola solo viaja
+un descriptor pequeño (segmento, offset, shape, dtype). Los resultados
+(List[Plate]) sí se serializan, son pocos bytes. Un slot (o el frame del ring)
+se libera al llegar el resultado de su tarea o al morir la réplica que la
+tomó, nunca por timeout: el hijo aún podría estar leyéndolo.
+
+Una réplica caída se relanza con backoff exponencial (`restart_backoff`,
+duplicando hasta `_MAX_BACKOFF`) y como mucho `max_restarts` veces seguidas;
+agotados los reintentos la réplica queda fallida y, si no queda ninguna, el
+pool se marca fallido (las tareas fallan de inmediato y /live, /ready lo
+reportan vía src.core.status). Mientras no haya réplicas listas /ready falla.
+Límite conocido: una réplica matada (SIGKILL) justo mientras tiene tomado el
+lock de una cola multiprocessing deja esa cola bloqueada: la réplica relanzada
+no llega a estar lista y /ready sigue fallando hasta reiniciar el servicio.
+
+Los proxies ProcessPoolPlateDetector / ProcessPoolOCRReader implementan las
+interfaces de dominio, así PlateRecognitionService no cambia: cada worker
+thread del servicio bloquea en su future mientras otro proceso infiere.
+"""
+import os
+import time
+import queue
+import logging
+import threading
+import itertools
+import traceback
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+from src.domain.Interfaces.plate_detector import IPlateDetector
+from src.domain.Interfaces.ocr_reader import IOCRReader
+from src.infrastructure.OCR.factory import create_crop_preprocessor
+from src.core.config import settings
+from src.core.status import status
+
+logger = logging.getLogger(__name__)
+
+# descriptor de frame que cruza el límite de proceso
+FrameDescriptor = Tuple[str, int, Tuple[int, ...], str, float, str]   # (shm_name, offset, shape, dtype, timestamp, source)
+
+_MAX_BACKOFF = 60.0      # s: tope de espera entre relanzamientos de una réplica
+_STABLE_SECONDS = 60.0   # s: una réplica que estuvo lista este tiempo reinicia su contador de fallos
+
+
+# ============================================================
+#  LADO WORKER (proceso hijo)
+# ============================================================
+def _attach(name: str, cache: Dict[str, shared_memory.SharedMemory]) -> shared_memory.SharedMemory:
+    """Adjunta (y cachea) un segmento creado por el padre sin registrarlo para limpieza en el hijo."""
+    shm = cache.get(name)
+    if shm is None:
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            # el padre es dueño del segmento; evitar que el resource_tracker del hijo lo borre
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, "shared_memory")
+        except Exception:
+            pass
+        cache[name] = shm
+    return shm
+
+
+def _to_frame(desc: FrameDescriptor, cache: Dict[str, shared_memory.SharedMemory]) -> Frame:
+    name, offset, shape, dtype, timestamp, source = desc
+    shm = _attach(name, cache)
+    data = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+    return Frame(data=data, timestamp=timestamp, source=source)
+
+
+def _worker_main(index: int, tasks, results, torch_threads: int, components: Tuple[str, ...], current) -> None:
+    # fijar threads ANTES de importar torch (vía detector/OCR)
+    threads = str(max(1, torch_threads))
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[var] = threads
+
+    logging.basicConfig(level=logging.INFO, format=f"%(asctime)s %(levelname)s [infer-{index}] %(name)s: %(message)s")
+    try:
+        try:
+            import torch
+            torch.set_num_threads(max(1, torch_threads))
+            torch.set_num_interop_threads(1)
+        except Exception:
+            pass
+
+        detector = ocr = None
+        if "detector" in components:
+            from src.infrastructure.Detector.factory import create_plate_detector
+            detector = create_plate_detector()
+        if "ocr" in components:
+            from src.infrastructure.OCR.factory import create_ocr_reader
+            ocr = create_ocr_reader()
+    except Exception:
+        results.put(("init_error", index, traceback.format_exc()))
+        return
+
+    results.put(("ready", index, os.getpid()))
+
+    attached: Dict[str, shared_memory.SharedMemory] = {}
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        task_id, kind, payload = task
+        current[index] = task_id   # el padre libera los slots de esta tarea si el proceso muere
+        try:
+            if kind == "detect":
+                frames = [_to_frame(d, attached) for d in payload]
+                out = detector.detect_batch(frames)
+            elif kind == "ocr":
+                desc, plates = payload
+                out = ocr.read_batch(_to_frame(desc, attached), plates)
+            else:
+                raise ValueError(f"Tarea desconocida: {kind}")
+            results.put(("result", task_id, out))
+        except Exception as ex:
+            results.put(("error", task_id, f"{type(ex).__name__}: {ex}\n{traceback.format_exc()}"))
+
+    for shm in attached.values():
+        try:
+            shm.close()
+        except Exception:
+            pass
+
+
+# ============================================================
+#  LADO PADRE
+# ============================================================
+class _FrameSlots:
+    """
+    Pool acotado de segmentos de memoria compartida. Cada slot guarda un frame
+    mientras su tarea está en vuelo; acquire_many() bloquea si no hay slots libres
+    (backpressure natural hacia los worker threads del servicio).
+    """
+
+    def __init__(self, count: int):
+        self._free: "queue.Queue[int]" = queue.Queue()
+        self.count = count
+        self._acquire_lock = threading.Lock()
+        self._segments: List[Optional[shared_memory.SharedMemory]] = [None] * count
+        for i in range(count):
+            self._free.put(i)
+
+    def acquire_many(self, frames: List[Frame], timeout: Optional[float] = None) -> Tuple[List[Callable[[], None]], List[FrameDescriptor]]:
+        """
+        Devuelve un descriptor por frame y las funciones que liberan lo reservado.
+
+        Frames respaldados por el ring de captura se envían tal cual (se retiene
+        su slot hasta liberar); el resto se copia en slots propios, reservados de
+        forma atómica (un batch a la vez) para que dos callers no se queden cada
+        uno con parte de los slots esperando al otro.
+        """
+        releases: List[Callable[[], None]] = []
+        descs: List[Optional[FrameDescriptor]] = [None] * len(frames)
+        to_copy: List[int] = []
+        try:
+            for i, frame in enumerate(frames):
+                handle = getattr(frame, "handle", None)
+                if handle is not None and hasattr(handle, "descriptor"):
+                    name, offset = handle.descriptor
+                    handle.retain()
+                    releases.append(handle.release)
+                    data = frame.data
+                    descs[i] = (name, offset, tuple(data.shape), data.dtype.str, float(frame.timestamp), str(frame.source))
+                else:
+                    to_copy.append(i)
+
+            idxs: List[int] = []
+            with self._acquire_lock:
+                for _ in to_copy:
+                    idx = self._free.get(timeout=timeout)
+                    idxs.append(idx)
+                    releases.append(lambda idx=idx: self.release(idx))
+            for idx, i in zip(idxs, to_copy):
+                descs[i] = self._write(idx, frames[i])
+            return releases, descs
+        except Exception:
+            for release in releases:
+                release()
+            raise
+
+    def _write(self, idx: int, frame: Frame) -> FrameDescriptor:
+        data = np.ascontiguousarray(frame.data)
+        shm = self._segments[idx]
+        if shm is None or shm.size < data.nbytes:
+            # crecer el slot (primer uso o resolución mayor)
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+            shm = shared_memory.SharedMemory(create=True, size=max(1, data.nbytes))
+            self._segments[idx] = shm
+        view = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        view[...] = data
+        return (shm.name, 0, tuple(data.shape), data.dtype.str, float(frame.timestamp), str(frame.source))
+
+    def release(self, idx: int) -> None:
+        self._free.put(idx)
+
+    def close(self) -> None:
+        for shm in self._segments:
+            if shm is None:
+                continue
+            try:
+                shm.close()
+                shm.unlink()
+            except Exception:
+                pass
+        self._segments = [None] * len(self._segments)
+
+
+class InferenceProcessPool:
+    """
+    Pool de procesos de inferencia con réplicas de detector y OCR.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        torch_threads: Optional[int] = None,
+        slots: Optional[int] = None,
+        timeout: Optional[float] = None,
+        components: Tuple[str, ...] = ("detector", "ocr"),
+        max_restarts: Optional[int] = None,
+        restart_backoff: Optional[float] = None,
+    ):
+        self.processes = max(1, processes if processes is not None else getattr(settings, "inference_processes", 2))
+        self.torch_threads = max(1, torch_threads if torch_threads is not None else getattr(settings, "inference_torch_threads", 1))
+        self.timeout = timeout if timeout is not None else getattr(settings, "inference_timeout", 30.0)
+        self.components = tuple(components)
+        self.max_restarts = max(0, max_restarts if max_restarts is not None else getattr(settings, "inference_max_restarts", 5))
+        self.restart_backoff = max(0.0, restart_backoff if restart_backoff is not None else getattr(settings, "inference_restart_backoff", 1.0))
+        batch = max(1, getattr(settings, "detector_batch_size", 1))
+        self._slots = _FrameSlots(max(1, slots if slots is not None else self.processes * batch * 2))
+
+        self._ctx = mp.get_context("spawn")  # seguro con torch (sin fork de estado CUDA/OpenMP)
+        self._tasks = self._ctx.Queue()
+        self._results = self._ctx.Queue()
+        self._procs: List[Any] = [None] * self.processes
+        self._pending: Dict[int, Future] = {}
+        self._held: Dict[int, List[Callable[[], None]]] = {}   # task_id -> liberación de sus slots/handles
+        self._current = self._ctx.Array("q", self.processes, lock=False)   # última tarea tomada por cada réplica
+        self._pending_lock = threading.Lock()
+        self._ids = itertools.count()
+        self._ready = set()
+        self._ready_event = threading.Event()
+        self._ready_at: Dict[int, float] = {}
+        self._restarts = [0] * self.processes          # fallos seguidos por réplica
+        self._respawn_at: Dict[int, float] = {}        # réplica caída -> instante del relanzamiento
+        self._dead: set = set()                        # réplicas sin más reintentos
+        self._last_error: Optional[str] = None
+        self.failed = False
+        self._running = True
+
+        for i in range(self.processes):
+            self._spawn(i)
+
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="inference-dispatcher", daemon=True)
+        self._dispatcher.start()
+        status.register("inference_pool", self.status, live=self._live_check, ready=self._ready_check)
+        logger.info("InferenceProcessPool iniciado: processes=%d torch_threads=%d components=%s",
+                    self.processes, self.torch_threads, self.components)
+
+    # ----- API -----
+    def detector(self) -> "ProcessPoolPlateDetector":
+        return ProcessPoolPlateDetector(self)
+
+    def ocr_reader(self) -> "ProcessPoolOCRReader":
+        return ProcessPoolOCRReader(self)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que todos los procesos hayan cargado sus modelos; False si vence o el pool falló."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._ready_event.wait(0.5 if deadline is None else max(0.0, min(0.5, deadline - time.monotonic()))):
+            if self.failed or not self._running or (deadline is not None and time.monotonic() >= deadline):
+                return False
+        return True
+
+    def status(self) -> dict:
+        return {
+            "processes": self.processes,
+            "ready": sorted(self._ready),
+            "restarts": list(self._restarts),
+            "dead": sorted(self._dead),
+            "failed": self.failed,
+            "last_error": self._last_error,
+        }
+
+    def _live_check(self) -> Optional[str]:
+        if self.failed:
+            return f"pool de inferencia fallido tras {self.max_restarts} reintentos por réplica"
+        return None
+
+    def _ready_check(self) -> Optional[str]:
+        return None if self._ready else "ninguna réplica de inferencia lista"
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        if not frames:
+            return []
+        # batches más grandes que el pool de slots se parten en trozos
+        chunk = self._slots.count
+        if len(frames) > chunk:
+            out: List[List[Plate]] = []
+            for i in range(0, len(frames), chunk):
+                out.extend(self.detect_batch(frames[i:i + chunk]))
+            return out
+
+        releases, descs = self._slots.acquire_many(frames, timeout=self.timeout)
+        return self._wait(*self._submit("detect", descs, releases))
+
+    def read_batch(self, frame: Frame, plates: List[Plate]) -> List[Plate]:
+        if not plates:
+            return plates
+        releases, descs = self._slots.acquire_many([frame], timeout=self.timeout)
+        out = self._wait(*self._submit("ocr", (descs[0], list(plates)), releases))
+        # los resultados vuelven serializados: actualizar las instancias originales
+        for original, res in zip(plates, out):
+            original.text = res.text
+            original.confidence = res.confidence
+            original.cached = getattr(res, "cached", False)
+        return plates
+
+    def close(self, timeout: float = 5.0) -> None:
+        if not self._running:
+            return
+        self._running = False
+        status.unregister("inference_pool")
+        for _ in self._procs:
+            try:
+                self._tasks.put(None)
+            except Exception:
+                pass
+        for p in self._procs:
+            if p is not None:
+                p.join(timeout=timeout)
+                if p.is_alive():
+                    p.terminate()
+        self._fail_pending(RuntimeError("InferenceProcessPool cerrado"))
+        self._slots.close()
+        logger.info("InferenceProcessPool detenido")
+
+    # ----- internos -----
+    def _spawn(self, index: int) -> None:
+        self._current[index] = -1
+        p = self._ctx.Process(
+            target=_worker_main,
+            args=(index, self._tasks, self._results, self.torch_threads, self.components, self._current),
+            name=f"inference-{index}",
+            daemon=True,
+        )
+        p.start()
+        self._procs[index] = p
+
+    def _submit(self, kind: str, payload: Any, releases: List[Callable[[], None]]) -> Tuple[int, Future]:
+        """
+        Encola la tarea. Sus slots/handles (`releases`) quedan retenidos hasta que
+        llega su resultado o muere la réplica que la tomó, no hasta que vence el
+        timeout: el hijo puede seguir leyendo el frame después del timeout.
+        """
+        if not self._running or self.failed:
+            for release in releases:
+                release()
+            if not self._running:
+                raise RuntimeError("InferenceProcessPool cerrado")
+            raise RuntimeError("InferenceProcessPool fallido: ninguna réplica pudo cargar los modelos")
+        fut: Future = Future()
+        task_id = next(self._ids)
+        with self._pending_lock:
+            self._pending[task_id] = fut
+            self._held[task_id] = releases
+        try:
+            self._tasks.put((task_id, kind, payload))
+        except Exception:
+            with self._pending_lock:
+                self._pending.pop(task_id, None)
+            self._release(task_id)
+            raise
+        return task_id, fut
+
+    def _release(self, task_id: int) -> None:
+        with self._pending_lock:
+            releases = self._held.pop(task_id, ())
+        for release in releases:
+            try:
+                release()
+            except Exception:
+                logger.exception("No se pudo liberar el frame de la tarea %d", task_id)
+
+    def _wait(self, task_id: int, fut: Future) -> Any:
+        try:
+            return fut.result(timeout=self.timeout)
+        except FutureTimeout:
+            with self._pending_lock:
+                self._pending.pop(task_id, None)
+            # los slots siguen retenidos (cuarentena) hasta el resultado tardío o la muerte de la réplica
+            raise TimeoutError(f"Inferencia sin respuesta tras {self.timeout:.1f}s (task={task_id})")
+
+    def _dispatch_loop(self) -> None:
+        last_check = time.monotonic()
+        while self._running:
+            try:
+                msg = self._results.get(timeout=0.5)
+            except queue.Empty:
+                msg = None
+            except (EOFError, OSError):
+                break
+
+            if msg is not None:
+                kind, key, body = msg
+                if kind == "result" or kind == "error":
+                    self._release(key)
+                    with self._pending_lock:
+                        fut = self._pending.pop(key, None)
+                    if fut is not None:
+                        if kind == "result":
+                            fut.set_result(body)
+                        else:
+                            fut.set_exception(RuntimeError(f"Error en proceso de inferencia: {body}"))
+                elif kind == "ready":
+                    self._ready.add(key)
+                    self._ready_at[key] = time.monotonic()
+                    logger.info("Proceso de inferencia %d listo (pid=%s)", key, body)
+                    if len(self._ready) >= self.processes:
+                        self._ready_event.set()
+                elif kind == "init_error":
+                    self._last_error = body.strip().splitlines()[-1] if body.strip() else body
+                    logger.error("Proceso de inferencia %d no pudo cargar modelos:\n%s", key, body)
+
+            # vigilar procesos caídos y relanzarlos (las tareas en vuelo vencen por timeout)
+            now = time.monotonic()
+            if now - last_check >= 1.0:
+                last_check = now
+                self._supervise(now)
+
+    def _supervise(self, now: float) -> None:
+        """Detecta réplicas caídas, programa su relanzamiento con backoff y marca el pool fallido."""
+        for i, p in enumerate(self._procs):
+            if not self._running or i in self._dead:
+                continue
+            if i in self._respawn_at:
+                if now >= self._respawn_at[i]:
+                    del self._respawn_at[i]
+                    self._spawn(i)
+                continue
+            if p is None or p.is_alive():
+                continue
+
+            # la tarea que tenía tomada no va a responder: fallarla ya y soltar sus slots
+            task_id = self._current[i]
+            self._current[i] = -1
+            if task_id >= 0:
+                with self._pending_lock:
+                    fut = self._pending.pop(task_id, None)
+                if fut is not None and not fut.done():
+                    fut.set_exception(RuntimeError(f"Proceso de inferencia {i} terminó durante la tarea {task_id}"))
+                self._release(task_id)
+
+            ready_at = self._ready_at.pop(i, None)
+            if i in self._ready:
+                self._ready.discard(i)
+                self._ready_event.clear()
+            if ready_at is not None and now - ready_at >= _STABLE_SECONDS:
+                self._restarts[i] = 0
+            if self._restarts[i] >= self.max_restarts:
+                self._dead.add(i)
+                logger.error("Proceso de inferencia %d terminó (exitcode=%s) tras %d relanzamientos; no se relanza",
+                             i, p.exitcode, self._restarts[i])
+                continue
+            delay = min(_MAX_BACKOFF, self.restart_backoff * (2 ** self._restarts[i]))
+            self._restarts[i] += 1
+            self._respawn_at[i] = now + delay
+            logger.warning("Proceso de inferencia %d terminó (exitcode=%s); relanzando en %.1fs (intento %d/%d)",
+                           i, p.exitcode, delay, self._restarts[i], self.max_restarts)
+
+        if not self.failed and len(self._dead) >= self.processes:
+            self.failed = True
+            self._ready_event.clear()
+            logger.error("InferenceProcessPool fallido: todas las réplicas agotaron sus reintentos")
+            self._fail_pending(RuntimeError("InferenceProcessPool fallido"))
+
+    def _fail_pending(self, exc: Exception) -> None:
+        """Falla las tareas en vuelo y suelta sus slots (solo con todas las réplicas detenidas)."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+            held = list(self._held)
+        for fut in pending.values():
+            if not fut.done():
+                fut.set_exception(exc)
+        for task_id in held:
+            self._release(task_id)
+
+
+class ProcessPoolPlateDetector(IPlateDetector):
+    """Proxy IPlateDetector que delega la inferencia en InferenceProcessPool."""
+
+    def __init__(self, pool: InferenceProcessPool):
+        self.pool = pool
+
+    def detect(self, frame: Frame) -> List[Plate]:
+        return self.pool.detect_batch([frame])[0]
+
+    def detect_batch(self, frames: List[Frame]) -> List[List[Plate]]:
+        return self.pool.detect_batch(frames)
+
+
+class ProcessPoolOCRReader(IOCRReader):
+    """Proxy IOCRReader que delega el OCR en InferenceProcessPool."""
+
+    def __init__(self, pool: InferenceProcessPool):
+        self.pool = pool
+        # la calidad del recorte se evalúa aquí (barato): no vale un viaje al pool,
+        # con el mismo criterio que el backend OCR de los procesos worker
+        self.preprocessor = create_crop_preprocessor()
+
+    def read_text(self, frame: Frame, plate: Plate) -> Plate:
+        return self.pool.read_batch(frame, [plate])[0]
+
+    def read_batch(self, frame: Frame, plates: List[Plate]) -> List[Plate]:
+        return self.pool.read_batch(frame, plates)
+
+    def crop_quality(self, frame: Frame, plate: Plate) -> float:
+        if self.preprocessor is None:
+            return 1.0
+        return self.preprocessor.quality(frame.image, plate.bounding_box)
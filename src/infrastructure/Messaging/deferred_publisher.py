@@ -0,0 +1,93 @@
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Optional
+
+from src.domain.Models.detection_result import DetectionResult
+from src.domain.Interfaces.event_publisher import IEventPublisher
+from src.core.config import settings
+
+class DeferredPublisher(IEventPublisher):
+    """
+    IEventPublisher cuyo publisher real todavía se está construyendo (p.ej.
+    KafkaPublisher esperando metadata del broker durante el arranque).
+
+    Recibe el Future del publisher (StartupOrchestrator.future("kafka")):
+    - listo -> delega directamente
+    - pendiente -> publish() espera hasta `wait_timeout` s y publish_async()
+      encadena el envío al Future sin bloquear; si no llega, falla con
+      ConnectionError (transitorio: RetryPublisher reintenta y, con spool,
+      el evento va a disco y se re-publica en orden)
+    Así la captura no espera a Kafka para empezar a procesar.
+    """
+
+    def __init__(self, inner: "Future[IEventPublisher]", wait_timeout: Optional[float] = None):
+        self._inner = inner
+        self.wait_timeout = wait_timeout if wait_timeout is not None else getattr(settings, "startup_publisher_wait", 30.0)
+
+    def _resolve(self) -> IEventPublisher:
+        try:
+            return self._inner.result(timeout=self.wait_timeout)
+        except FutureTimeout:
+            raise self._timeout_error() from None
+
+    def _timeout_error(self) -> ConnectionError:
+        # mensaje con "timeout"/"broker": RetryPublisher lo clasifica como transitorio
+        return ConnectionError(f"Broker no disponible: timeout de arranque ({self.wait_timeout:g}s)")
+
+    def publish(self, result: DetectionResult) -> None:
+        self._resolve().publish(result)
+
+    def publish_async(self, result: DetectionResult) -> "Future[None]":
+        if self._inner.done():
+            try:
+                return self._resolve().publish_async(result)
+            except Exception as ex:
+                return self._failed(ex)
+
+        # sin bloquear el hilo de captura: se publica cuando el publisher esté listo,
+        # salvo que antes venza el timeout (el evento ya fue al spool: no duplicar)
+        outer: "Future[None]" = Future()
+        lock = threading.Lock()
+        claimed = [False]
+
+        def _claim() -> bool:
+            with lock:
+                if claimed[0]:
+                    return False
+                claimed[0] = True
+                return True
+
+        def _on_ready(fut: Future) -> None:
+            if not _claim():
+                return
+            try:
+                forwarded = self._resolve().publish_async(result)
+            except Exception as ex:
+                outer.set_exception(ex)
+                return
+            forwarded.add_done_callback(
+                lambda f: outer.set_exception(f.exception()) if f.exception() is not None else outer.set_result(None)
+            )
+
+        def _on_timeout() -> None:
+            if _claim():
+                outer.set_exception(self._timeout_error())
+
+        timer = threading.Timer(self.wait_timeout, _on_timeout)
+        timer.daemon = True
+        timer.start()
+        outer.add_done_callback(lambda _: timer.cancel())
+        self._inner.add_done_callback(_on_ready)
+        return outer
+
+    @staticmethod
+    def _failed(ex: BaseException) -> "Future[None]":
+        fut: "Future[None]" = Future()
+        fut.set_exception(ex)
+        return fut
+
+    def close(self) -> None:
+        if self._inner.done() and self._inner.exception() is None:
+            close = getattr(self._inner.result(), "close", None)
+            if close is not None:
+                close()
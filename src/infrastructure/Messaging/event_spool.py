@@ -0,0 +1,364 @@
+# src/infrastructure/Messaging/event_spool.py
+"""
+Spool durable en disco para eventos que no se pudieron publicar.
+
+Formato: segmentos append-only JSON-lines (un DetectionResult.to_dict() por
+línea) en `spool_dir`, nombrados spool-<secuencia>.jsonl. Las escrituras se
+agrupan y se hace fsync cada `fsync_batch` eventos o cada `fsync_interval`
+segundos (lo que ocurra primero). Un segmento se cierra al superar
+`segment_max_bytes`.
+
+append() no toca el disco: encola el evento para el hilo escritor del spool
+(serialización, write y fsync). Así quien llama (p.ej. el callback de entrega
+de Kafka, en el hilo de poll del producer) no se bloquea en I/O justo cuando
+el broker falla. flush() espera a que lo encolado esté escrito.
+
+El progreso de lectura se guarda en un archivo <segmento>.ack con el número de
+líneas ya entregadas; un segmento completamente entregado se borra. Tras un
+crash se re-publica como mucho lo no confirmado (at-least-once; el consumidor
+deduplica por event_id).
+
+SpoolDrainer re-publica el spool en orden, segmento a segmento, cuando el
+broker vuelve a estar disponible.
+"""
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from src.domain.Models.detection_result import DetectionResult
+from src.domain.Interfaces.event_publisher import IEventPublisher
+from src.domain.Interfaces.event_spool import IEventSpool
+from src.core.config import settings
+from src.core.metrics import registry
+from src.core.status import status
+
+logger = logging.getLogger(__name__)
+
+SPOOL_PENDING = registry.gauge("anpr_spool_pending_events", "Eventos en el spool pendientes de re-publicar")
+SPOOL_REPLAYED = registry.counter("anpr_spool_replayed_total", "Eventos re-publicados desde el spool")
+SPOOL_WRITE_ERRORS = registry.counter("anpr_spool_write_errors_total", "Eventos perdidos por error de escritura en el spool")
+
+_PREFIX = "spool-"
+_SUFFIX = ".jsonl"
+
+
+class EventSpool(IEventSpool):
+    """
+    Cola FIFO persistente de DetectionResult (thread-safe).
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        segment_max_bytes: Optional[int] = None,
+        fsync_batch: Optional[int] = None,
+        fsync_interval: Optional[float] = None,
+    ):
+        self.directory = directory or getattr(settings, "spool_dir", "./data/spool")
+        self.segment_max_bytes = max(1024, segment_max_bytes if segment_max_bytes is not None else int(getattr(settings, "spool_segment_max_mb", 16) * 1024 * 1024))
+        self.fsync_batch = max(1, fsync_batch if fsync_batch is not None else getattr(settings, "spool_fsync_batch", 32))
+        self.fsync_interval = fsync_interval if fsync_interval is not None else getattr(settings, "spool_fsync_interval_ms", 200.0) / 1000.0
+        os.makedirs(self.directory, exist_ok=True)
+
+        self._lock = threading.Lock()  # archivos y segmentos (se toma durante el I/O)
+        self._segments: Deque[int] = deque()
+        self._queue_cond = threading.Condition(threading.Lock())  # cola y contadores (nunca durante I/O)
+        self._queue: Deque[DetectionResult] = deque()
+        self._enqueued = 0             # eventos encolados desde el arranque
+        self._written = 0              # eventos ya procesados por el escritor (escritos o perdidos)
+        self._closing = False
+        self._pending = 0              # eventos encolados o escritos y aún no entregados
+        self._active = None            # archivo del segmento en escritura
+        self._active_seq: Optional[int] = None
+        self._active_size = 0
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._recover()
+        SPOOL_PENDING.labels().set_function(self.pending)
+        status.register("spool", lambda: {"pending": self.pending(), "queued": len(self._queue), "segments": len(self._segments), "directory": self.directory})
+        self._writer = threading.Thread(target=self._writer_loop, name="spool-writer", daemon=True)
+        self._writer.start()
+
+    # ----- escritura -----
+    def append(self, result: DetectionResult) -> None:
+        """Encola el evento (FIFO) para el hilo escritor; no bloquea en disco."""
+        with self._queue_cond:
+            if self._closing:
+                raise RuntimeError("EventSpool cerrado")
+            self._queue.append(result)
+            self._enqueued += 1
+            self._pending += 1
+            self._queue_cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Espera a que el escritor procese lo encolado hasta ahora. False si vence el timeout."""
+        with self._queue_cond:
+            target = self._enqueued
+            return self._queue_cond.wait_for(lambda: self._written >= target, timeout)
+
+    def sync(self) -> None:
+        """Fuerza fsync de lo escrito (lo llama también el drainer periódicamente)."""
+        with self._lock:
+            self._sync_locked()
+
+    def has_backlog(self) -> bool:
+        # incluye lo encolado sin escribir: un evento nuevo debe ir detrás
+        return self._pending > 0
+
+    def pending(self) -> int:
+        return self._pending
+
+    # ----- lectura -----
+    def read_oldest(self) -> Optional[Tuple[int, int, List[Tuple[int, Optional[DetectionResult]]]]]:
+        """
+        Devuelve (secuencia, líneas_ya_entregadas, [(nº_línea, resultado)]) del
+        segmento más antiguo con datos pendientes, o None si el spool está vacío.
+        Si el más antiguo es el segmento activo, se cierra para que las nuevas
+        escrituras vayan a uno nuevo. Líneas corruptas (escritura truncada) se
+        devuelven como None.
+        """
+        with self._lock:
+            if not self._segments:
+                return None
+            seq = self._segments[0]
+            if seq == self._active_seq:
+                self._close_active_locked()
+        acked = self._read_ack(seq)
+        records: List[Tuple[int, Optional[DetectionResult]]] = []
+        with open(self._segment_path(seq), "rb") as fh:
+            for line_no, raw in enumerate(fh):
+                if line_no < acked:
+                    continue
+                try:
+                    records.append((line_no, DetectionResult.from_dict(json.loads(raw))))
+                except Exception:
+                    logger.warning("Spool: línea %d corrupta en segmento %d; se omite", line_no, seq)
+                    records.append((line_no, None))
+        return seq, acked, records
+
+    def commit(self, seq: int, acked_before: int, delivered_upto: int, segment_done: bool) -> None:
+        """
+        Marca como entregadas las líneas [acked_before, delivered_upto) del segmento.
+        Si segment_done, el segmento se elimina.
+        """
+        delivered = max(0, delivered_upto - acked_before)
+        with self._queue_cond:
+            self._pending = max(0, self._pending - delivered)
+        with self._lock:
+            if segment_done:
+                if self._segments and self._segments[0] == seq:
+                    self._segments.popleft()
+                for path in (self._segment_path(seq), self._ack_path(seq)):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                return
+        if delivered:
+            self._write_ack(seq, delivered_upto)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Escribe lo encolado, detiene el escritor y cierra el segmento activo (idempotente)."""
+        with self._queue_cond:
+            self._closing = True
+            self._queue_cond.notify_all()
+        if self._writer.is_alive() and self._writer is not threading.current_thread():
+            self._writer.join(timeout=timeout)
+        with self._lock:
+            self._close_active_locked()
+
+    # ----- internos -----
+    def _writer_loop(self) -> None:
+        while True:
+            with self._queue_cond:
+                self._queue_cond.wait_for(lambda: self._queue or self._closing)
+                if not self._queue:
+                    return
+                batch = list(self._queue)
+                self._queue.clear()
+            lost = 0
+            for result in batch:
+                try:
+                    data = (json.dumps(result.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+                    with self._lock:
+                        self._write_locked(data)
+                except Exception:
+                    logger.exception("No se pudo escribir en el spool; evento perdido event_id=%s", getattr(result, "event_id", None))
+                    SPOOL_WRITE_ERRORS.inc()
+                    lost += 1
+            with self._queue_cond:
+                self._written += len(batch)
+                self._pending = max(0, self._pending - lost)
+                self._queue_cond.notify_all()
+
+    def _write_locked(self, data: bytes) -> None:
+        if self._active is None or self._active_size >= self.segment_max_bytes:
+            self._roll_locked()
+        self._active.write(data)
+        self._active_size += len(data)
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_batch or (time.monotonic() - self._last_sync) >= self.fsync_interval:
+            self._sync_locked()
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self.directory, f"{_PREFIX}{seq:012d}{_SUFFIX}")
+
+    def _ack_path(self, seq: int) -> str:
+        return self._segment_path(seq) + ".ack"
+
+    def _read_ack(self, seq: int) -> int:
+        try:
+            with open(self._ack_path(seq), "r", encoding="utf-8") as fh:
+                return int(fh.read().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0
+
+    def _write_ack(self, seq: int, lines: int) -> None:
+        # escritura atómica: tmp + replace
+        tmp = self._ack_path(seq) + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.write(str(lines))
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp, self._ack_path(seq))
+
+    def _recover(self) -> None:
+        """Reconstruye la lista de segmentos y el nº de eventos pendientes al arrancar."""
+        seqs = []
+        for name in os.listdir(self.directory):
+            if name.startswith(_PREFIX) and name.endswith(_SUFFIX):
+                try:
+                    seqs.append(int(name[len(_PREFIX):-len(_SUFFIX)]))
+                except ValueError:
+                    continue
+        for seq in sorted(seqs):
+            with open(self._segment_path(seq), "rb") as fh:
+                lines = sum(1 for _ in fh)
+            remaining = lines - self._read_ack(seq)
+            if remaining <= 0:
+                os.remove(self._segment_path(seq))
+                try:
+                    os.remove(self._ack_path(seq))
+                except FileNotFoundError:
+                    pass
+                continue
+            self._segments.append(seq)
+            self._pending += remaining
+        if self._pending:
+            logger.warning("Spool con %d eventos pendientes en %d segmentos (%s)", self._pending, len(self._segments), self.directory)
+
+    def _roll_locked(self) -> None:
+        self._close_active_locked()
+        seq = (max(self._segments) + 1) if self._segments else 0
+        self._active = open(self._segment_path(seq), "ab")
+        self._active_seq = seq
+        self._active_size = 0
+        self._segments.append(seq)
+
+    def _sync_locked(self) -> None:
+        if self._active is not None and self._unsynced:
+            self._active.flush()
+            os.fsync(self._active.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _close_active_locked(self) -> None:
+        if self._active is None:
+            return
+        try:
+            self._sync_locked()
+            self._active.close()
+        finally:
+            self._active = None
+            self._active_seq = None
+            self._active_size = 0
+
+
+class SpoolDrainer:
+    """
+    Thread que re-publica el spool en orden cuando el broker está disponible.
+
+    Publica cada tramo (drain_batch eventos) con publish_async para no pagar
+    un round-trip por evento; el orden se mantiene porque el producer es
+    idempotente (orden por partición). Si algún envío del tramo falla, se
+    confirma hasta el último evento contiguo entregado y se reintenta desde
+    ahí tras `retry_interval` segundos.
+    """
+
+    def __init__(
+        self,
+        spool: EventSpool,
+        publisher: IEventPublisher,
+        retry_interval: Optional[float] = None,
+        drain_batch: Optional[int] = None,
+    ):
+        self.spool = spool
+        self.publisher = publisher
+        self.retry_interval = retry_interval if retry_interval is not None else getattr(settings, "spool_retry_interval", 5.0)
+        self.drain_batch = max(1, drain_batch if drain_batch is not None else getattr(settings, "spool_drain_batch", 500))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="spool-drainer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+        self.spool.close()
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            # lo encolado pasa a disco antes de leer; acota la ventana sin fsync aunque no lleguen más escrituras
+            self.spool.flush(timeout=self.spool.fsync_interval or 0.2)
+            self.spool.sync()
+            if not self.spool.has_backlog():
+                self._stop.wait(self.spool.fsync_interval or 0.2)
+                continue
+            try:
+                self.drain_once()
+            except Exception as ex:
+                logger.warning("Spool: broker no disponible (%s); reintento en %.1fs (%d pendientes)",
+                               ex, self.retry_interval, self.spool.pending())
+                self._stop.wait(self.retry_interval)
+
+    def drain_once(self) -> int:
+        """Re-publica el segmento más antiguo. Devuelve los eventos entregados; lanza si hubo fallo."""
+        batch = self.spool.read_oldest()
+        if batch is None:
+            return 0
+        seq, acked, records = batch
+        delivered_upto = acked
+        sent = 0
+        for i in range(0, len(records), self.drain_batch):
+            chunk = records[i:i + self.drain_batch]
+            futures = [(line_no, self.publisher.publish_async(result) if result is not None else None)
+                       for line_no, result in chunk]
+            error: Optional[BaseException] = None
+            for line_no, fut in futures:
+                if fut is not None:
+                    try:
+                        fut.result()
+                    except Exception as ex:
+                        error = ex
+                        break
+                    sent += 1
+                delivered_upto = line_no + 1
+            if error is not None:
+                self.spool.commit(seq, acked, delivered_upto, segment_done=False)
+                SPOOL_REPLAYED.inc(sent)
+                raise error
+            self.spool.commit(seq, acked, delivered_upto, segment_done=False)
+            acked = delivered_upto
+        self.spool.commit(seq, acked, delivered_upto, segment_done=True)
+        SPOOL_REPLAYED.inc(sent)
+        if sent:
+            logger.info("Spool: %d eventos re-publicados (segmento %d, %d pendientes)", sent, seq, self.spool.pending())
+        return sent
@@ -0,0 +1,22 @@
+import threading
+from typing import List
+from src.domain.Interfaces.event_publisher import IEventPublisher
+from src.domain.Models.detection_result import DetectionResult
+
+class InMemoryPublisher(IEventPublisher):
+    """
+    Publicador local que solo guarda los eventos en memoria (sin broker).
+    Útil para benchmarks y pruebas offline.
+    """
+
+    def __init__(self, keep: bool = True):
+        self.keep = keep
+        self.count = 0
+        self.events: List[DetectionResult] = []
+        self._lock = threading.Lock()
+
+    def publish(self, result: DetectionResult) -> None:
+        with self._lock:
+            self.count += 1
+            if self.keep:
+                self.events.append(result)
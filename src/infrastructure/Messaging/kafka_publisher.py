@@ -2,22 +2,34 @@ import json
 import logging
 import threading
 import time
-from typing import Optional
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Optional, Tuple
 from datetime import datetime
 from confluent_kafka import Producer, KafkaError
 from src.domain.Models.detection_result import DetectionResult
 from src.domain.Interfaces.event_publisher import IEventPublisher
 from src.core.config import settings
+from src.core.metrics import registry
+from src.core.status import status
 
 logger = logging.getLogger(__name__)
 
+KAFKA_MESSAGES = registry.counter("anpr_kafka_messages_total", "Mensajes Kafka por resultado de entrega", ("result",))
+KAFKA_IN_FLIGHT = registry.gauge("anpr_kafka_in_flight", "Mensajes producidos pendientes de confirmación")
+KAFKA_DELIVERY_LATENCY = registry.histogram("anpr_kafka_delivery_seconds", "Latencia produce -> confirmación del broker")
+
 class KafkaPublisher(IEventPublisher):
     """
     Publica PlateDetectedEventRecord en Kafka a partir de DetectionResult.
-    Implementa control explícito de callback con polling activo para evitar duplicados y timeouts falsos.
+
+    Envío pipelined: publish_async() encola el mensaje en el producer y devuelve
+    un Future que se resuelve en el callback de entrega. Un thread dedicado hace
+    poll() continuamente (dispara los callbacks) y un semáforo acota los mensajes
+    en vuelo (max_in_flight) para aplicar backpressure al llamador.
+    publish() conserva la semántica bloqueante: espera la confirmación de su mensaje.
     """
 
-    def __init__(self, delivery_timeout: float = 10.0, producer_conf: Optional[dict] = None):
+    def __init__(self, delivery_timeout: float = 10.0, producer_conf: Optional[dict] = None, max_in_flight: Optional[int] = None):
         base_conf = {
             "bootstrap.servers": settings.kafka_broker,
             "client.id": settings.app_name,
@@ -28,6 +40,8 @@ class KafkaPublisher(IEventPublisher):
             "request.timeout.ms": 30000,
             "linger.ms": 5,
             "compression.type": "lz4",
+            # el propio librdkafka falla el mensaje si no se confirma a tiempo (el callback siempre llega)
+            "message.timeout.ms": max(1000, int(delivery_timeout * 1000)),
             # "debug": "broker,topic,msg",  # opcional: habilita trazas detalladas
         }
 
@@ -37,6 +51,8 @@ class KafkaPublisher(IEventPublisher):
         self.producer = Producer(base_conf)
         self.topic = settings.kafka_topic
         self.delivery_timeout = delivery_timeout
+        self.max_in_flight = max(1, max_in_flight if max_in_flight is not None else getattr(settings, "kafka_max_in_flight", 1000))
+        self._in_flight = threading.BoundedSemaphore(self.max_in_flight)
 
         # métricas internas básicas
         self.metrics = {
@@ -44,9 +60,21 @@ class KafkaPublisher(IEventPublisher):
             "publish_failed": 0,
             "publish_timeout": 0
         }
+        self._metrics_lock = threading.Lock()
+        KAFKA_IN_FLIGHT.labels().set_function(lambda: len(self.producer))
 
         self._wait_for_metadata(timeout=15)
 
+        # lag de entrega para /status: antigüedad de la última confirmación con mensajes en vuelo
+        self._last_delivery_at: Optional[float] = None
+        self._started_at = time.time()
+        status.register("kafka", self.status)
+
+        # thread de poll: dispara los callbacks de entrega de todos los mensajes en vuelo
+        self._running = True
+        self._poll_thread = threading.Thread(target=self._poll_loop, name="kafka-poll", daemon=True)
+        self._poll_thread.start()
+
     def _wait_for_metadata(self, timeout: int = 15) -> None:
         """Intenta obtener metadata del cluster antes de permitir produces."""
         deadline = time.time() + timeout
@@ -61,104 +89,134 @@ class KafkaPublisher(IEventPublisher):
             time.sleep(1.0)
         logger.warning("No se obtuvo metadata del broker en %ds; intentos futuros pueden fallar.", timeout)
 
+    def _poll_loop(self) -> None:
+        while self._running:
+            try:
+                self.producer.poll(0.1)
+            except Exception:
+                logger.exception("Error en poll del Kafka producer")
+                time.sleep(0.1)
+
+    def _count(self, key: str) -> None:
+        with self._metrics_lock:
+            self.metrics[key] += 1
+        KAFKA_MESSAGES.labels(result=key.replace("publish_", "")).inc()
+
     # ============================================================
     #  PUBLICAR EVENTO
     # ============================================================
-    def publish(self, result: DetectionResult) -> None:
-        logger.debug("Publish llamado para event_id=%s frame=%s",
+    @staticmethod
+    def _build_message(result: DetectionResult) -> Tuple[str, str]:
+        """Adaptar DetectionResult → (key, evento JSON)."""
+        plate_text = result.plates[0].text if result.plates else ""
+        timestamp_iso = datetime.utcfromtimestamp(result.captured_at).isoformat()
+
+        event = {
+            "plate": plate_text,
+            "cameraId": result.camera_id or result.source,
+            "parkingId": None,
+            "timestamp": timestamp_iso,
+            "frameId": result.frame_id,
+            "imageUrl": None
+        }
+        return str(result.frame_id or ""), json.dumps(event, ensure_ascii=False)
+
+    def publish_async(self, result: DetectionResult) -> "Future[None]":
+        """
+        Produce sin esperar la entrega. Bloquea (hasta delivery_timeout) solo si
+        hay max_in_flight mensajes sin confirmar.
+        """
+        logger.debug("Publish async para event_id=%s frame=%s",
                      getattr(result, "event_id", None), getattr(result, "frame_id", None))
 
-        payload = None
-        start_time = time.time()
-        try:
-            # ------------------------------
-            # Adaptar DetectionResult → evento JSON
-            # ------------------------------
-            plate_text = result.plates[0].text if result.plates else ""
-            timestamp_iso = datetime.utcfromtimestamp(result.captured_at).isoformat()
-
-            event = {
-                "plate": plate_text,
-                "cameraId": result.camera_id or result.source,
-                "parkingId": None,
-                "timestamp": timestamp_iso,
-                "frameId": result.frame_id,
-                "imageUrl": None
-            }
-
-            payload = json.dumps(event, ensure_ascii=False)
-            key = str(result.frame_id or "")
-            delivered = {"err": None, "called": False}
-            ev = threading.Event()
-
-            # ------------------------------
-            # Callback de entrega
-            # ------------------------------
-            def _cb(err, msg):
-                delivered["called"] = True
-                delivered["err"] = err
-                ev.set()
-                if err is not None:
-                    logger.error("❌ Kafka delivery callback error: %s", err)
-                else:
-                    latency = (time.time() - start_time) * 1000
-                    logger.info("✅ Kafka delivered topic=%s partition=%s offset=%s latency=%.1fms",
-                                msg.topic(), msg.partition(), msg.offset(), latency)
-
-            # ------------------------------
-            # Envío del mensaje
-            # ------------------------------
-            self.producer.produce(
-                topic=self.topic,
-                key=key,
-                value=payload.encode("utf-8"),
-                callback=_cb,
-            )
-
-            # ------------------------------
-            # Polling activo mientras se espera el callback
-            # ------------------------------
-            deadline = time.time() + self.delivery_timeout
-            while not ev.is_set() and time.time() < deadline:
-                self.producer.poll(0.1)
-                time.sleep(0.05)
-
-            # ------------------------------
-            # Validar resultado / timeout
-            # ------------------------------
-            if not ev.is_set():
-                logger.warning("⚠️ Timeout esperando confirmación de Kafka (%.1fs)", self.delivery_timeout)
-                try:
-                    self.producer.flush(timeout=5.0)
-                except Exception:
-                    logger.exception("Error durante flush tras timeout")
-                self.metrics["publish_timeout"] += 1
-                raise Exception("Kafka delivery timeout")
-
-            if delivered["err"] is not None:
-                err = delivered["err"]
-                msg_err = err.str() if isinstance(err, KafkaError) and hasattr(err, "str") else str(err)
-                self.metrics["publish_failed"] += 1
-                raise Exception(f"Kafka delivery failed: {msg_err}")
+        key, payload = self._build_message(result)
+        if not self._in_flight.acquire(timeout=self.delivery_timeout):
+            self._count("publish_timeout")
+            raise Exception(f"Kafka in-flight timeout: {self.max_in_flight} mensajes sin confirmar")
 
-            # ------------------------------
-            # Éxito
-            # ------------------------------
-            self.metrics["publish_ok"] += 1
-            logger.debug("Evento publicado correctamente en Kafka topic=%s frame=%s payload=%s",
-                         self.topic, key, payload)
+        fut: "Future[None]" = Future()
+        start_time = time.time()
 
+        # ------------------------------
+        # Callback de entrega (thread de poll)
+        # ------------------------------
+        def _cb(err, msg):
+            self._in_flight.release()
+            if err is not None:
+                msg_err = err.str() if isinstance(err, KafkaError) and hasattr(err, "str") else str(err)
+                if isinstance(err, KafkaError) and err.code() == KafkaError._MSG_TIMED_OUT:
+                    self._count("publish_timeout")
+                    logger.warning("⚠️ Timeout esperando confirmación de Kafka (%.1fs) frame=%s", self.delivery_timeout, key)
+                    fut.set_exception(Exception(f"Kafka delivery timeout: {msg_err}"))
+                else:
+                    self._count("publish_failed")
+                    logger.error("❌ Kafka delivery callback error: %s", err)
+                    fut.set_exception(Exception(f"Kafka delivery failed: {msg_err}"))
+                return
+            self._count("publish_ok")
+            self._last_delivery_at = time.time()
+            KAFKA_DELIVERY_LATENCY.observe(time.time() - start_time)
+            latency = (time.time() - start_time) * 1000
+            logger.info("✅ Kafka delivered topic=%s partition=%s offset=%s latency=%.1fms",
+                        msg.topic(), msg.partition(), msg.offset(), latency)
+            fut.set_result(None)
+
+        # ------------------------------
+        # Envío del mensaje
+        # ------------------------------
+        try:
+            try:
+                self.producer.produce(topic=self.topic, key=key, value=payload.encode("utf-8"), callback=_cb)
+            except BufferError:
+                # cola local de librdkafka llena: dejar que el poll libere espacio y reintentar una vez
+                self.producer.poll(0.5)
+                self.producer.produce(topic=self.topic, key=key, value=payload.encode("utf-8"), callback=_cb)
         except Exception as ex:
+            self._in_flight.release()
+            self._count("publish_failed")
             logger.exception("Error al publicar en Kafka. payload=%s", payload)
-            raise ex
+            raise Exception(f"Kafka produce failed: {ex}") from ex
+
+        return fut
+
+    def publish(self, result: DetectionResult) -> None:
+        fut = self.publish_async(result)
+        try:
+            # margen sobre message.timeout.ms: el callback de timeout llega desde librdkafka
+            fut.result(timeout=self.delivery_timeout + 5.0)
+        except FutureTimeout:
+            self._count("publish_timeout")
+            raise Exception("Kafka delivery timeout")
+        logger.debug("Evento publicado correctamente en Kafka topic=%s frame=%s", self.topic, result.frame_id)
+
+    def status(self) -> dict:
+        in_flight = len(self.producer)
+        now = time.time()
+        p99 = KAFKA_DELIVERY_LATENCY.labels().quantile(0.99)
+        with self._metrics_lock:
+            counts = dict(self.metrics)
+        return {
+            "topic": self.topic,
+            "in_flight": in_flight,
+            # sin confirmaciones desde la última entrega (o el arranque) mientras hay mensajes pendientes
+            "delivery_lag_seconds": round(now - (self._last_delivery_at or self._started_at), 3) if in_flight else 0.0,
+            "last_delivery_at": self._last_delivery_at,
+            "delivery_p99_seconds": round(p99, 4) if p99 == p99 else None,   # nan sin entregas
+            **counts,
+        }
 
     # ============================================================
     #  CIERRE
     # ============================================================
     def close(self, timeout: float = 5.0) -> None:
+        status.unregister("kafka")
         try:
             self.producer.flush(timeout=timeout)
             logger.info("Kafka producer flushed/closed")
             logger.info("Métricas finales: %s", self.metrics)
         except Exception:
             logger.exception("Error al flush/close del Kafka producer")
+        finally:
+            self._running = False
+            if self._poll_thread.is_alive():
+                self._poll_thread.join(timeout=1.0)
@@ -1,5 +1,7 @@
 import time
 import logging
+import threading
+from concurrent.futures import Future
 from typing import Any
 from src.domain.Interfaces.event_publisher import IEventPublisher
 
@@ -9,6 +11,10 @@ class RetryPublisher(IEventPublisher):
     """
     Wrapper que reintenta publish hasta N veces con backoff exponencial.
     Solo reintenta si el error parece transitorio (red, timeout, broker unavailable).
+
+    publish_async() no bloquea: cada mensaje lleva su propio contador de intentos
+    y solo los mensajes que fallan se reprograman (threading.Timer) tras el backoff,
+    sin frenar al resto de envíos en vuelo.
     """
     def __init__(self, inner: IEventPublisher, attempts: int = 3, base_delay: float = 0.5):
         self.inner = inner
@@ -53,3 +59,40 @@ class RetryPublisher(IEventPublisher):
         # Si fallaron todos los intentos
         logger.error("❌ All publish attempts failed after %d retries: %s", self.attempts, last_exc)
         raise last_exc
+
+    def publish_async(self, payload: Any) -> "Future[None]":
+        outer: "Future[None]" = Future()
+        self._attempt_async(payload, outer, 1)
+        return outer
+
+    def _attempt_async(self, payload: Any, outer: "Future[None]", attempt: int) -> None:
+        try:
+            inner = self.inner.publish_async(payload)
+        except Exception as e:
+            self._on_async_failure(payload, outer, attempt, e)
+            return
+
+        def _done(f: Future) -> None:
+            exc = f.exception()
+            if exc is None:
+                logger.debug("Publish OK (attempt %d/%d)", attempt, self.attempts)
+                outer.set_result(None)
+            else:
+                self._on_async_failure(payload, outer, attempt, exc)
+
+        inner.add_done_callback(_done)
+
+    def _on_async_failure(self, payload: Any, outer: "Future[None]", attempt: int, exc: BaseException) -> None:
+        if not isinstance(exc, Exception) or not self._is_transient_error(exc):
+            logger.error("Non-retryable publish error: %s", exc)
+            outer.set_exception(exc)
+            return
+        if attempt >= self.attempts:
+            logger.error("❌ All publish attempts failed after %d retries: %s", self.attempts, exc)
+            outer.set_exception(exc)
+            return
+        wait = self.base_delay * (2 ** (attempt - 1))
+        logger.warning("Publish attempt %d failed (transient), retrying in %.2fs: %s", attempt, wait, exc)
+        timer = threading.Timer(wait, self._attempt_async, args=(payload, outer, attempt + 1))
+        timer.daemon = True
+        timer.start()
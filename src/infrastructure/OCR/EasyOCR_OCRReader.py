@@ -1,56 +1,127 @@
 import easyocr
-import time
+import cv2
+from typing import List, Optional, Tuple
 from src.domain.Models.frame import Frame
 from src.domain.Models.plate import Plate
 from src.domain.Interfaces.ocr_reader import IOCRReader
+from src.infrastructure.OCR.plate_crop_preprocessor import PlateCropPreprocessor
+from src.infrastructure.OCR.ocr_result_cache import OCRResultCache
 from src.core.config import settings
 
 class EasyOCR_OCRReader(IOCRReader):
     """
     Implementación optimizada usando EasyOCR:
-    - OCR cada N frames
-    - Cache de resultados recientes
+    - Caché acotada (LRU + TTL) por posición y apariencia del recorte y cámara:
+      un vehículo detenido no vuelve a pasar por el reconocedor en cada frame
     - Filtro de resultados inválidos (longitud mínima y confianza mínima)
+    - Las placas ya vienen recortadas por el detector: se omite la etapa de
+      detección de texto de EasyOCR y todos los recortes van al reconocedor
+      en un solo batch (Reader.recognize con horizontal_list)
+    - con OCR_PREPROCESS los recortes se preparan antes (padding, alto fijo,
+      CLAHE, deskew; ver PlateCropPreprocessor) y van apilados en un lienzo
     """
     def __init__(self):
         self.reader = easyocr.Reader([settings.ocr_lang], gpu=True)  # usa GPU si está disponible
-        self.ocr_interval = settings.ocr_interval
         self.min_length = settings.ocr_min_length
         self.min_confidence = settings.ocr_min_confidence  # 👈 nuevo
-        self.frame_counter = 0
-        self.cache = {}  # {bbox: (text, confidence, timestamp)}
+        self.cache = OCRResultCache() if getattr(settings, "ocr_cache_size", 1024) > 0 else None
+        self.preprocessor = PlateCropPreprocessor() if getattr(settings, "ocr_preprocess", True) else None
 
     def read_text(self, frame: Frame, plate: Plate) -> Plate:
-        self.frame_counter += 1
-        bbox_key = tuple(plate.bounding_box)
-
-        # Cache
-        if bbox_key in self.cache:
-            cached_text, cached_conf, ts = self.cache[bbox_key]
-            if self.frame_counter % self.ocr_interval != 0:
-                plate.text = cached_text
-                plate.confidence = cached_conf
-                return plate
-
-        # Recortar región de placa
-        x, y, w, h = plate.bounding_box
-        crop = frame.image[y:y+h, x:x+w]
-
-        # Ejecutar OCR
-        results = self.reader.readtext(crop)
-
-        if results:
-            text, confidence = results[0][1], results[0][2]
-            # Filtrar: longitud mínima + confianza mínima
-            if len(text) >= self.min_length and confidence >= self.min_confidence:
-                plate.text = text.strip().upper()
-                plate.confidence = confidence
-                self.cache[bbox_key] = (plate.text, confidence, time.time())
-            else:
-                plate.text = ""
-                plate.confidence = 0.0
+        return self.read_batch(frame, [plate])[0]
+
+    def read_batch(self, frame: Frame, plates: List[Plate]) -> List[Plate]:
+        """
+        Reconoce todas las placas del frame con una única llamada al reconocedor.
+        """
+        # Convertir a gris una sola vez; EasyOCR trabaja sobre la imagen en gris
+        image = frame.image
+        grey = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+        img_h, img_w = grey.shape[:2]
+
+        camera_id = getattr(frame, "source", None)
+        pending, crops = [], []
+        for plate in plates:
+            crop = self._cache_crop(grey, plate)
+            if crop is not None:
+                hit = self.cache.get(camera_id, plate.bounding_box, crop)
+                if hit is not None:
+                    self._apply_result(plate, *hit, cached=True)
+                    continue
+            pending.append(plate)
+            crops.append(crop)
+
+        if not pending:
+            return plates
+
+        if self.preprocessor is not None:
+            # recortes preparados, uno por fila del lienzo: las cajas pasan a ser las filas
+            boxes = [self.preprocessor.padded_box(plate.bounding_box, img_w, img_h) for plate in pending]
+            grey, placed = self.preprocessor.prepare_batch(grey, boxes)
+            boxes = [box or (0, 0, 0, 0) for box in placed]
+        else:
+            boxes = [self._clamp_box(plate.bounding_box, img_w, img_h) for plate in pending]
+
+        # horizontal_list en formato EasyOCR: [x_min, x_max, y_min, y_max]
+        horizontal_list = [[x1, x2, y1, y2] for (x1, y1, x2, y2) in boxes if x2 > x1 and y2 > y1]
+        if not horizontal_list:
+            for plate in pending:
+                self._apply_result(plate, "", 0.0)
+            return plates
+
+        # Sin etapa de detección: recognize recorta cada caja y la pasa al reconocedor
+        results = self.reader.recognize(
+            grey,
+            horizontal_list=horizontal_list,
+            free_list=[],
+            batch_size=len(horizontal_list),
+            detail=1,
+        )
+
+        # recognize puede reordenar las cajas (las ordena por 'y'): mapear por esquina
+        by_corner = {}
+        for box, text, confidence in results:
+            (x_min, y_min) = box[0]
+            by_corner[(int(x_min), int(y_min))] = (text, confidence)
+
+        for plate, (x1, y1, x2, y2), crop in zip(pending, boxes, crops):
+            text, confidence = by_corner.get((x1, y1), ("", 0.0))
+            if crop is not None:
+                # también lecturas fallidas: un recorte ilegible detenido no se reintenta cada frame
+                self.cache.put(camera_id, plate.bounding_box, crop, text, confidence)
+            self._apply_result(plate, text, confidence)
+
+        return plates
+
+    def _cache_crop(self, grey, plate: Plate):
+        """Recorte en gris (sin padding) para la caché; None sin caché o caja vacía."""
+        if self.cache is None:
+            return None
+        img_h, img_w = grey.shape[:2]
+        x1, y1, x2, y2 = self._clamp_box(plate.bounding_box, img_w, img_h)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return None
+        return grey[y1:y2, x1:x2]
+
+    def crop_quality(self, frame: Frame, plate: Plate) -> float:
+        if self.preprocessor is None:
+            return 1.0
+        return self.preprocessor.quality(frame.image, plate.bounding_box)
+
+    def _apply_result(self, plate: Plate, text: str, confidence: float, cached: bool = False) -> None:
+        plate.cached = cached
+        # Filtrar: longitud mínima + confianza mínima
+        if text and len(text) >= self.min_length and confidence >= self.min_confidence:
+            plate.text = text.strip().upper()
+            plate.confidence = confidence
         else:
             plate.text = ""
             plate.confidence = 0.0
 
-        return plate
+    @staticmethod
+    def _clamp_box(bounding_box, img_w: int, img_h: int) -> Tuple[int, int, int, int]:
+        """(x, y, w, h) -> (x1, y1, x2, y2) recortado a los límites de la imagen."""
+        x, y, w, h = (int(v) for v in bounding_box)
+        x1, y1 = max(0, x), max(0, y)
+        x2, y2 = min(img_w, x + w), min(img_h, y + h)
+        return x1, y1, x2, y2
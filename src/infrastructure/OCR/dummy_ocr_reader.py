@@ -1,6 +1,6 @@
-from domain.Models.frame import Frame
-from domain.Models.plate import Plate
-from domain.Interfaces.ocr_reader import IOCRReader
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+from src.domain.Interfaces.ocr_reader import IOCRReader
 
 class DummyOCRReader(IOCRReader):
     """
@@ -8,6 +8,6 @@ class DummyOCRReader(IOCRReader):
     """
 
     def read_text(self, frame: Frame, plate: Plate) -> Plate:
-        plate.text = "FAKE123"
+        plate.text = "ABC123"   # 6 caracteres: pasa el filtro de PLATE_MAX_LENGTH y el normalizador
         plate.confidence = 0.99
         return plate
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from src.core.config import settings
+from src.domain.Interfaces.ocr_reader import IOCRReader
+from src.infrastructure.OCR.plate_crop_preprocessor import PlateCropPreprocessor
+
+def create_ocr_reader() -> IOCRReader:
+    backend = settings.ocr_backend.lower()
+    if backend == "onnx":
+        # Reconocedor CRNN compacto exportado a ONNX (CTC, charset A-Z0-9), sin torch
+        from src.infrastructure.OCR.onnx_crnn_ocr_reader import OnnxCRNNOCRReader
+        return OnnxCRNNOCRReader()
+    else:
+        # EasyOCR (reconocedor general, torch)
+        from src.infrastructure.OCR.EasyOCR_OCRReader import EasyOCR_OCRReader
+        return EasyOCR_OCRReader()
+
+def create_crop_preprocessor() -> Optional[PlateCropPreprocessor]:
+    """
+    Preprocesador con el que el backend configurado puntúa crop_quality(), sin
+    cargar el modelo (p.ej. en el proceso padre del pool de inferencia). None =
+    el backend no puntúa (toda placa vale 1.0).
+    quality() solo depende de padding y alto mínimo (settings), no del alto de
+    entrada del modelo, así que coincide con el del lector del backend.
+    """
+    if settings.ocr_backend.lower() == "onnx":
+        # OnnxCRNNOCRReader siempre prepara y puntúa los recortes (ignora OCR_PREPROCESS)
+        return PlateCropPreprocessor()
+    return PlateCropPreprocessor() if getattr(settings, "ocr_preprocess", True) else None
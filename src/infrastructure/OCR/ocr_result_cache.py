@@ -0,0 +1,172 @@
+# src/infrastructure/OCR/ocr_result_cache.py
+import time
+import itertools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+import cv2
+import numpy as np
+
+from src.core.config import settings
+from src.core.metrics import registry
+
+OCR_CACHE = registry.counter("anpr_ocr_cache_total", "Consultas/evicciones de la caché de OCR (hit, miss, eviction, expired)", ("result",))
+OCR_CACHE_SIZE = registry.gauge("anpr_ocr_cache_entries", "Entradas en la caché de OCR")
+
+_CELL = 32          # px: celda de la grilla por centro del bbox (se buscan también las 8 vecinas)
+_MARGIN = 4         # px recortados a cada lado de la plantilla: holgura de alineación (jitter del bbox)
+_MAX_WIDTH = 192    # px: recortes más anchos se comparan reducidos (mismo factor para ambos lados)
+_STRIPS = 12        # franjas verticales (~2 por carácter) para la diferencia local
+_SIZE_TOLERANCE = 0.15
+_MAX_CANDIDATES = 8 # entradas más recientes que se verifican por consulta
+
+
+@dataclass
+class _Entry:
+    camera: str
+    cell: Tuple[int, int]
+    size: Tuple[float, float]       # (w, h) del bbox
+    scale: float                    # factor aplicado al recorte antes de comparar
+    template: np.ndarray            # recorte suavizado sin el margen (float32)
+    standard: np.ndarray            # plantilla estandarizada (media 0, desvío 1)
+    strips: np.ndarray              # columnas de inicio de cada franja
+    text: str
+    confidence: float
+    expires: float
+
+
+class OCRResultCache:
+    """
+    Caché acotada de resultados OCR por apariencia del recorte y posición.
+
+    - candidatos: entradas de la misma cámara cuyo centro de bbox cae en la
+      misma celda de `_CELL` px o en una vecina, con tamaño similar (vehículo
+      detenido en la barrera, bbox con jitter de unos píxeles)
+    - verificación a resolución nativa: la plantilla guardada (recorte
+      suavizado sin `_MARGIN` px de borde) se alinea sobre el recorte nuevo con
+      matchTemplate y se compara por franjas verticales; la diferencia es la de
+      la peor franja, así un solo carácter distinto ya no coincide mientras que
+      un desplazamiento de 1-2 px sí
+    - LRU con `max_entries` (memoria plana en servicio 24/7) y TTL por entrada
+      (un resultado no se reutiliza indefinidamente)
+    - contadores hit/miss/eviction/expired en /metrics
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[float] = None, max_diff: Optional[float] = None):
+        self.max_entries = max(1, max_entries if max_entries is not None else getattr(settings, "ocr_cache_size", 1024))
+        self.ttl = ttl if ttl is not None else getattr(settings, "ocr_cache_ttl", 2.0)
+        self.max_diff = max_diff if max_diff is not None else getattr(settings, "ocr_cache_max_diff", 0.08)
+        self._entries: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._index: Dict[Tuple[str, Tuple[int, int]], Set[int]] = {}
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        OCR_CACHE_SIZE.labels().set_function(lambda: len(self._entries))
+
+    def get(self, camera_id: Optional[str], bounding_box: Sequence[float], grey_crop: np.ndarray) -> Optional[Tuple[str, float]]:
+        """(texto, confianza) de una lectura previa del mismo recorte, o None."""
+        camera = camera_id or "default"
+        cell, size = self._geometry(bounding_box)
+        now = time.monotonic()
+        prepared: Dict[float, np.ndarray] = {}
+        with self._lock:
+            checked = 0
+            # las más recientes primero: la primera que coincide es la lectura vigente
+            for entry_id in sorted(self._candidates(camera, cell), reverse=True):
+                entry = self._entries[entry_id]
+                if now >= entry.expires:
+                    self._remove(entry_id)
+                    OCR_CACHE.labels(result="expired").inc()
+                    continue
+                if checked >= _MAX_CANDIDATES or not self._similar_size(entry.size, size):
+                    continue
+                checked += 1
+                crop = prepared.get(entry.scale)
+                if crop is None:
+                    crop = prepared[entry.scale] = self._prepare(grey_crop, entry.scale)
+                if self._difference(entry, crop) <= self.max_diff:
+                    self._entries.move_to_end(entry_id)
+                    OCR_CACHE.labels(result="hit").inc()
+                    return entry.text, entry.confidence
+            OCR_CACHE.labels(result="miss").inc()
+            return None
+
+    def put(self, camera_id: Optional[str], bounding_box: Sequence[float], grey_crop: np.ndarray, text: str, confidence: float) -> None:
+        h, w = grey_crop.shape[:2]
+        if w <= 2 * _MARGIN + 2 or h <= 2 * _MARGIN + 2:
+            return
+        camera = camera_id or "default"
+        cell, size = self._geometry(bounding_box)
+        scale = min(1.0, _MAX_WIDTH / float(w))
+        template = self._prepare(grey_crop, scale)[_MARGIN:-_MARGIN, _MARGIN:-_MARGIN].copy()
+        standard = (template - template.mean()) / (template.std() + 1e-3)
+        strips = np.unique(np.linspace(0, template.shape[1], _STRIPS + 1).astype(int)[:-1])
+        entry = _Entry(camera, cell, size, scale, template, standard, strips, text, confidence, time.monotonic() + self.ttl)
+        with self._lock:
+            entry_id = next(self._ids)
+            self._entries[entry_id] = entry
+            self._index.setdefault((camera, cell), set()).add(entry_id)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                OCR_CACHE.labels(result="eviction").inc()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+
+    # ----- internos -----
+    @staticmethod
+    def _geometry(bounding_box: Sequence[float]) -> Tuple[Tuple[int, int], Tuple[float, float]]:
+        x, y, w, h = (float(v) for v in bounding_box)
+        return (int((x + w / 2.0) // _CELL), int((y + h / 2.0) // _CELL)), (w, h)
+
+    @staticmethod
+    def _similar_size(a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+        return all(abs(p - q) <= _SIZE_TOLERANCE * max(p, q, 1.0) for p, q in zip(a, b))
+
+    def _candidates(self, camera: str, cell: Tuple[int, int]):
+        cx, cy = cell
+        ids = []
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                ids.extend(self._index.get((camera, (cx + dx, cy + dy)), ()))
+        return ids
+
+    def _remove(self, entry_id: int) -> None:
+        entry = self._entries.pop(entry_id, None)
+        if entry is None:
+            return
+        key = (entry.camera, entry.cell)
+        bucket = self._index.get(key)
+        if bucket is not None:
+            bucket.discard(entry_id)
+            if not bucket:
+                del self._index[key]
+
+    @staticmethod
+    def _prepare(grey_crop: np.ndarray, scale: float) -> np.ndarray:
+        crop = grey_crop
+        if scale < 1.0:
+            h, w = crop.shape[:2]
+            crop = cv2.resize(crop, (max(1, int(round(w * scale))), max(1, int(round(h * scale)))), interpolation=cv2.INTER_AREA)
+        # suavizado: el ruido del sensor y la compresión no cuentan como diferencia
+        return cv2.GaussianBlur(crop.astype(np.float32), (0, 0), 1.0)
+
+    @staticmethod
+    def _difference(entry: _Entry, crop: np.ndarray) -> float:
+        """Diferencia media absoluta (niveles estandarizados) de la peor franja tras alinear; inf si no se puede alinear."""
+        th, tw = entry.template.shape[:2]
+        if crop.shape[0] < th or crop.shape[1] < tw:
+            return float("inf")
+        response = cv2.matchTemplate(crop, entry.template, cv2.TM_CCOEFF_NORMED)
+        _, _, _, (x, y) = cv2.minMaxLoc(response)
+        patch = crop[y:y + th, x:x + tw]
+        mean, std = cv2.meanStdDev(patch)
+        columns = np.abs((patch - float(mean[0, 0])) / (float(std[0, 0]) + 1e-3) - entry.standard).sum(axis=0)
+        widths = np.diff(np.append(entry.strips, tw))
+        return float((np.add.reduceat(columns, entry.strips) / (widths * th)).max())
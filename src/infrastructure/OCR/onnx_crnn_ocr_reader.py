@@ -0,0 +1,194 @@
+import os
+import string
+from typing import List, Optional, Tuple
+
+import numpy as np
+import cv2
+
+from src.domain.Models.frame import Frame
+from src.domain.Models.plate import Plate
+from src.domain.Interfaces.ocr_reader import IOCRReader
+from src.infrastructure.OCR.plate_crop_preprocessor import PlateCropPreprocessor
+from src.infrastructure.OCR.ocr_result_cache import OCRResultCache
+from src.core.config import settings
+
+from loguru import logger
+
+# caracteres que acepta PlateNormalizer: el resto de clases del modelo no se decodifica
+PLATE_CHARSET = frozenset(string.ascii_uppercase + string.digits)
+
+
+class OnnxCRNNOCRReader(IOCRReader):
+    """
+    Reconocedor de placas compacto (CRNN / PaddleOCR-rec exportado a ONNX) con
+    ONNX Runtime en CPU, alternativa a EasyOCR para un problema de una sola
+    línea y charset fijo.
+
+    - entrada [N, C, H, W] (C = 1 o 3); recortes preparados con
+      PlateCropPreprocessor al alto del modelo y rellenados a un ancho común
+    - un único session.run por frame si el grafo tiene batch dinámico
+    - salida [N, T, clases] o [T, N, clases] (logits o probabilidades);
+      decodificación CTC greedy: argmax por paso, colapso de repetidos y
+      descarte del blank
+    - las clases fuera de A-Z0-9 (modelos con charset general) se enmascaran
+      antes del argmax
+    - confianza = media de la probabilidad de los pasos emitidos
+    - misma caché por posición y apariencia del recorte y mismo filtro (longitud/confianza)
+      que EasyOCR_OCRReader
+    """
+
+    def __init__(self, model_path: Optional[str] = None, charset: Optional[str] = None, blank_index: Optional[int] = None):
+        try:
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError(
+                "Falta dependencia para el OCR ONNX. Instala:\n"
+                "  pip install onnxruntime   (o onnxruntime-openvino)"
+            ) from e
+
+        self.model_path = model_path or settings.ocr_onnx_model_path
+        if not os.path.isfile(self.model_path):
+            raise FileNotFoundError(f"No se encontró el modelo OCR ONNX en {self.model_path} (OCR_ONNX_MODEL_PATH)")
+
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if settings.onnx_intra_op_threads > 0:
+            opts.intra_op_num_threads = int(settings.onnx_intra_op_threads)
+        if settings.onnx_inter_op_threads > 0:
+            opts.inter_op_num_threads = int(settings.onnx_inter_op_threads)
+
+        available = ort.get_available_providers()
+        wanted = [p.strip() for p in settings.onnx_providers.split(",") if p.strip()]
+        providers = [p for p in wanted if p in available] or ["CPUExecutionProvider"]
+        self.session = ort.InferenceSession(self.model_path, sess_options=opts, providers=providers)
+
+        inp = self.session.get_inputs()[0]
+        self.input_name = inp.name
+        batch_dim, c_dim, h_dim, w_dim = inp.shape
+        self.dynamic_batch = not isinstance(batch_dim, int)
+        self.channels = c_dim if isinstance(c_dim, int) else 1
+        self.input_h = h_dim if isinstance(h_dim, int) else int(settings.ocr_onnx_input_height)
+        self.input_w = w_dim if isinstance(w_dim, int) else int(settings.ocr_onnx_input_width)
+        self.dynamic_width = not isinstance(w_dim, int)
+
+        # clases: blank + charset del modelo (en el orden del entrenamiento)
+        charset = charset if charset is not None else settings.ocr_onnx_charset
+        blank_index = blank_index if blank_index is not None else settings.ocr_onnx_blank_index
+        n_classes = len(charset) + 1
+        self.blank = blank_index % n_classes
+        self.classes: List[str] = list(charset)
+        self.classes.insert(self.blank, "")
+        self.classes = [c.upper() for c in self.classes]
+        self.allowed = np.array([i == self.blank or c in PLATE_CHARSET for i, c in enumerate(self.classes)])
+
+        self.min_length = settings.ocr_min_length
+        self.min_confidence = settings.ocr_min_confidence
+        self.preprocessor = PlateCropPreprocessor(height=self.input_h, max_width=self.input_w)
+        self.cache = OCRResultCache() if getattr(settings, "ocr_cache_size", 1024) > 0 else None
+
+        logger.info(
+            f"[OCR-ONNX] Modelo {self.model_path} providers={self.session.get_providers()} "
+            f"input={self.channels}x{self.input_h}x{self.input_w} dynamic_batch={self.dynamic_batch} "
+            f"clases={n_classes} (blank={self.blank})"
+        )
+
+    def read_text(self, frame: Frame, plate: Plate) -> Plate:
+        return self.read_batch(frame, [plate])[0]
+
+    def read_batch(self, frame: Frame, plates: List[Plate]) -> List[Plate]:
+        grey = PlateCropPreprocessor.to_grey(frame.image)
+        img_h, img_w = grey.shape[:2]
+        camera_id = getattr(frame, "source", None)
+
+        pending: List[Tuple[Plate, np.ndarray, Optional[np.ndarray]]] = []
+        for plate in plates:
+            box = self.preprocessor.padded_box(plate.bounding_box, img_w, img_h)
+            x1, y1, x2, y2 = box
+            raw = None
+            if self.cache is not None and x2 - x1 >= 2 and y2 - y1 >= 2:
+                raw = grey[y1:y2, x1:x2]
+                hit = self.cache.get(camera_id, plate.bounding_box, raw)
+                if hit is not None:
+                    self._apply_result(plate, *hit, cached=True)
+                    continue
+            crop = self.preprocessor.prepare(grey, box)
+            if crop is None:
+                self._apply_result(plate, "", 0.0)
+                continue
+            pending.append((plate, crop, raw))
+
+        if not pending:
+            return plates
+
+        groups = [pending] if self.dynamic_batch else [[p] for p in pending]
+        for group in groups:
+            try:
+                texts = self._recognize([crop for _, crop, _ in group])
+            except Exception as e:
+                logger.error(f"[OCR-ONNX] Error en inferencia: {e}")
+                texts = [("", 0.0)] * len(group)
+            for (plate, _, raw), (text, confidence) in zip(group, texts):
+                if raw is not None:
+                    self.cache.put(camera_id, plate.bounding_box, raw, text, confidence)
+                self._apply_result(plate, text, confidence)
+        return plates
+
+    def crop_quality(self, frame: Frame, plate: Plate) -> float:
+        return self.preprocessor.quality(frame.image, plate.bounding_box)
+
+    # ----- inferencia -----
+    def _recognize(self, crops: List[np.ndarray]) -> List[Tuple[str, float]]:
+        width = self.input_w
+        if self.dynamic_width:
+            # ancho del recorte más ancho, múltiplo del stride horizontal típico del backbone
+            width = int(np.ceil(max(c.shape[1] for c in crops) / 4.0) * 4)
+        blob = np.empty((len(crops), self.channels, self.input_h, width), dtype=np.float32)
+        for i, crop in enumerate(crops):
+            if crop.shape[1] < width:
+                crop = cv2.copyMakeBorder(crop, 0, 0, 0, width - crop.shape[1], cv2.BORDER_REPLICATE)
+            blob[i] = crop[:, :width]
+        blob *= 2.0 / 255.0     # normalización CRNN/PaddleOCR: (x / 255 - 0.5) / 0.5
+        blob -= 1.0
+
+        out = self.session.run(None, {self.input_name: blob})[0]
+        return self._ctc_decode(self._to_ntc(out, len(crops)))
+
+    def _to_ntc(self, out: np.ndarray, n: int) -> np.ndarray:
+        """Salida a [N, T, clases] con probabilidades."""
+        if out.ndim == 4 and out.shape[2] == 1:    # [N, clases, 1, T] de algunos exports CRNN
+            out = out[:, :, 0, :].transpose(0, 2, 1)
+        if out.ndim != 3 or out.shape[2] != len(self.classes):
+            raise ValueError(f"Salida OCR con forma {out.shape}; se esperaba [N, T, {len(self.classes)}]")
+        if out.shape[0] != n and out.shape[1] == n:
+            out = out.transpose(1, 0, 2)
+        if out.min() < 0.0 or not np.allclose(out.sum(axis=2), 1.0, atol=1e-3):
+            out = np.exp(out - out.max(axis=2, keepdims=True))
+            out /= out.sum(axis=2, keepdims=True)
+        return out
+
+    def _ctc_decode(self, probs: np.ndarray) -> List[Tuple[str, float]]:
+        """CTC greedy restringido al charset de placas."""
+        probs = np.where(self.allowed, probs, 0.0)
+        idx = probs.argmax(axis=2)
+        best = np.take_along_axis(probs, idx[..., None], axis=2)[..., 0]
+        emit = idx != self.blank
+        emit[:, 1:] &= idx[:, 1:] != idx[:, :-1]
+
+        results: List[Tuple[str, float]] = []
+        for row_idx, row_emit, row_best in zip(idx, emit, best):
+            chars = row_idx[row_emit]
+            if chars.size == 0:
+                results.append(("", 0.0))
+                continue
+            results.append(("".join(self.classes[c] for c in chars), float(row_best[row_emit].mean())))
+        return results
+
+    def _apply_result(self, plate: Plate, text: str, confidence: float, cached: bool = False) -> None:
+        plate.cached = cached
+        # Filtrar: longitud mínima + confianza mínima
+        if text and len(text) >= self.min_length and confidence >= self.min_confidence:
+            plate.text = text
+            plate.confidence = confidence
+        else:
+            plate.text = ""
+            plate.confidence = 0.0
@@ -0,0 +1,162 @@
+# src/infrastructure/OCR/plate_crop_preprocessor.py
+import math
+import threading
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from src.core.config import settings
+
+Box = Tuple[int, int, int, int]   # (x1, y1, x2, y2)
+
+
+def _ramp(value: float, lo: float, hi: float) -> float:
+    return float(min(1.0, max(0.0, (value - lo) / (hi - lo)))) if hi > lo else float(value >= hi)
+
+
+class PlateCropPreprocessor:
+    """
+    Preparación de recortes de placa antes del reconocedor OCR.
+
+    - padding alrededor de la caja del detector (no cortar el primer/último carácter)
+    - escala a una altura fija (la del reconocedor) con ancho máximo: las placas
+      lejanas se amplían y las grandes no se reconocen a resolución completa
+    - gris, CLAHE (contraste local) y LUT de gamma precalculada
+    - deskew con Hough sobre los bordes (inclinación < max_skew grados)
+    - quality(): puntaje 0-1 (tamaño, nitidez, contraste) para no gastar una
+      llamada de OCR en recortes que seguro fallan
+
+    El CLAHE y los buffers de salida (lienzo del batch) se reutilizan por hilo.
+    """
+
+    BLUR_REF = 60.0       # varianza del Laplaciano con la que un recorte se considera nítido
+    CONTRAST_REF = 40.0   # rango p5-p95 (niveles de gris) con el que se considera contrastado
+
+    def __init__(
+        self,
+        height: Optional[int] = None,
+        max_width: Optional[int] = None,
+        padding: Optional[float] = None,
+        clahe_clip: Optional[float] = None,
+        gamma: Optional[float] = None,
+        deskew: Optional[bool] = None,
+        max_skew: float = 15.0,
+        min_height: Optional[int] = None,
+    ):
+        self.height = max(8, height if height is not None else getattr(settings, "ocr_crop_height", 64))
+        self.max_width = max(self.height, max_width if max_width is not None else getattr(settings, "ocr_crop_max_width", 384))
+        self.padding = padding if padding is not None else getattr(settings, "ocr_crop_padding", 0.08)
+        self.clahe_clip = clahe_clip if clahe_clip is not None else getattr(settings, "ocr_clahe_clip", 2.0)
+        self.deskew = deskew if deskew is not None else getattr(settings, "ocr_deskew", True)
+        self.max_skew = max_skew
+        self.min_height = max(1, min_height if min_height is not None else getattr(settings, "ocr_min_crop_height", 12))
+
+        gamma = gamma if gamma is not None else getattr(settings, "ocr_crop_gamma", 1.0)
+        self._lut = None
+        if gamma and abs(gamma - 1.0) > 1e-3:
+            self._lut = (np.power(np.arange(256) / 255.0, 1.0 / gamma) * 255.0).clip(0, 255).astype(np.uint8)
+        self._local = threading.local()
+
+    # ----- recortes -----
+    def padded_box(self, bounding_box: Sequence[float], img_w: int, img_h: int) -> Box:
+        """(x, y, w, h) del detector -> (x1, y1, x2, y2) con padding, recortado a la imagen."""
+        x, y, w, h = (float(v) for v in bounding_box)
+        px, py = w * self.padding, h * self.padding
+        x1, y1 = max(0, int(x - px)), max(0, int(y - py))
+        x2, y2 = min(img_w, int(math.ceil(x + w + px))), min(img_h, int(math.ceil(y + h + py)))
+        return x1, y1, x2, y2
+
+    def prepare(self, grey: np.ndarray, box: Box) -> Optional[np.ndarray]:
+        """Recorte listo para el reconocedor (alto fijo, uint8); None si la caja está vacía."""
+        x1, y1, x2, y2 = box
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return None
+        crop = grey[y1:y2, x1:x2]
+        h, w = crop.shape[:2]
+        out_w = int(min(self.max_width, max(1, round(w * self.height / float(h)))))
+        interp = cv2.INTER_CUBIC if self.height > h else cv2.INTER_AREA
+        out = cv2.resize(crop, (out_w, self.height), interpolation=interp)
+
+        out = self._clahe().apply(out)
+        if self._lut is not None:
+            out = cv2.LUT(out, self._lut)
+        if self.deskew:
+            out = self._deskew(out)
+        return out
+
+    def prepare_batch(self, grey: np.ndarray, boxes: List[Box], gap: int = 4) -> Tuple[np.ndarray, List[Optional[Box]]]:
+        """
+        Prepara todos los recortes y los apila en un lienzo (una fila por recorte)
+        para una sola llamada al reconocedor. Devuelve el lienzo y la caja de
+        cada recorte dentro de él (None si el recorte estaba vacío).
+        """
+        crops = [self.prepare(grey, box) for box in boxes]
+        row = self.height + gap
+        width = max([c.shape[1] for c in crops if c is not None] or [1])
+        canvas = self._canvas(len(crops) * row, width)
+        placed: List[Optional[Box]] = []
+        for i, crop in enumerate(crops):
+            if crop is None:
+                placed.append(None)
+                continue
+            y = i * row
+            canvas[y:y + self.height, :crop.shape[1]] = crop
+            placed.append((0, y, crop.shape[1], y + self.height))
+        return canvas, placed
+
+    # ----- calidad -----
+    def quality(self, image: np.ndarray, bounding_box: Sequence[float]) -> float:
+        """
+        Mínimo de tamaño, nitidez y contraste del recorte (0 = seguro falla, 1 = bueno).
+        Acepta el frame BGR o gris: solo se convierte a gris el recorte con padding.
+        """
+        img_h, img_w = image.shape[:2]
+        x1, y1, x2, y2 = self.padded_box(bounding_box, img_w, img_h)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            return 0.0
+        size = _ramp(float(bounding_box[3]), 0.5 * self.min_height, 1.5 * self.min_height)
+        if size == 0.0:
+            return 0.0
+        crop = self.to_grey(image[y1:y2, x1:x2])
+        sharpness = _ramp(float(cv2.Laplacian(crop, cv2.CV_32F).var()), 0.0, self.BLUR_REF)
+        p5, p95 = np.percentile(crop, (5, 95))
+        contrast = _ramp(float(p95 - p5), 0.0, self.CONTRAST_REF)
+        return min(size, sharpness, contrast)
+
+    @staticmethod
+    def to_grey(image: np.ndarray) -> np.ndarray:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+
+    # ----- internos -----
+    def _clahe(self):
+        clahe = getattr(self._local, "clahe", None)
+        if clahe is None:
+            clahe = self._local.clahe = cv2.createCLAHE(clipLimit=self.clahe_clip, tileGridSize=(4, 4))
+        return clahe
+
+    def _canvas(self, h: int, w: int) -> np.ndarray:
+        buf = getattr(self._local, "canvas", None)
+        if buf is None or buf.shape[0] < h or buf.shape[1] < w:
+            buf = self._local.canvas = np.empty((max(h, self.height * 4), max(w, self.max_width)), dtype=np.uint8)
+        canvas = buf[:h, :w]
+        canvas.fill(0)
+        return canvas
+
+    def _deskew(self, img: np.ndarray) -> np.ndarray:
+        """Corrige la inclinación: mediana del ángulo de los segmentos casi horizontales (bordes de la placa, renglón)."""
+        h, w = img.shape[:2]
+        edges = cv2.Canny(img, 50, 150)
+        lines = cv2.HoughLinesP(edges, 1, np.pi / 180, threshold=20, minLineLength=max(8, w // 3), maxLineGap=5)
+        if lines is None:
+            return img
+        segments = lines.reshape(-1, 4).astype(np.float32)
+        angles = np.degrees(np.arctan2(segments[:, 3] - segments[:, 1], segments[:, 2] - segments[:, 0]))
+        angles = angles[np.abs(angles) <= self.max_skew]
+        if angles.size == 0:
+            return img
+        angle = float(np.median(angles))
+        if abs(angle) < 1.0:
+            return img
+        rot = cv2.getRotationMatrix2D((w / 2.0, h / 2.0), angle, 1.0)
+        return cv2.warpAffine(img, rot, (w, h), flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
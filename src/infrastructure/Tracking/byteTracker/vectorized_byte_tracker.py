@@ -0,0 +1,352 @@
+# src/infrastructure/Tracking/byteTracker/vectorized_byte_tracker.py
+"""
+BYTETracker con almacenamiento struct-of-arrays.
+
+Mismo algoritmo y umbrales que byte_tracker.BYTETracker (asociación en dos
+etapas, confirmación de tracks nuevos, buffer de perdidos y eliminación de
+duplicados), pero sin un objeto STrack por detección ni listas/dicts
+reconstruidos por frame:
+
+- el estado de todos los tracks vive en arrays NumPy preasignados
+  (mean Nx8, covariance Nx8x8, state, ids, scores, frames); un track es un
+  índice de slot y las listas tracked/lost son arrays de slots
+- predict/update/initiate del Kalman en lote sobre todos los slots afectados
+- IoU vectorizado con la convención +1 de cython_bbox (mismos costos que el
+  tracker original) y lapjv para la asignación
+- update() devuelve directamente el track asignado a cada detección, sin una
+  pasada extra de IoU en el adaptador
+
+Sin dependencias de torch ni cython_bbox.
+"""
+from typing import Tuple
+
+import numpy as np
+import lap
+
+from .basetrack import BaseTrack, TrackState
+
+_STD_POS = 1.0 / 20
+_STD_VEL = 1.0 / 160
+
+
+class TrackStore:
+    """Arrays de estado de los tracks, indexados por slot (se reutilizan al liberarse)."""
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.mean = np.zeros((0, 8))
+        self.cov = np.zeros((0, 8, 8))
+        self.state = np.zeros(0, dtype=np.int8)
+        self.activated = np.zeros(0, dtype=bool)
+        self.ever_removed = np.zeros(0, dtype=bool)   # el id ya pasó por la lista de removidos
+        self.track_id = np.zeros(0, dtype=np.int64)
+        self.score = np.zeros(0, dtype=np.float32)
+        self.frame_id = np.zeros(0, dtype=np.int64)
+        self.start_frame = np.zeros(0, dtype=np.int64)
+        self.tracklet_len = np.zeros(0, dtype=np.int64)
+        self.used = np.zeros(0, dtype=bool)
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self.capacity
+        self.mean = np.concatenate([self.mean, np.zeros((extra, 8))])
+        self.cov = np.concatenate([self.cov, np.zeros((extra, 8, 8))])
+        for name in ("state", "activated", "ever_removed", "track_id", "score", "frame_id", "start_frame", "tracklet_len", "used"):
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate([arr, np.zeros(extra, dtype=arr.dtype)]))
+        self.capacity = capacity
+
+    def alloc(self, n: int) -> np.ndarray:
+        free = np.flatnonzero(~self.used)
+        if len(free) < n:
+            self._grow(max(self.capacity * 2, self.capacity + n))
+            free = np.flatnonzero(~self.used)
+        slots = free[:n]
+        self.used[slots] = True
+        self.ever_removed[slots] = False
+        return slots
+
+    def retain_only(self, live: np.ndarray) -> None:
+        """Libera todos los slots que no estén en `live`."""
+        self.used[:] = False
+        self.used[live] = True
+
+
+class VectorizedBYTETracker:
+    def __init__(self, args, frame_rate=30):
+        self.args = args
+        self.frame_id = 0
+        self.det_thresh = args.track_thresh + 0.1
+        self.buffer_size = int(frame_rate / 30.0 * args.track_buffer)
+        self.max_time_lost = self.buffer_size
+
+        self.store = TrackStore()
+        self.tracked = np.empty(0, dtype=np.int64)   # slots en orden de la lista tracked_stracks
+        self.lost = np.empty(0, dtype=np.int64)
+
+        ndim = 4
+        self._motion_mat = np.eye(2 * ndim)
+        self._motion_mat[np.arange(ndim), ndim + np.arange(ndim)] = 1.0
+
+    # ----- API -----
+    def update(self, output_results: np.ndarray, img_info, img_size) -> np.ndarray:
+        """
+        :param output_results: (N, 5) [x1, y1, x2, y2, score] o (N, 6) con obj*cls.
+        :return: track_id asignado a cada detección (N,), -1 si no quedó en un track activo.
+        """
+        self.frame_id += 1
+        fid = self.frame_id
+        st = self.store
+
+        output_results = np.asarray(output_results, dtype=np.float32)
+        if output_results.ndim != 2:
+            output_results = output_results.reshape(-1, 5)
+        if output_results.shape[1] == 5:
+            scores = output_results[:, 4]
+        else:
+            scores = output_results[:, 4] * output_results[:, 5]
+        img_h, img_w = img_info[0], img_info[1]
+        scale = min(img_size[0] / float(img_h), img_size[1] / float(img_w))
+        boxes = output_results[:, :4] / scale
+        det_slot = np.full(len(boxes), -1, dtype=np.int64)
+
+        remain = np.flatnonzero(scores > self.args.track_thresh)
+        second = np.flatnonzero((scores > 0.1) & (scores < self.args.track_thresh))
+
+        prev_tracked, prev_lost = self.tracked, self.lost
+        is_act = st.activated[prev_tracked]
+        unconfirmed = prev_tracked[~is_act]
+        pool = self._joint(prev_tracked[is_act], prev_lost)
+        self._predict(pool)
+
+        activated, refind = [], []
+        upd_slots, upd_dets = [], []   # un único update de Kalman en lote para las tres etapas
+
+        # 1) detecciones de alta confianza contra tracked + lost
+        cost = self._fuse_score(1.0 - self._iou(self._tlbr(pool), boxes[remain]), scores[remain])
+        m, u_track, u_det = _linear_assignment(cost, self.args.match_thresh)
+        self._apply_matches(pool[m[:, 0]], remain[m[:, 1]], scores, det_slot, activated, refind, upd_slots, upd_dets)
+
+        # 2) detecciones de baja confianza contra los tracked que quedaron sin asociar
+        r_tracked = pool[u_track]
+        r_tracked = r_tracked[st.state[r_tracked] == TrackState.Tracked]
+        cost = 1.0 - self._iou(self._tlbr(r_tracked), boxes[second])
+        m, u_track, _ = _linear_assignment(cost, 0.5)
+        self._apply_matches(r_tracked[m[:, 0]], second[m[:, 1]], scores, det_slot, activated, refind, upd_slots, upd_dets)
+
+        newly_lost = r_tracked[u_track]
+        newly_lost = newly_lost[st.state[newly_lost] != TrackState.Lost]
+        st.state[newly_lost] = TrackState.Lost
+
+        # 3) tracks sin confirmar (un solo frame) contra las detecciones restantes
+        rest = remain[u_det]
+        cost = self._fuse_score(1.0 - self._iou(self._tlbr(unconfirmed), boxes[rest]), scores[rest])
+        m, u_unconfirmed, u_det = _linear_assignment(cost, 0.7)
+        matched = unconfirmed[m[:, 0]]
+        if len(matched):
+            self._mark_updated(matched, rest[m[:, 1]], scores, det_slot)
+            activated.append(matched)
+            upd_slots.append(matched)
+            upd_dets.append(rest[m[:, 1]])
+        removed = [unconfirmed[u_unconfirmed]]
+        st.state[removed[0]] = TrackState.Removed
+
+        upd_slots = _concat(upd_slots)
+        if len(upd_slots):
+            self._kalman_update(upd_slots, boxes[_concat(upd_dets)])
+
+        # 4) tracks nuevos
+        new_dets = rest[u_det]
+        new_dets = new_dets[scores[new_dets] >= self.det_thresh]
+        if len(new_dets):
+            slots = self._activate(new_dets, boxes, scores)
+            det_slot[new_dets] = slots
+            activated.append(slots)
+
+        # 5) perdidos que superaron el buffer
+        expired = prev_lost[fid - st.frame_id[prev_lost] > self.max_time_lost]
+        st.state[expired] = TrackState.Removed
+        removed.append(expired)
+
+        # 6) recomponer listas (mismo orden y semántica que joint/sub_stracks del original)
+        tracked = prev_tracked[st.state[prev_tracked] == TrackState.Tracked]
+        tracked = self._joint(tracked, _concat(activated))
+        tracked = self._joint(tracked, _concat(refind))
+        lost = prev_lost[~self._member(prev_lost, tracked)]
+        lost = self._joint(lost, newly_lost)
+        lost = lost[~st.ever_removed[lost]]
+        st.ever_removed[_concat(removed)] = True
+        self.tracked, self.lost = self._remove_duplicates(tracked, lost)
+        st.retain_only(np.concatenate([self.tracked, self.lost]))
+
+        # detección -> track_id solo si su track quedó activo en la salida
+        online = self.tracked[st.activated[self.tracked]]
+        ok = det_slot >= 0
+        ok[ok] = self._member(det_slot[ok], online)
+        out = np.full(len(boxes), -1, dtype=np.int64)
+        out[ok] = st.track_id[det_slot[ok]]
+        return out
+
+    def online(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(track_ids, tlbr) de los tracks activos, como output_stracks del original."""
+        slots = self.tracked[self.store.activated[self.tracked]]
+        return self.store.track_id[slots].copy(), self._tlbr(slots)
+
+    # ----- asociación -----
+    def _apply_matches(self, slots, dets, scores, det_slot, activated, refind, upd_slots, upd_dets) -> None:
+        if not len(slots):
+            return
+        st = self.store
+        was_tracked = st.state[slots] == TrackState.Tracked
+        upd_slots.append(slots)
+        upd_dets.append(dets)
+        # update(): tracklet_len += 1 | re_activate(): tracklet_len = 0
+        st.tracklet_len[slots] = np.where(was_tracked, st.tracklet_len[slots] + 1, 0)
+        self._mark_updated(slots, dets, scores, det_slot, bump_len=False)
+        activated.append(slots[was_tracked])
+        refind.append(slots[~was_tracked])
+
+    def _mark_updated(self, slots, dets, scores, det_slot, bump_len: bool = True) -> None:
+        st = self.store
+        if bump_len:
+            st.tracklet_len[slots] += 1
+        st.state[slots] = TrackState.Tracked
+        st.activated[slots] = True
+        st.frame_id[slots] = self.frame_id
+        st.score[slots] = scores[dets]
+        det_slot[dets] = slots
+
+    def _activate(self, dets, boxes, scores) -> np.ndarray:
+        st = self.store
+        n = len(dets)
+        slots = st.alloc(n)
+        # ids del contador global de BaseTrack (compartido con el tracker original)
+        first = BaseTrack._count + 1
+        BaseTrack._count += n
+        st.track_id[slots] = np.arange(first, first + n)
+        xyah = _tlbr_to_xyah(boxes[dets])
+        h = xyah[:, 3]
+        st.mean[slots] = 0.0
+        st.mean[slots, :4] = xyah
+        std = np.stack([2 * _STD_POS * h, 2 * _STD_POS * h, np.full(n, 1e-2), 2 * _STD_POS * h,
+                        10 * _STD_VEL * h, 10 * _STD_VEL * h, np.full(n, 1e-5), 10 * _STD_VEL * h], axis=1)
+        cov = np.zeros((n, 8, 8))
+        cov[:, np.arange(8), np.arange(8)] = np.square(std)
+        st.cov[slots] = cov
+        st.state[slots] = TrackState.Tracked
+        st.activated[slots] = self.frame_id == 1
+        st.frame_id[slots] = self.frame_id
+        st.start_frame[slots] = self.frame_id
+        st.tracklet_len[slots] = 0
+        st.score[slots] = scores[dets]
+        return slots
+
+    def _remove_duplicates(self, tracked: np.ndarray, lost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        if not len(tracked) or not len(lost):
+            return tracked, lost
+        st = self.store
+        p, q = np.nonzero(1.0 - self._iou(self._tlbr(tracked), self._tlbr(lost)) < 0.15)
+        if not len(p):
+            return tracked, lost
+        age_p = st.frame_id[tracked[p]] - st.start_frame[tracked[p]]
+        age_q = st.frame_id[lost[q]] - st.start_frame[lost[q]]
+        keep_a = np.ones(len(tracked), dtype=bool)
+        keep_b = np.ones(len(lost), dtype=bool)
+        keep_a[p[age_p <= age_q]] = False
+        keep_b[q[age_p > age_q]] = False
+        return tracked[keep_a], lost[keep_b]
+
+    def _member(self, values: np.ndarray, of: np.ndarray) -> np.ndarray:
+        """values in of, con una máscara del tamaño del store (sin ordenar como np.isin)."""
+        mask = np.zeros(self.store.capacity, dtype=bool)
+        mask[of] = True
+        return mask[values]
+
+    def _joint(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """a + los slots de b que no estén en a, en orden (un slot = un track_id; b sin repetidos)."""
+        if not len(b):
+            return a
+        return np.concatenate([a, b[~self._member(b, a)]])
+
+    @staticmethod
+    def _fuse_score(cost: np.ndarray, det_scores: np.ndarray) -> np.ndarray:
+        if cost.size == 0:
+            return cost
+        return 1.0 - (1.0 - cost) * det_scores[None, :]
+
+    @staticmethod
+    def _iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """IoU tlbr con la convención de píxeles inclusivos (+1) de cython_bbox."""
+        if len(a) == 0 or len(b) == 0:
+            return np.zeros((len(a), len(b)))
+        a = a.astype(np.float64)
+        b = b.astype(np.float64)
+        iw = np.minimum(a[:, None, 2], b[None, :, 2]) - np.maximum(a[:, None, 0], b[None, :, 0]) + 1
+        ih = np.minimum(a[:, None, 3], b[None, :, 3]) - np.maximum(a[:, None, 1], b[None, :, 1]) + 1
+        inter = np.where((iw > 0) & (ih > 0), iw * ih, 0.0)
+        area_a = (a[:, 2] - a[:, 0] + 1) * (a[:, 3] - a[:, 1] + 1)
+        area_b = (b[:, 2] - b[:, 0] + 1) * (b[:, 3] - b[:, 1] + 1)
+        return inter / (area_a[:, None] + area_b[None, :] - inter)
+
+    # ----- Kalman en lote -----
+    def _tlbr(self, slots: np.ndarray) -> np.ndarray:
+        m = self.store.mean[slots, :4]
+        w = m[:, 2] * m[:, 3]
+        out = np.empty((len(slots), 4))
+        out[:, 0] = m[:, 0] - w / 2
+        out[:, 1] = m[:, 1] - m[:, 3] / 2
+        out[:, 2] = out[:, 0] + w
+        out[:, 3] = out[:, 1] + m[:, 3]
+        return out
+
+    def _predict(self, slots: np.ndarray) -> None:
+        if not len(slots):
+            return
+        st = self.store
+        mean = st.mean[slots]
+        mean[st.state[slots] != TrackState.Tracked, 7] = 0
+        h = mean[:, 3]
+        n = len(slots)
+        std = np.stack([_STD_POS * h, _STD_POS * h, np.full(n, 1e-2), _STD_POS * h,
+                        _STD_VEL * h, _STD_VEL * h, np.full(n, 1e-5), _STD_VEL * h], axis=1)
+        F = self._motion_mat
+        cov = F @ st.cov[slots] @ F.T
+        cov[:, np.arange(8), np.arange(8)] += np.square(std)
+        st.mean[slots] = mean @ F.T
+        st.cov[slots] = cov
+
+    def _kalman_update(self, slots: np.ndarray, tlbr: np.ndarray) -> None:
+        st = self.store
+        mean, cov = st.mean[slots], st.cov[slots]
+        h = mean[:, 3]
+        n = len(slots)
+        std = np.stack([_STD_POS * h, _STD_POS * h, np.full(n, 1e-1), _STD_POS * h], axis=1)
+        S = cov[:, :4, :4].copy()
+        S[:, np.arange(4), np.arange(4)] += np.square(std)
+        # K = P H^T S^-1  ->  K^T = S^-1 (H P)   (P simétrica)
+        gain = np.linalg.solve(S, cov[:, :4, :]).transpose(0, 2, 1)
+        innovation = _tlbr_to_xyah(tlbr) - mean[:, :4]
+        st.mean[slots] = mean + np.einsum("nij,nj->ni", gain, innovation)
+        st.cov[slots] = cov - gain @ S @ gain.transpose(0, 2, 1)
+
+
+def _tlbr_to_xyah(tlbr: np.ndarray) -> np.ndarray:
+    tlbr = np.asarray(tlbr, dtype=np.float64)
+    w = tlbr[:, 2] - tlbr[:, 0]
+    h = tlbr[:, 3] - tlbr[:, 1]
+    return np.stack([tlbr[:, 0] + w / 2, tlbr[:, 1] + h / 2, w / h, h], axis=1)
+
+
+def _linear_assignment(cost: np.ndarray, thresh: float):
+    if cost.size == 0:
+        return np.empty((0, 2), dtype=np.int64), np.arange(cost.shape[0]), np.arange(cost.shape[1])
+    _, x, y = lap.lapjv(cost, extend_cost=True, cost_limit=thresh)
+    rows = np.flatnonzero(x >= 0)
+    matches = np.stack([rows, x[rows]], axis=1).astype(np.int64)
+    return matches, np.flatnonzero(x < 0), np.flatnonzero(y < 0)
+
+
+def _concat(parts) -> np.ndarray:
+    parts = [p for p in parts if len(p)]
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+
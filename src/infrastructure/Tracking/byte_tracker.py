@@ -2,11 +2,12 @@
 from typing import List, Tuple, Optional
 import numpy as np
 import logging
+import threading
 from types import SimpleNamespace
 
 from src.domain.Interfaces.tracker import ITracker
 from src.domain.Models.plate import Plate
-from src.infrastructure.Tracking.byteTracker.byte_tracker import BYTETracker
+from src.infrastructure.Tracking.byteTracker.vectorized_byte_tracker import VectorizedBYTETracker
 from src.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,18 @@ def iou_xyxy(a: np.ndarray, b: np.ndarray) -> np.ndarray:
 
 
 class ByteTrackerAdapter(ITracker):
+    """
+    ITracker sobre ByteTrack.
+
+    Por defecto usa VectorizedBYTETracker (struct-of-arrays, sin torch): cada
+    placa recibe directamente el track_id del track al que se asoció su
+    detección. BYTETRACK_IMPL=legacy usa el BYTETracker original (STrack por
+    detección) con la pasada de IoU placa->track.
+
+    Una instancia por cámara: el servicio la alimenta en orden de captura
+    (FrameSequencer); el lock interno solo protege el estado si se comparte.
+    """
+
     def __init__(self):
         self._args_dict = {
             "track_thresh": settings.bytetrack_thresh,
@@ -53,8 +66,14 @@ class ByteTrackerAdapter(ITracker):
             "mot20": False,
         }
         args_ns = SimpleNamespace(**self._args_dict)
-        self._tracker = BYTETracker(args_ns, frame_rate=settings.bytetrack_fps)
+        self._impl = getattr(settings, "bytetrack_impl", "vectorized").lower()
+        if self._impl == "legacy":
+            from src.infrastructure.Tracking.byteTracker.byte_tracker import BYTETracker
+            self._tracker = BYTETracker(args_ns, frame_rate=settings.bytetrack_fps)
+        else:
+            self._tracker = VectorizedBYTETracker(args_ns, frame_rate=settings.bytetrack_fps)
         self._iou_threshold = getattr(settings, "bytetrack_iou_threshold", 0.1)
+        self._lock = threading.Lock()
 
     def update(self, plates: List[Plate], image_size: Optional[Tuple[int, int]] = None) -> List[Plate]:
         if not plates:
@@ -62,21 +81,24 @@ class ByteTrackerAdapter(ITracker):
         if image_size is None:
             raise RuntimeError("ByteTrackerAdapter.update requiere image_size=(height, width).")
 
-        height, width = image_size
-
-        detections = []
-        for plate in plates:
-            x, y, w, h = plate.bounding_box
-            x_min, y_min, x_max, y_max = xywh_to_xyxy(x, y, w, h)
-            score = float(getattr(plate, "confidence", 1.0))
-            detections.append([x_min, y_min, x_max, y_max, score])
-
-        detections_np = (
-            np.array(detections, dtype=np.float32)
-            if detections
-            else np.empty((0, 5), dtype=np.float32)
+        # (x, y, w, h, score) -> (x1, y1, x2, y2, score) en un solo array
+        detections_np = np.array(
+            [(*p.bounding_box, getattr(p, "confidence", 1.0)) for p in plates],
+            dtype=np.float32,
         )
+        detections_np[:, 2:4] += detections_np[:, 0:2]
 
+        with self._lock:
+            if self._impl != "legacy":
+                track_ids = self._tracker.update(detections_np, image_size, image_size)
+                for plate, track_id in zip(plates, track_ids.tolist()):
+                    plate.track_id = track_id if track_id >= 0 else None
+                return plates
+
+            return self._update_legacy(plates, detections_np, image_size)
+
+    def _update_legacy(self, plates: List[Plate], detections_np: np.ndarray, image_size: Tuple[int, int]) -> List[Plate]:
+        height, width = image_size
         online_tracks = self._tracker.update(detections_np, (height, width), (height, width))
 
         track_boxes, track_ids = [], []
@@ -93,10 +115,7 @@ class ByteTrackerAdapter(ITracker):
             return plates
 
         track_boxes_np = np.vstack(track_boxes).astype(np.float32)
-        plate_boxes_np = np.array(
-            [xywh_to_xyxy(*p.bounding_box) for p in plates],
-            dtype=np.float32,
-        )
+        plate_boxes_np = detections_np[:, :4]
 
         iou_matrix = iou_xyxy(plate_boxes_np, track_boxes_np)
         best_track_index = np.argmax(iou_matrix, axis=1)
@@ -0,0 +1,75 @@
+"""
+Benchmark de throughput del detector con micro-batching (CPU).
+
+Ejecuta detect_batch() con batch sizes 1, 2, 4 y 8 sobre el mismo set de
+frames y reporta frames/seg y latencia media por batch.
+
+Uso:
+    python -m src.test.bench_detector_batch --image ./samples/car.jpg --frames 64
+"""
+import os
+import argparse
+import time
+
+# Forzar CPU antes de importar settings/detectores
+os.environ.setdefault("YOLOV5_DEVICE", "cpu")
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+
+import cv2
+import numpy as np
+
+from src.domain.Models.frame import Frame
+from src.infrastructure.Detector.factory import create_plate_detector
+
+
+def load_frames(image_path: str | None, count: int, width: int, height: int) -> list[Frame]:
+    """Carga una imagen de referencia (o ruido si no hay imagen) y la replica `count` veces."""
+    if image_path:
+        img = cv2.imread(image_path)
+        if img is None:
+            raise FileNotFoundError(f"No se pudo leer la imagen: {image_path}")
+    else:
+        img = np.random.randint(0, 255, (height, width, 3), dtype=np.uint8)
+    return [Frame(data=img.copy(), timestamp=time.time(), source="bench") for _ in range(count)]
+
+
+def run(detector, frames: list[Frame], batch_size: int) -> tuple[float, float]:
+    """Devuelve (frames/seg, latencia media por batch en ms)."""
+    batch_times = []
+    start = time.perf_counter()
+    for i in range(0, len(frames), batch_size):
+        chunk = frames[i:i + batch_size]
+        t0 = time.perf_counter()
+        detector.detect_batch(chunk)
+        batch_times.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+    return len(frames) / elapsed, 1000.0 * sum(batch_times) / len(batch_times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de detect_batch en CPU")
+    parser.add_argument("--image", default=None, help="Imagen de referencia (por defecto ruido aleatorio)")
+    parser.add_argument("--frames", type=int, default=64, help="Frames por corrida")
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--batch-sizes", default="1,2,4,8")
+    parser.add_argument("--warmup", type=int, default=2, help="Batches de calentamiento")
+    args = parser.parse_args()
+
+    batch_sizes = [int(b) for b in args.batch_sizes.split(",") if b.strip()]
+    frames = load_frames(args.image, args.frames, args.width, args.height)
+
+    detector = create_plate_detector()
+    print(f"🧪 Detector: {type(detector).__name__}  frames={len(frames)}  shape={frames[0].data.shape}")
+
+    for _ in range(args.warmup):
+        detector.detect_batch(frames[:max(batch_sizes)])
+
+    print(f"{'batch':>6} {'fps':>10} {'ms/batch':>10} {'ms/frame':>10}")
+    for bs in batch_sizes:
+        fps, ms_batch = run(detector, frames, bs)
+        print(f"{bs:>6} {fps:>10.2f} {ms_batch:>10.1f} {1000.0 / fps:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark de backends OCR (EasyOCR vs CRNN ONNX) en CPU.
+
+Cada backend corre en su propio proceso para medir por separado:
+- tiempo de carga del modelo
+- RSS tras cargar y pico de RSS tras la corrida
+- latencia media por frame para 1..N placas por frame (read_batch)
+
+Uso:
+    python -m src.test.bench_ocr_backends --image ./samples/plate.jpg --backends easyocr,onnx
+"""
+import os
+import argparse
+import multiprocessing as mp
+import resource
+import time
+
+# Forzar CPU antes de importar settings/lectores
+os.environ.setdefault("CUDA_VISIBLE_DEVICES", "")
+# sin caché de OCR: se mide el reconocedor, no el hash
+os.environ["OCR_CACHE_SIZE"] = "0"
+
+import cv2
+import numpy as np
+
+
+def rss_mb() -> float:
+    """RSS actual del proceso (MB) desde /proc."""
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024.0
+    return 0.0
+
+
+def load_crop(image_path: str | None) -> np.ndarray:
+    """Recorte de placa de referencia (o una placa sintética si no hay imagen)."""
+    if image_path:
+        img = cv2.imread(image_path)
+        if img is None:
+            raise FileNotFoundError(f"No se pudo leer la imagen: {image_path}")
+        return img
+    img = np.full((48, 160, 3), 230, dtype=np.uint8)
+    cv2.putText(img, "ABC123", (8, 36), cv2.FONT_HERSHEY_SIMPLEX, 1.1, (20, 20, 20), 3)
+    return img
+
+
+def make_frame(crop: np.ndarray, plates: int):
+    """Frame 1280x720 con `plates` copias del recorte y sus bboxes (x, y, w, h)."""
+    from src.domain.Models.frame import Frame
+    from src.domain.Models.plate import Plate
+
+    h, w = crop.shape[:2]
+    frame = np.full((720, 1280, 3), 90, dtype=np.uint8)
+    boxes = []
+    for i in range(plates):
+        x, y = 40 + (i % 4) * (w + 40), 40 + (i // 4) * (h + 40)
+        frame[y:y + h, x:x + w] = crop
+        boxes.append((x, y, w, h))
+    return Frame(data=frame, timestamp=time.time(), source="bench"), [Plate("", 0.0, b) for b in boxes]
+
+
+def bench_backend(backend: str, image_path: str | None, sizes: list[int], iters: int, out) -> None:
+    os.environ["OCR_BACKEND"] = backend
+    base = rss_mb()
+    t0 = time.perf_counter()
+    from src.infrastructure.OCR.factory import create_ocr_reader
+    reader = create_ocr_reader()
+    load_s = time.perf_counter() - t0
+    loaded = rss_mb()
+
+    crop = load_crop(image_path)
+    rows = []
+    for n in sizes:
+        frame, plates = make_frame(crop, n)
+        reader.read_batch(frame, plates)   # calentamiento
+        start = time.perf_counter()
+        for _ in range(iters):
+            reader.read_batch(frame, [p.__class__("", 0.0, p.bounding_box) for p in plates])
+        ms = 1000.0 * (time.perf_counter() - start) / iters
+        rows.append((n, ms, reader.read_batch(frame, plates)[0].text))
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    out.put((backend, type(reader).__name__, load_s, base, loaded, peak, rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de backends OCR en CPU")
+    parser.add_argument("--image", default=None, help="Recorte de placa (por defecto una placa sintética)")
+    parser.add_argument("--backends", default="easyocr,onnx")
+    parser.add_argument("--plates", default="1,4,8", help="Placas por frame")
+    parser.add_argument("--iters", type=int, default=20)
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.plates.split(",") if s.strip()]
+    ctx = mp.get_context("spawn")
+    for backend in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        q = ctx.Queue()
+        p = ctx.Process(target=bench_backend, args=(backend, args.image, sizes, args.iters, q))
+        p.start()
+        p.join()
+        if q.empty():
+            print(f"❌ {backend}: falló (exit={p.exitcode}); revisa dependencias/modelo")
+            continue
+        backend, name, load_s, base, loaded, peak, rows = q.get()
+        print(f"🧪 {backend} ({name})  carga={load_s:.2f}s  RSS modelo={loaded - base:.0f}MB  RSS pico={peak:.0f}MB")
+        print(f"{'placas':>7} {'ms/frame':>10} {'ms/placa':>10}  texto")
+        for n, ms, text in rows:
+            print(f"{n:>7} {ms:>10.2f} {ms / n:>10.2f}  {text!r}")
+
+
+if __name__ == "__main__":
+    main()
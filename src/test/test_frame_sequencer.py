@@ -0,0 +1,79 @@
+"""
+FrameSequencer (buffer de reordenamiento antes del tracker):
+- los turnos se entregan en orden de captura aunque los frames terminen
+  fuera de orden
+- un frame que no se completa en `timeout` se salta y pierde su turno
+- complete() repetido o de una secuencia ya superada no tiene efecto
+
+Uso:
+    python -m src.test.test_frame_sequencer     (o con pytest)
+"""
+import threading
+import time
+
+from src.application.frame_sequencer import FrameSequencer
+
+
+def _worker(seq: FrameSequencer, sequence: int, order: list, delay: float = 0.0) -> threading.Thread:
+    def run():
+        time.sleep(delay)
+        if seq.wait_turn(sequence):
+            order.append(sequence)
+        seq.complete(sequence)
+    t = threading.Thread(target=run)
+    t.start()
+    return t
+
+
+def test_turns_follow_capture_order_under_out_of_order_completion():
+    seq = FrameSequencer(timeout=5.0)
+    for s in range(1, 6):
+        seq.register(s)
+    order: list = []
+    # los workers llegan en orden inverso; el frame 3 lo descarta el detector (se completa sin turno)
+    threads = [_worker(seq, s, order, delay=0.02 * (5 - s)) for s in (5, 4, 2, 1)]
+    seq.complete(3)
+    for t in threads:
+        t.join(timeout=5.0)
+    assert order == [1, 2, 4, 5]
+    assert seq.pending == 0
+
+
+def test_frame_that_never_completes_is_skipped_after_timeout():
+    seq = FrameSequencer(timeout=0.1)
+    seq.register(1)
+    seq.register(2)
+    t0 = time.monotonic()
+    assert seq.wait_turn(2) is True              # 1 nunca se completa: se salta
+    assert 0.1 <= time.monotonic() - t0 < 1.0
+    assert seq.wait_turn(1) is False             # el frame saltado ya no tiene turno
+    seq.complete(1)                              # su complete tardío es no-op
+    assert seq.pending == 1
+    seq.complete(2)
+    assert seq.pending == 0
+
+
+def test_second_complete_has_no_effect():
+    seq = FrameSequencer(timeout=5.0)
+    for s in (1, 2, 3):
+        seq.register(s)
+    seq.complete(2)
+    seq.complete(2)
+    assert seq.pending == 3                      # 2 espera detrás de 1
+    seq.complete(1)
+    assert seq.pending == 1                      # 1 y 2 salen; 3 sigue pendiente
+    seq.complete(1)
+    seq.complete(2)
+    assert seq.pending == 1
+    assert seq.wait_turn(3, timeout=0.1) is True
+    seq.complete(3)
+    seq.complete(3)
+    seq.complete(99)                             # no registrada
+    assert seq.pending == 0
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
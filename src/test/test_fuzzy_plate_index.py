@@ -0,0 +1,66 @@
+"""
+FuzzyPlateIndex (dedup aproximado por vecindario de borrado):
+- confusiones del OCR: "ABC123" y "A8C123" quedan a distancia 0
+- con k=1 coinciden una inserción, un borrado o una sustitución; k=2 no
+- expiración por TTL deslizante
+- la compactación del heap (muchas renovaciones) conserva las llaves vivas y
+  sus vencimientos
+
+Uso:
+    python -m src.test.test_fuzzy_plate_index     (o con pytest)
+"""
+from src.domain.Services.fuzzy_plate_index import FuzzyPlateIndex
+
+
+def test_ocr_confusions_are_distance_zero():
+    idx = FuzzyPlateIndex(ttl=10.0, max_distance=0)
+    key = idx.add("ABC123", now=0.0)
+    assert key == idx.canonical("A8C123") == "A8C123"
+    assert idx.match("A8C123", now=1.0) == key
+    assert idx.match("ABCI23", now=1.0) == key            # I -> 1
+    assert idx.match("ABC124", now=1.0) is None           # k=0: sin ediciones
+
+
+def test_single_insertion_deletion_substitution_match_with_k1():
+    idx = FuzzyPlateIndex(ttl=10.0, max_distance=1)
+    key = idx.add("ABC123", now=0.0)
+    for text in ("ABC1234", "XABC123", "ABC12", "BC123", "ABC124", "AXC123"):
+        assert idx.match(text, now=1.0) == key, text
+    for text in ("ABC12345", "AB12", "XYC124", "ABC1"):
+        assert idx.match(text, now=1.0) is None, text
+
+
+def test_entries_expire_after_ttl_and_match_renews():
+    idx = FuzzyPlateIndex(ttl=2.0)
+    idx.add("ABC123", now=0.0)
+    assert idx.match("ABC124", now=1.5) is not None       # renueva hasta 3.5
+    assert idx.match("ABC123", now=3.0) is not None       # renueva hasta 5.0
+    assert idx.match("ABC123", now=5.0) is None           # vencida
+    assert len(idx) == 0
+    assert idx._buckets == {} and idx._expires == {}
+
+
+def test_heap_compaction_keeps_live_keys():
+    idx = FuzzyPlateIndex(ttl=5.0)
+    idx.add("XYW789", now=0.0)                            # vence en 5.0 (sin renovar)
+    idx.add("KMN456", now=0.0)
+    now = 0.0
+    for _ in range(500):                                  # placa a la vista: una renovación por frame
+        now += 0.01
+        assert idx.match("KMN456", now=now) is not None
+    assert len(idx._heap) <= 4 * len(idx) + 64 + 1         # compactado al menos una vez
+    assert set(k for _, k in idx._heap) == {"XYW789", "KMN456"}
+    assert idx.match("XYW789", now=4.9) == "XYW789"       # sigue viva; renueva hasta 9.9
+    idx.purge(now=9.5)
+    assert len(idx) == 2                                  # KMN456 renovada hasta 10.0
+    assert idx.match("XYW789", now=9.95) is None          # vencida (9.9) con el heap compactado
+    assert idx.match("KMN456", now=9.95) == "KMN456"
+    idx.purge(now=20.0)
+    assert len(idx) == 0 and idx._buckets == {}
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
@@ -0,0 +1,54 @@
+"""
+Celdas por thread de src.core.metrics con threads de vida corta (como los
+threading.Timer de RetryPublisher / DeferredPublisher):
+- no se pierde ningún incremento ni observación al terminar los threads
+- las celdas de threads terminados se pliegan: su número no crece con los
+  threads creados
+
+Uso:
+    python -m src.test.test_metrics     (o con pytest)
+"""
+import threading
+
+from src.core.metrics import Counter, Histogram
+
+
+def _burst(fn, threads: int = 200) -> None:
+    for _ in range(threads // 20):
+        batch = [threading.Thread(target=fn) for _ in range(20)]
+        for t in batch:
+            t.start()
+        for t in batch:
+            t.join()
+
+
+def test_counter_keeps_totals_and_retires_cells():
+    counter = Counter()
+    _burst(lambda: [counter.inc() for _ in range(10)])
+    assert counter.value == 2000
+    assert len(counter._shards) <= 1
+
+
+def test_histogram_keeps_totals_and_retires_cells():
+    hist = Histogram()
+    _burst(lambda: hist.observe(0.005))
+    count, total, buckets = hist.snapshot()
+    assert count == 200 and sum(buckets) == 200
+    assert abs(total - 1.0) < 1e-6
+    assert len(hist._shards) <= 1
+
+
+def test_live_thread_cell_survives_sweep():
+    counter = Counter()
+    counter.inc()                     # celda del thread principal (vivo)
+    _burst(counter.inc, threads=40)
+    counter.inc()
+    assert counter.value == 42
+    assert len(counter._shards) == 1
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
@@ -0,0 +1,71 @@
+"""
+Propiedades de OCRResultCache sobre una placa sintética:
+- estabilidad: el mismo vehículo con jitter de ±2 px en el bbox (y ruido del
+  sensor) reutiliza la lectura
+- selectividad: una placa con un solo carácter distinto en la misma posición
+  no la reutiliza
+
+Uso:
+    python -m src.test.test_ocr_result_cache     (o con pytest)
+"""
+import cv2
+import numpy as np
+
+from src.infrastructure.OCR.ocr_result_cache import OCRResultCache
+
+BOX = (98, 78, 166, 44)   # (x, y, w, h) de la placa en la escena
+
+
+def scene(text: str, seed: int = 0, noise: float = 6.0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    img = np.full((200, 400), 90, np.uint8)
+    cv2.rectangle(img, (100, 80), (260, 120), 230, -1)
+    cv2.putText(img, text, (106, 113), cv2.FONT_HERSHEY_SIMPLEX, 1.1, 20, 3)
+    return np.clip(img.astype(np.float32) + rng.normal(0, noise, img.shape), 0, 255).astype(np.uint8)
+
+
+def crop(img: np.ndarray, dx: int = 0, dy: int = 0, dw: int = 0, dh: int = 0):
+    x, y, w, h = BOX[0] + dx, BOX[1] + dy, BOX[2] + dw, BOX[3] + dh
+    return (x, y, w, h), img[y:y + h, x:x + w]
+
+
+def cache_with(text: str) -> OCRResultCache:
+    cache = OCRResultCache(max_entries=16, ttl=60.0)
+    box, grey = crop(scene(text))
+    cache.put("cam", box, grey, text, 0.9)
+    return cache
+
+
+def test_hit_under_bbox_jitter():
+    cache = cache_with("ABC123")
+    seed = 1
+    for dx in (-2, -1, 0, 1, 2):
+        for dy in (-2, -1, 0, 1, 2):
+            for dw, dh in ((0, 0), (-2, -1), (2, 1)):
+                box, grey = crop(scene("ABC123", seed=seed), dx, dy, dw, dh)
+                seed += 1
+                assert cache.get("cam", box, grey) == ("ABC123", 0.9), (dx, dy, dw, dh)
+
+
+def test_miss_on_single_character_change():
+    cache = cache_with("ABC123")
+    for text in ("ABC124", "ABC125", "ABC126", "ABC127", "ABC128", "ABC129", "ABC120",
+                 "ABC12X", "ABC12B", "ABD123", "XBC123", "A8C123"):
+        for dx in (-1, 0, 1):
+            box, grey = crop(scene(text, seed=7), dx, 0)
+            assert cache.get("cam", box, grey) is None, (text, dx)
+
+
+def test_miss_on_other_camera_or_position():
+    cache = cache_with("ABC123")
+    box, grey = crop(scene("ABC123", seed=3))
+    assert cache.get("other", box, grey) is None
+    x, y, w, h = box
+    assert cache.get("cam", (x + 120, y, w, h), grey) is None
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
@@ -0,0 +1,91 @@
+"""
+RedisDeduplicator contra un Redis falso en proceso (fakeredis con Lua):
+- primera lectura nueva, repetición duplicada
+- una repetición renueva el TTL (ventana deslizante)
+- un acierto de la near-cache no ejecuta el script
+- si el script falla se degrada al dedup local
+
+Requiere: pip install "fakeredis[lua]"
+
+Uso:
+    python -m src.test.test_redis_deduplicator     (o con pytest)
+"""
+import time
+
+import fakeredis
+
+from src.infrastructure.Deduplication.redis_deduplicator import RedisDeduplicator
+from src.infrastructure.Normalizer.plate_normalizer import PlateNormalizer
+
+
+class CountingClient:
+    """Envuelve un cliente fakeredis y cuenta las ejecuciones del script (o las hace fallar)."""
+
+    def __init__(self, fail: bool = False):
+        self.redis = fakeredis.FakeRedis()
+        self.calls = 0
+        self.fail = fail
+
+    def register_script(self, source):
+        script = self.redis.register_script(source)
+
+        def run(keys, args):
+            self.calls += 1
+            if self.fail:
+                raise ConnectionError("redis caído")
+            return script(keys=keys, args=args)
+        return run
+
+
+def dedup(client, ttl: float = 10.0, near_cache_ttl: float = 0.0) -> RedisDeduplicator:
+    return RedisDeduplicator(PlateNormalizer(min_len=5, max_len=7), ttl=ttl, client=client,
+                             key_prefix="test", near_cache_ttl=near_cache_ttl, retry_interval=60.0)
+
+
+def test_new_then_duplicate():
+    client = CountingClient()
+    d = dedup(client)
+    assert d.is_duplicate(1, "ABC-123", "cam") is False
+    assert d.is_duplicate(2, "abc123", "cam") is True          # mismo texto normalizado, otro track
+    assert d.is_duplicate(3, "ABC123", "other") is False       # otra cámara, otra llave
+    assert client.redis.exists("test:cam:ABC123")
+    assert client.calls == 3
+
+
+def test_repeat_renews_ttl():
+    client = CountingClient()
+    d = dedup(client, ttl=0.4)
+    assert d.is_duplicate(1, "ABC123", "cam") is False
+    time.sleep(0.25)
+    assert 0 < client.redis.pttl("test:cam:ABC123") <= 150
+    assert d.is_duplicate(1, "ABC123", "cam") is True
+    assert client.redis.pttl("test:cam:ABC123") > 300           # la repetición reinició la ventana
+    time.sleep(0.25)                                            # 0.5s desde la primera: sigue viva
+    assert d.is_duplicate(1, "ABC123", "cam") is True
+    time.sleep(0.5)
+    assert d.is_duplicate(1, "ABC123", "cam") is False          # expiró sin repeticiones
+
+
+def test_near_cache_hit_skips_script():
+    client = CountingClient()
+    d = dedup(client, ttl=10.0, near_cache_ttl=1.0)
+    assert d.is_duplicate(1, "ABC123", "cam") is False
+    assert d.is_duplicate(1, "ABC123", "cam") is True
+    assert d.is_duplicate(1, "ABC123", "cam") is True
+    assert client.calls == 1
+
+
+def test_falls_back_to_local_dedup_when_script_fails():
+    client = CountingClient(fail=True)
+    d = dedup(client)
+    assert d.is_duplicate(1, "ABC123", "cam") is False
+    assert d.is_duplicate(1, "ABC123", "cam") is True           # lo recuerda el dedup local
+    assert d.is_duplicate(1, "XYZ789", "cam") is False
+    assert client.calls == 1                                    # Redis no se reintenta hasta retry_interval
+
+
+if __name__ == "__main__":
+    for name, fn in list(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"✅ {name}")
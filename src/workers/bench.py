@@ -0,0 +1,207 @@
+# bench.py (worker) - benchmark offline reproducible
+"""
+Reproduce un video o un directorio de imágenes a través de PlateRecognitionService
+lo más rápido posible (sin pacing ni descarte de frames) y reporta:
+
+- latencia p50/p95/p99 por etapa (detect, track, ocr, norm, dedup, total)
+- frames/seg de punta a punta
+- llamadas OCR por frame (placas enviadas al reconocedor / frames)
+- eventos emitidos (publisher en memoria, sin Kafka)
+
+El resultado se escribe en JSON para comparar configuraciones entre corridas.
+
+Uso:
+    python -m src.workers.bench --source ./samples/entrada.mp4 --output bench.json
+    python -m src.workers.bench --source ./samples/entrada.mp4 --dummy-detector --dummy-ocr   # solo overhead del pipeline
+    DETECTOR_BATCH_SIZE=4 python -m src.workers.bench --source ./samples/frames/ --label batch4
+"""
+import warnings
+warnings.filterwarnings("ignore", category=FutureWarning, module="yolov5")
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import platform
+
+# CPU por defecto: el benchmark está pensado para máquinas sin GPU
+os.environ.setdefault("YOLOV5_DEVICE", "cpu")
+
+from src.core.config import settings
+from src.infrastructure.Camera.file_camera_stream import FileCameraStream
+from src.infrastructure.Detector.factory import create_plate_detector
+from src.infrastructure.Tracking.byte_tracker import ByteTrackerAdapter
+from src.infrastructure.Messaging.in_memory_publisher import InMemoryPublisher
+from src.infrastructure.Normalizer.plate_normalizer import PlateNormalizer
+from src.domain.Services.deduplicator_service import DeduplicatorService
+from src.domain.Services.ocr_scheduler_service import OCRSchedulerService
+from src.application.plate_recognition_service import (
+    PlateRecognitionService, STAGE_LATENCY, FRAMES_PROCESSED, OCR_READS,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+CAMERA_ID = "bench"
+STAGES = ("detect", "track", "ocr", "norm", "dedup", "total")
+
+
+def build_service(stream: FileCameraStream, detector, ocr, publisher: InMemoryPublisher, workers: int) -> PlateRecognitionService:
+    normalizer = PlateNormalizer(min_len=settings.plate_min_length)
+    service = PlateRecognitionService(
+        camera_stream=stream,
+        detector=detector,
+        ocr_reader=ocr,
+        publisher=publisher,
+        tracker=ByteTrackerAdapter(),
+        deduplicator=DeduplicatorService(normalizer=normalizer, ttl=settings.dedup_ttl),
+        normalizer=normalizer,
+        debug_show=False,
+        loop_delay=0.0,
+        ocr_scheduler=OCRSchedulerService(),
+    )
+    # sin pacing ni descarte: todos los frames del archivo pasan por el pipeline
+    service.target_dt = 0.0
+    service.sampler = None
+    service.drop_frames = False
+    service.processing_workers = max(1, workers)
+    return service
+
+
+def warmup(detector, ocr, path: str, frames: int) -> None:
+    """Carga perezosa de modelos / primeras inferencias fuera de la medición."""
+    if frames <= 0:
+        return
+    stream = FileCameraStream(path, max_frames=frames)
+    stream.connect()
+    try:
+        while True:
+            frame = stream.read_frame()
+            if frame is None:
+                break
+            plates = detector.detect_batch([frame])[0]
+            if plates:
+                ocr.read_batch(frame, plates)
+    finally:
+        stream.disconnect()
+
+
+def run(service: PlateRecognitionService, stream: FileCameraStream, timeout: float) -> float:
+    """Ejecuta hasta agotar la fuente y vaciar las colas. Devuelve el tiempo de pared (s)."""
+    start = time.perf_counter()
+    service.start_background(spawn_workers=True)
+    deadline = time.monotonic() + timeout if timeout > 0 else None
+    try:
+        while not stream.exhausted:
+            if deadline is not None and time.monotonic() > deadline:
+                logger.warning("Timeout del benchmark (%.0fs); se reportan resultados parciales", timeout)
+                break
+            time.sleep(0.05)
+        service.capture_queue.join()
+        service.publish_queue.join()
+        return time.perf_counter() - start
+    finally:
+        service.stop()
+
+
+def collect(args, stream: FileCameraStream, publisher: InMemoryPublisher, wall: float) -> dict:
+    frames = FRAMES_PROCESSED.labels(camera=CAMERA_ID).value
+    ocr_reads = OCR_READS.labels(camera=CAMERA_ID).value
+    stages = {}
+    for stage in STAGES:
+        hist = STAGE_LATENCY.labels(camera=CAMERA_ID, stage=stage)
+        count, total, _ = hist.snapshot()
+        p50, p95, p99 = hist.quantiles((0.5, 0.95, 0.99))
+        stages[stage] = {
+            "count": count,
+            "mean_ms": round(1000.0 * total / count, 3) if count else None,
+            "p50_ms": _ms(p50),
+            "p95_ms": _ms(p95),
+            "p99_ms": _ms(p99),
+        }
+
+    return {
+        "label": args.label,
+        "source": os.path.abspath(args.source),
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "frames_read": stream.frames_read,
+        "frames_processed": frames,
+        "wall_seconds": round(wall, 3),
+        "fps": round(frames / wall, 2) if wall > 0 else None,
+        "ocr_calls_per_frame": round(ocr_reads / frames, 3) if frames else None,
+        "events": publisher.count,
+        "stages": stages,
+        "config": {
+            "yolo_version": settings.yolo_version,
+            "detector_batch_size": settings.detector_batch_size,
+            "detector_batch_timeout_ms": settings.detector_batch_timeout_ms,
+            "processing_workers": args.workers,
+            "ocr_interval": settings.ocr_interval,
+            "ocr_track_settle_confidence": settings.ocr_track_settle_confidence,
+            "inference_backend": settings.inference_backend,
+            "motion_gate": args.motion_gate,
+        },
+        "host": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+    }
+
+
+def _ms(seconds: float):
+    return None if seconds != seconds else round(1000.0 * seconds, 3)   # nan -> None
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark offline del pipeline ANPR sobre un video o directorio de imágenes")
+    parser.add_argument("--source", required=True, help="Archivo de video o directorio de imágenes")
+    parser.add_argument("--output", default=None, help="Ruta del JSON de resultados (por defecto solo stdout)")
+    parser.add_argument("--label", default="default", help="Etiqueta de la corrida (para comparar configuraciones)")
+    parser.add_argument("--max-frames", type=int, default=None, help="Máx. frames a procesar")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1), help="Processing workers del servicio")
+    parser.add_argument("--warmup", type=int, default=3, help="Frames de calentamiento fuera de la medición")
+    parser.add_argument("--timeout", type=float, default=0.0, help="Tiempo máx. de la corrida en segundos (0 = sin límite)")
+    parser.add_argument("--dummy-detector", action="store_true", help="Usar DummyPlateDetector (sin modelo YOLO)")
+    parser.add_argument("--dummy-ocr", action="store_true", help="Usar DummyOCRReader (sin EasyOCR)")
+    parser.add_argument("--motion-gate", action="store_true", help="Anteponer MotionGatedDetector (ROI = CAMERA_ROI)")
+    args = parser.parse_args(argv)
+
+    if args.dummy_detector:
+        from src.infrastructure.Detector.dummy_plate_detector import DummyPlateDetector
+        detector = DummyPlateDetector()
+    else:
+        detector = create_plate_detector()
+    if args.motion_gate:
+        from src.infrastructure.Detector.motion_gated_detector import MotionGatedDetector
+        detector = MotionGatedDetector(detector, rois={CAMERA_ID: settings.camera_roi})
+    if args.dummy_ocr:
+        from src.infrastructure.OCR.dummy_ocr_reader import DummyOCRReader
+        ocr = DummyOCRReader()
+    else:
+        from src.infrastructure.OCR.factory import create_ocr_reader
+        ocr = create_ocr_reader()
+
+    warmup(detector, ocr, args.source, args.warmup)
+
+    stream = FileCameraStream(args.source, max_frames=args.max_frames)
+    stream.camera_id = CAMERA_ID
+    publisher = InMemoryPublisher(keep=False)
+    service = build_service(stream, detector, ocr, publisher, args.workers)
+
+    wall = run(service, stream, args.timeout)
+    report = collect(args, stream, publisher, wall)
+
+    text = json.dumps(report, indent=2, ensure_ascii=False)
+    print(text)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            fh.write(text + "\n")
+        logger.info("Resultados escritos en %s", args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
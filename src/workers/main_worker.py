@@ -2,38 +2,40 @@
 import warnings
 warnings.filterwarnings("ignore", category=FutureWarning, module="yolov5")
 
+import time
 import logging
 from src.core.config import settings
 from src.domain.Models.camera import Camera
-from src.infrastructure.Camera.camera_factory import create_camera_stream
+from src.infrastructure.Camera.camera_factory import create_camera_stream, load_cameras
 from src.infrastructure.Detector.factory import create_plate_detector
-from src.infrastructure.OCR.EasyOCR_OCRReader import EasyOCR_OCRReader
+from src.infrastructure.OCR.factory import create_ocr_reader
+from src.infrastructure.Detector.motion_gated_detector import MotionGatedDetector
 from src.infrastructure.Tracking.byte_tracker import ByteTrackerAdapter
 from src.infrastructure.Messaging.retry_publisher import RetryPublisher
 from src.infrastructure.Messaging.kafka_publisher import KafkaPublisher
-from src.domain.Services.deduplicator_service import DeduplicatorService
+from src.infrastructure.Messaging.deferred_publisher import DeferredPublisher
+from src.infrastructure.Messaging.event_spool import EventSpool, SpoolDrainer
+from src.infrastructure.Deduplication.factory import create_deduplicator
+from src.domain.Services.ocr_scheduler_service import OCRSchedulerService
 from src.infrastructure.Normalizer.plate_normalizer import PlateNormalizer
 from src.application.plate_recognition_service import PlateRecognitionService
+from src.application.multi_camera_supervisor import MultiCameraSupervisor
+from src.application.startup_orchestrator import StartupOrchestrator, warm_up_detector, warm_up_ocr
+from src.api.server import start_api_server
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
 logger = logging.getLogger(__name__)
 
-def main():
-    cam = Camera(camera_id="1", url=settings.camera_url, name="ENTRADA")
+def build_camera_service(cam: Camera, detector, ocr, publisher, spool=None) -> PlateRecognitionService:
+    """Servicio de una cámara: stream, tracker, dedup y planificador OCR propios; modelos compartidos."""
     camera_stream = create_camera_stream(cam)
-
-    detector = create_plate_detector()
-    ocr = EasyOCR_OCRReader()
     tracker = ByteTrackerAdapter()
 
-    # Publisher: Kafka + Retry
-    kafka_raw = KafkaPublisher(delivery_timeout=5.0)   # usa settings.kafka_broker y settings.kafka_topic
-    publisher = RetryPublisher(kafka_raw, attempts=3, base_delay=1.0)
-
     normalizer = PlateNormalizer(min_len=settings.plate_min_length)
-    deduplicator = DeduplicatorService(normalizer=normalizer, ttl=settings.dedup_ttl)
+    deduplicator = create_deduplicator(normalizer)
+    ocr_scheduler = OCRSchedulerService()
 
-    service = PlateRecognitionService(
+    return PlateRecognitionService(
         camera_stream=camera_stream,
         detector=detector,
         ocr_reader=ocr,
@@ -43,20 +45,110 @@ def main():
         normalizer=normalizer,
         debug_show=settings.debug_show,
         loop_delay=settings.loop_delay,
+        ocr_scheduler=ocr_scheduler,
+        spool=spool,
     )
 
+def _start_inference_pool():
+    """Lanza el pool y espera a que sus procesos carguen los modelos; si no lo logran, el componente queda FAILED."""
+    from src.infrastructure.Inference.process_pool import InferenceProcessPool
+    pool = InferenceProcessPool()
+    if not pool.wait_ready(timeout=pool.timeout):
+        state = pool.status()
+        pool.close(timeout=1.0)
+        raise RuntimeError(
+            f"Pool de inferencia no quedó listo (timeout={pool.timeout:.0f}s, fallido={state['failed']}, "
+            f"listas={state['ready']}, último error={state['last_error']})"
+        )
+    return pool
+
+def _warm_up_pool(pool) -> None:
+    """Calienta detector y OCR a través del pool (réplicas ya listas)."""
+    warm_up_detector(pool.detector())
+    warm_up_ocr(pool.ocr_reader())
+
+def main():
+    cameras = load_cameras()
+
+    # /metrics y /health del propio worker (las métricas viven en este proceso)
+    if settings.worker_api_enabled:
+        start_api_server()
+
+    # Arranque concurrente: modelos (con warm-up) y conexión a Kafka en paralelo
+    orchestrator = StartupOrchestrator()
+    use_pool = settings.inference_backend.lower() == "process"
+    if use_pool:
+        # réplicas de detector/OCR en procesos worker; frames por memoria compartida
+        orchestrator.add("inference_pool", _start_inference_pool, warmup=_warm_up_pool)
+    else:
+        orchestrator.add("detector", create_plate_detector, warmup=warm_up_detector)
+        orchestrator.add("ocr", create_ocr_reader, warmup=warm_up_ocr)
+    # usa settings.kafka_broker y settings.kafka_topic; no bloquea la captura mientras conecta
+    # (no requerido para /ready: con Kafka caído los eventos van al spool)
+    orchestrator.add("kafka", lambda: KafkaPublisher(delivery_timeout=5.0), required=False)
+    orchestrator.start()
+
+    # Publisher: Kafka (diferido hasta que conecte) + Retry
+    publisher = RetryPublisher(DeferredPublisher(orchestrator.future("kafka")), attempts=3, base_delay=1.0)
+
+    # Spool durable compartido: absorbe eventos con Kafka caído y los re-publica en orden
+    spool = None
+    drainers = []
+    if settings.spool_enabled:
+        spool = EventSpool()
+
+        def _start_drainer(kafka_raw) -> None:
+            drainer = SpoolDrainer(spool, kafka_raw)
+            drainer.start()
+            drainers.append(drainer)
+
+        orchestrator.when_ready("kafka", _start_drainer)
+
+    # Modelos compartidos por todas las cámaras del proceso (la captura solo espera por ellos)
+    inference_pool = None
+    try:
+        if use_pool:
+            inference_pool = orchestrator.get("inference_pool")
+            detector, ocr = inference_pool.detector(), inference_pool.ocr_reader()
+        else:
+            detector, ocr = orchestrator.wait("detector", "ocr")
+    except RuntimeError:
+        logger.exception("No se pudieron cargar los modelos")
+        orchestrator.shutdown()
+        raise
+    logger.info("Modelos listos en %.2fs; estado de arranque: %s", time.monotonic() - orchestrator.started_at, orchestrator.states())
+
+    # Gate de movimiento/ROI delante del detector (también ahorra IPC con INFERENCE_BACKEND=process)
+    if settings.motion_gate_enabled:
+        detector = MotionGatedDetector(detector, rois={cam.camera_id: cam.roi for cam in cameras})
+
+    services = [build_camera_service(cam, detector, ocr, publisher, spool) for cam in cameras]
+    if len(services) == 1:
+        runner = services[0]
+    else:
+        runner = MultiCameraSupervisor(services, detector=detector)
+
     try:
-        service.start()
+        runner.start()
     except KeyboardInterrupt:
         logger.info("Deteniendo por KeyboardInterrupt")
-        service.stop()
+        runner.stop()
     except Exception:
         logger.exception("Error en worker")
     finally:
-        try:
-            kafka_raw.close()
-        except Exception:
-            logger.exception("Error cerrando Kafka producer")
+        for drainer in drainers:
+            drainer.stop()
+        if spool is not None:
+            spool.close()   # escribe lo que quedó encolado (idempotente si el drainer ya lo cerró)
+        kafka = orchestrator.future("kafka")
+        if kafka.done() and kafka.exception() is None:
+            try:
+                kafka.result().close()
+            except Exception:
+                logger.exception("Error cerrando Kafka producer")
+        orchestrator.shutdown()
+        if inference_pool is not None:
+            inference_pool.close()
 
 if __name__ == "__main__":
     main()